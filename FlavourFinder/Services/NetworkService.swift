@@ -117,20 +117,38 @@ class NetworkService {
         try validate(response)
     }
     
-    // Get Saved Recipes
+    // Get Saved Recipes (Follows Page Cursors Until Every Saved Recipe is Loaded)
     func getSavedRecipes() async throws -> [Recipe] {
-        guard let url = URL(string: "\(baseURL)/recipes/saved") else {
-            throw NetworkError.invalidURL
-        }
-        
-        var request = try authenticatedRequest(url: url)
-        request.httpMethod = "GET"
-        
-        let (data, response) = try await URLSession.shared.data(for: request)
-        try validate(response)
-        
-        let result = try JSONDecoder().decode(SavedRecipesResponse.self, from: data)
-        return result.recipes.compactMap { $0.recipeData }
+        var recipes: [Recipe] = []
+        var cursor: String? = nil
+        
+        repeat {
+            guard var components = URLComponents(string: "\(baseURL)/recipes/saved") else {
+                throw NetworkError.invalidURL
+            }
+            components.queryItems = [
+                URLQueryItem(name: "view", value: "full"),
+                URLQueryItem(name: "limit", value: "100")
+            ]
+            if let cursor = cursor {
+                components.queryItems?.append(URLQueryItem(name: "cursor", value: cursor))
+            }
+            guard let url = components.url else {
+                throw NetworkError.invalidURL
+            }
+            
+            var request = try authenticatedRequest(url: url)
+            request.httpMethod = "GET"
+            
+            let (data, response) = try await URLSession.shared.data(for: request)
+            try validate(response)
+            
+            let page = try JSONDecoder().decode(SavedRecipesResponse.self, from: data)
+            recipes.append(contentsOf: page.recipes.compactMap { $0.recipeData })
+            cursor = page.nextCursor
+        } while cursor != nil
+        
+        return recipes
     }
     
     // Get User Preferences
@@ -167,7 +185,14 @@ class NetworkService {
 
 // Saved Recipe Response Model
 struct SavedRecipesResponse: Codable {
+    
     let recipes: [SavedRecipeItem]
+    let nextCursor: String?
+    
+    enum CodingKeys: String, CodingKey {
+        case recipes
+        case nextCursor = "next_cursor"
+    }
 }
 
 // Saved Recipe Item
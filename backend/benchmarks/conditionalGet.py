@@ -0,0 +1,62 @@
+# Run from backend/: python -m benchmarks.conditionalGet
+# Imports
+import os
+import time
+import jwt
+
+# Stub Upstreams (Database Round Trips Keep their Simulated Latency)
+os.environ.setdefault("UPSTREAM_MODE", "stub")
+os.environ.setdefault("SUPABASE_JWT_SECRET", "benchmark-secret")
+os.environ.setdefault("STUB_LLM_LATENCY", "fixed:0.001")
+os.environ.setdefault("LOG_LEVEL", "WARNING")
+
+from fastapi.testclient import TestClient
+from main import app
+
+# Settings
+HISTORY_SIZE = int(os.getenv("BENCH_HISTORY", "50"))
+POLLS = int(os.getenv("BENCH_POLLS", "200"))
+
+# Endpoints the App Refreshes on Every Screen
+ENDPOINTS = ["/recipes/history?view=full", "/recipes/saved?view=full", "/preferences"]
+
+# Mean Milliseconds and Bytes on the Wire per Poll
+def poll(client: TestClient, path: str, headers: dict) -> tuple:
+    wire = 0
+    start = time.perf_counter()
+    for _ in range(POLLS):
+        response = client.get(path, headers=headers)
+        wire += int(response.headers.get("content-length") or 0)
+    return (time.perf_counter() - start) / POLLS * 1000, wire / POLLS
+
+def main():
+
+    token = jwt.encode({"sub": "bench", "aud": "authenticated", "exp": int(time.time()) + 3600}, "benchmark-secret")
+    auth = {"Authorization": f"Bearer {token}"}
+
+    with TestClient(app) as client:
+
+        # Fill History and Saved with Full Recipes
+        batch = client.post("/recipes/generate/batch", json={"preferences": {}, "count": 5}, headers=auth)
+        for _ in range(HISTORY_SIZE // 5 - 1):
+            client.post("/recipes/generate/batch", json={"preferences": {}, "count": 5}, headers=auth)
+        client.post("/recipes/save/bulk", json={"recipes": batch.json()["recipes"]}, headers=auth)
+
+        print(f"{'endpoint':>28} {'mode':>10} {'ms/poll':>8} {'bytes/poll':>11}")
+        for path in ENDPOINTS:
+            etag = client.get(path, headers=auth).headers["etag"]
+            modes = {
+                "plain": {**auth, "Accept-Encoding": "identity"},
+                "gzip": {**auth, "Accept-Encoding": "gzip"},
+                "304": {**auth, "Accept-Encoding": "gzip", "If-None-Match": etag},
+            }
+            for mode, headers in modes.items():
+                ms, wire = poll(client, path, headers)
+                print(f"{path:>28} {mode:>10} {ms:>8.2f} {wire:>11.0f}")
+
+        stats = client.get("/stats").json()
+        print(f"versions: {stats['resource_versions']}")
+        print(f"compression: {stats['compression']}")
+
+if __name__ == "__main__":
+    main()
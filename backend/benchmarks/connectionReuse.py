@@ -0,0 +1,63 @@
+# Run from backend/: python -m benchmarks.connectionReuse
+# Imports
+import time
+import asyncio
+import statistics
+import httpx
+import uvicorn
+from services.httpClient import create_client, metrics
+
+# Settings
+HOST = "127.0.0.1"
+PORT = 8765
+REQUESTS = 500
+
+# Minimal Stub Upstream Returning an Unsplash-Shaped Payload
+async def stub_app(scope, receive, send):
+    if scope["type"] != "http":
+        return
+    body = b'{"results": [{"urls": {"regular": "https://example.com/a.jpg"}}]}'
+    await send({"type": "http.response.start", "status": 200, "headers": [(b"content-type", b"application/json")]})
+    await send({"type": "http.response.body", "body": body})
+
+# Time Requests Made with a Fresh Client Each Time
+async def fresh_clients(url: str) -> list:
+    latencies = []
+    for _ in range(REQUESTS):
+        start = time.perf_counter()
+        async with httpx.AsyncClient() as client:
+            await client.get(url)
+        latencies.append((time.perf_counter() - start) * 1000)
+    return latencies
+
+# Time Requests Made with the Shared Pooled Client
+async def pooled_client(url: str) -> list:
+    latencies = []
+    async with create_client("benchmark") as client:
+        for _ in range(REQUESTS):
+            start = time.perf_counter()
+            await client.get(url)
+            latencies.append((time.perf_counter() - start) * 1000)
+    return latencies
+
+# Print Latency Summary
+def summarize(label: str, latencies: list):
+    ordered = sorted(latencies)
+    print(f"{label}: mean={statistics.mean(ordered):.3f}ms p50={statistics.median(ordered):.3f}ms p99={ordered[int(len(ordered) * 0.99) - 1]:.3f}ms")
+
+async def main():
+    server = uvicorn.Server(uvicorn.Config(stub_app, host=HOST, port=PORT, log_level="warning"))
+    task = asyncio.create_task(server.serve())
+    while not server.started:
+        await asyncio.sleep(0.05)
+
+    url = f"http://{HOST}:{PORT}/search/photos"
+    summarize("new connection per request", await fresh_clients(url))
+    summarize("pooled keep-alive client", await pooled_client(url))
+    print(f"connection stats: {metrics()['benchmark']}")
+
+    server.should_exit = True
+    await task
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,68 @@
+# Run from backend/ against a running server: python -m benchmarks.healthUnderLoad
+# Imports
+import os
+import sys
+import time
+import asyncio
+import statistics
+import httpx
+
+# Benchmark Settings
+BASE_URL = os.getenv("BENCH_BASE_URL", "http://127.0.0.1:8000")
+TOKEN = os.getenv("BENCH_TOKEN", "")
+GENERATE_CONCURRENCY = int(os.getenv("BENCH_GENERATE_CONCURRENCY", "50"))
+HEALTH_SAMPLES = int(os.getenv("BENCH_HEALTH_SAMPLES", "200"))
+
+# Sample /health Latency in Milliseconds
+async def sample_health(client: httpx.AsyncClient, samples: int) -> list:
+
+    latencies = []
+    for _ in range(samples):
+        start = time.perf_counter()
+        await client.get(f"{BASE_URL}/health")
+        latencies.append((time.perf_counter() - start) * 1000)
+        await asyncio.sleep(0.01)
+    return latencies
+
+# Keep Generation Traffic Saturated Until Stopped
+async def saturate_generate(client: httpx.AsyncClient, stop: asyncio.Event):
+
+    headers = {"Authorization": f"Bearer {TOKEN}"}
+    body = {"preferences": {}}
+    while not stop.is_set():
+        try:
+            await client.post(f"{BASE_URL}/recipes/generate", json=body, headers=headers, timeout=120)
+        except httpx.HTTPError:
+            pass
+
+# Summarize Latency Samples
+def summarize(label: str, latencies: list):
+
+    ordered = sorted(latencies)
+    p50 = statistics.median(ordered)
+    p99 = ordered[int(len(ordered) * 0.99) - 1]
+    print(f"{label}: p50={p50:.2f}ms p99={p99:.2f}ms max={ordered[-1]:.2f}ms")
+
+async def main():
+
+    if not TOKEN:
+        sys.exit("Set BENCH_TOKEN to a valid Supabase access token")
+
+    limits = httpx.Limits(max_connections=GENERATE_CONCURRENCY + 10)
+    async with httpx.AsyncClient(limits=limits, timeout=30) as client:
+
+        # Idle Baseline
+        summarize("health (idle)", await sample_health(client, HEALTH_SAMPLES))
+
+        # Under Saturated Generation Load
+        stop = asyncio.Event()
+        workers = [asyncio.create_task(saturate_generate(client, stop)) for _ in range(GENERATE_CONCURRENCY)]
+        await asyncio.sleep(2)
+        summarize(f"health (generate x{GENERATE_CONCURRENCY})", await sample_health(client, HEALTH_SAMPLES))
+        stop.set()
+        for worker in workers:
+            worker.cancel()
+        await asyncio.gather(*workers, return_exceptions=True)
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,233 @@
+# Run from backend/: python -m benchmarks.loadTest (starts a stub-mode server unless BENCH_BASE_URL is set)
+# Imports
+import os
+import sys
+import json
+import time
+import uuid
+import socket
+import asyncio
+import subprocess
+from datetime import datetime, timezone
+import httpx
+import jwt
+
+# Benchmark Settings
+BASE_URL = os.getenv("BENCH_BASE_URL")
+JWT_SECRET = os.getenv("BENCH_JWT_SECRET", "load-test-secret")
+CONCURRENCY_LEVELS = [int(level) for level in os.getenv("BENCH_CONCURRENCY", "1,8,32,128").split(",")]
+DURATION = float(os.getenv("BENCH_DURATION", "10"))
+STATS_INTERVAL = float(os.getenv("BENCH_STATS_INTERVAL", "0.25"))
+RESULTS_DIR = os.getenv("BENCH_RESULTS_DIR", os.path.join(os.path.dirname(__file__), "results"))
+
+# Token Accepted by middleware/auth.py
+def mint_token(user_id: str) -> str:
+    now = int(time.time())
+    return jwt.encode(
+        {"sub": user_id, "aud": "authenticated", "iat": now, "exp": now + 3600},
+        JWT_SECRET,
+        algorithm="HS256"
+    )
+
+# Free Local Port for the Server
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+# Start the API with Stub Upstreams
+def start_server() -> tuple:
+
+    port = free_port()
+    env = {**os.environ, "UPSTREAM_MODE": "stub", "SUPABASE_JWT_SECRET": JWT_SECRET}
+    env.pop("SUPABASE_JWKS_URL", None)
+    process = subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "main:app", "--port", str(port), "--log-level", "warning"],
+        cwd=os.path.join(os.path.dirname(__file__), ".."),
+        env=env
+    )
+
+    # Wait for Health Check
+    base_url = f"http://127.0.0.1:{port}"
+    for _ in range(100):
+        try:
+            httpx.get(f"{base_url}/health", timeout=1)
+            return process, base_url
+        except httpx.HTTPError:
+            time.sleep(0.1)
+    process.terminate()
+    sys.exit("Server did not start")
+
+# Percentile of Sorted Samples
+def percentile(ordered: list, fraction: float) -> float:
+    if not ordered:
+        return 0.0
+    return ordered[min(len(ordered) - 1, int(len(ordered) * fraction))]
+
+# Summarize Latency Samples in Milliseconds
+def summarize(latencies: list, errors: int, duration: float) -> dict:
+    ordered = sorted(latencies)
+    return {
+        "requests": len(ordered),
+        "errors": errors,
+        "throughput_rps": len(ordered) / duration,
+        "p50_ms": percentile(ordered, 0.50),
+        "p95_ms": percentile(ordered, 0.95),
+        "p99_ms": percentile(ordered, 0.99),
+        "max_ms": ordered[-1] if ordered else 0.0,
+    }
+
+# One Virtual User Cycling Through Every Endpoint
+class VirtualUser:
+
+    # Constructor
+    def __init__(self, client: httpx.AsyncClient, results: dict):
+        self.client = client
+        self.results = results
+        self.headers = {"Authorization": f"Bearer {mint_token(str(uuid.uuid4()))}"}
+        self.recipe = None
+
+    # Time One Request Under an Endpoint Label
+    async def call(self, label: str, method: str, path: str, **kwargs):
+
+        samples = self.results.setdefault(label, {"latencies": [], "errors": 0})
+        start = time.perf_counter()
+        try:
+            response = await self.client.request(method, path, headers=self.headers, **kwargs)
+            elapsed = (time.perf_counter() - start) * 1000
+            if response.status_code >= 400:
+                samples["errors"] += 1
+                return None
+            samples["latencies"].append(elapsed)
+            return response
+        except httpx.HTTPError:
+            samples["errors"] += 1
+            return None
+
+    # Time a Streamed Response Until the Final Event
+    async def stream(self, label: str, path: str, body: dict):
+
+        samples = self.results.setdefault(label, {"latencies": [], "errors": 0})
+        start = time.perf_counter()
+        try:
+            async with self.client.stream("POST", path, headers=self.headers, json=body) as response:
+                async for _ in response.aiter_lines():
+                    pass
+            if response.status_code >= 400:
+                samples["errors"] += 1
+                return
+            samples["latencies"].append((time.perf_counter() - start) * 1000)
+        except httpx.HTTPError:
+            samples["errors"] += 1
+
+    # Full Session (Generation, Library and Preferences)
+    async def session(self):
+
+        preferences = {"effort_level": 1, "skill_level": 1, "calorie_consciousness": 2, "protein_preference": 3, "spice_level": 2}
+        await self.call("GET /health", "GET", "/health")
+        await self.call("PUT /preferences", "PUT", "/preferences", json=preferences)
+        await self.call("GET /preferences", "GET", "/preferences")
+
+        response = await self.call("POST /recipes/generate", "POST", "/recipes/generate", json={"preferences": preferences})
+        if response is not None:
+            self.recipe = response.json()
+
+        await self.stream("POST /recipes/generate/stream", "/recipes/generate/stream", {"preferences": preferences})
+        await self.call("POST /recipes/generate/batch", "POST", "/recipes/generate/batch", json={"preferences": preferences, "count": 3})
+
+        if self.recipe is not None:
+            await self.call("POST /recipes/modify", "POST", "/recipes/modify", json={"original_recipe": self.recipe, "modification": "make it vegetarian"})
+            await self.call("POST /recipes/save", "POST", "/recipes/save", json=self.recipe)
+            await self.call("GET /recipes/{id}", "GET", f"/recipes/{self.recipe['id']}")
+            await self.call("DELETE /recipes/save/{id}", "DELETE", f"/recipes/save/{self.recipe['id']}")
+
+        await self.call("GET /recipes/history", "GET", "/recipes/history", params={"limit": 20})
+        await self.call("GET /recipes/saved", "GET", "/recipes/saved", params={"limit": 20})
+        await self.call("GET /recipes/test", "GET", "/recipes/test")
+
+    async def run(self, deadline: float):
+        while time.perf_counter() < deadline:
+            await self.session()
+
+# Poll Server Event-Loop Lag During a Run
+async def sample_loop_lag(client: httpx.AsyncClient, stop: asyncio.Event) -> list:
+
+    lags = []
+    while not stop.is_set():
+        try:
+            response = await client.get("/stats")
+            lags.append(response.json()["event_loop"]["lag_ms_last"])
+        except (httpx.HTTPError, KeyError, ValueError):
+            pass
+        await asyncio.sleep(STATS_INTERVAL)
+    return lags
+
+# Run One Concurrency Level
+async def run_level(base_url: str, concurrency: int) -> dict:
+
+    results = {}
+    limits = httpx.Limits(max_connections=concurrency + 5, max_keepalive_connections=concurrency + 5)
+    async with httpx.AsyncClient(base_url=base_url, limits=limits, timeout=120) as client:
+
+        stop = asyncio.Event()
+        lag_task = asyncio.create_task(sample_loop_lag(client, stop))
+        start = time.perf_counter()
+        users = [VirtualUser(client, results) for _ in range(concurrency)]
+        await asyncio.gather(*(user.run(start + DURATION) for user in users))
+        elapsed = time.perf_counter() - start
+        stop.set()
+        lags = sorted(await lag_task)
+
+    endpoints = {label: summarize(samples["latencies"], samples["errors"], elapsed) for label, samples in sorted(results.items())}
+    total = summarize(
+        [latency for samples in results.values() for latency in samples["latencies"]],
+        sum(samples["errors"] for samples in results.values()),
+        elapsed
+    )
+    return {
+        "concurrency": concurrency,
+        "duration_s": elapsed,
+        "total": total,
+        "endpoints": endpoints,
+        "event_loop_lag_ms": {"p50": percentile(lags, 0.50), "p99": percentile(lags, 0.99), "max": lags[-1] if lags else 0.0},
+    }
+
+async def main():
+
+    process = None
+    base_url = BASE_URL
+    if base_url is None:
+        process, base_url = start_server()
+
+    try:
+        levels = []
+        for concurrency in CONCURRENCY_LEVELS:
+            level = await run_level(base_url, concurrency)
+            levels.append(level)
+            total = level["total"]
+            print(
+                f"c={concurrency}: {total['throughput_rps']:.1f} req/s p50={total['p50_ms']:.1f}ms "
+                f"p95={total['p95_ms']:.1f}ms p99={total['p99_ms']:.1f}ms errors={total['errors']} "
+                f"loop lag p99={level['event_loop_lag_ms']['p99']:.1f}ms"
+            )
+    finally:
+        if process is not None:
+            process.terminate()
+            process.wait()
+
+    # Machine-Readable Results for Comparing Runs
+    os.makedirs(RESULTS_DIR, exist_ok=True)
+    timestamp = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%SZ")
+    path = os.path.join(RESULTS_DIR, f"loadTest-{timestamp}.json")
+    with open(path, "w") as f:
+        json.dump({
+            "timestamp": timestamp,
+            "base_url": base_url,
+            "stubbed": BASE_URL is None,
+            "duration_s": DURATION,
+            "levels": levels,
+        }, f, indent=2)
+    print(f"Results written to {path}")
+
+if __name__ == "__main__":
+    asyncio.run(main())
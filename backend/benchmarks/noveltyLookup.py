@@ -0,0 +1,61 @@
+# Run from backend/: python -m benchmarks.noveltyLookup
+# Imports
+import os
+import time
+import random
+from services.noveltyIndex import UserNovelty, signature, features, similarity
+from services.stubProviders import CUISINES, PROTEINS, VEGETABLES, DISHES, STAPLES, SEASONINGS
+
+# Benchmark Settings
+HISTORY_SIZES = [int(size) for size in os.getenv("BENCH_HISTORY_SIZES", "100,1000,10000").split(",")]
+PROBES = int(os.getenv("BENCH_PROBES", "500"))
+
+# Synthetic Recipe Fingerprint Fields
+def random_recipe(rng: random.Random) -> dict:
+    cuisine, protein, vegetable, dish = rng.choice(CUISINES), rng.choice(PROTEINS), rng.choice(VEGETABLES), rng.choice(DISHES)
+    return {
+        "title": f"{cuisine} {protein} and {vegetable} {dish}",
+        "tags": [dish, protein, vegetable],
+        "ingredients": [f"200g {protein}", f"1 cup {vegetable}", f"1 cup {rng.choice(STAPLES)}", *rng.sample(SEASONINGS, 3)],
+    }
+
+# Reworded Copy of a Recipe (Same Dish, Different Title Phrasing)
+def near_duplicate(recipe: dict) -> dict:
+    return {**recipe, "title": f"Easy {recipe['title'].replace(' and ', ' & ')} for Meal Prep"}
+
+# Mean Microseconds per Call
+def time_calls(func, items: list) -> float:
+    start = time.perf_counter()
+    for item in items:
+        func(item)
+    return (time.perf_counter() - start) / len(items) * 1e6
+
+def main():
+
+    rng = random.Random(1)
+    print(f"{'history':>8} {'lsh us':>8} {'scan us':>9} {'near-dup caught':>16} {'fresh flagged':>14}")
+
+    for size in HISTORY_SIZES:
+        history = [random_recipe(rng) for _ in range(size)]
+        novelty = UserNovelty(threshold=0.5, recent=3)
+        for recipe in history:
+            novelty.add(recipe)
+
+        # Probes: Reworded History Entries and Unseen Recipes
+        duplicates = [near_duplicate(rng.choice(history)) for _ in range(PROBES)]
+        fresh = [{**random_recipe(rng), "title": f"Probe {index} Surprise"} for index in range(PROBES)]
+
+        # Indexed Lookup vs Comparing Against Every Signature
+        lsh_us = time_calls(novelty.is_duplicate, duplicates + fresh)
+
+        def scan(recipe: dict) -> bool:
+            sig = signature(features(recipe))
+            return any(similarity(sig, other) >= novelty.threshold for other in novelty.signatures)
+        scan_us = time_calls(scan, fresh[:50])
+
+        caught = sum(novelty.is_duplicate(recipe) for recipe in duplicates) / PROBES
+        flagged = sum(novelty.is_duplicate(recipe) for recipe in fresh) / PROBES
+        print(f"{size:>8} {lsh_us:>8.0f} {scan_us:>9.0f} {caught:>16.0%} {flagged:>14.0%}")
+
+if __name__ == "__main__":
+    main()
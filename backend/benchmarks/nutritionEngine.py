@@ -0,0 +1,97 @@
+# Run from backend/: python -m benchmarks.nutritionEngine
+# Imports
+import os
+import time
+import random
+from services.nutritionEngine import NutritionEngine, MACRO_FIELDS, TOLERANCE, ABSOLUTE_TOLERANCE
+from services.stubProviders import PROTEINS, VEGETABLES, STAPLES, SEASONINGS
+
+# Benchmark Settings
+BATCH_SIZES = [int(size) for size in os.getenv("BENCH_BATCHES", "1,5,100,5000").split(",")]
+RECIPES = int(os.getenv("BENCH_RECIPES", "20000"))
+
+# Ingredient Line Shapes Seen in Model Output
+AMOUNTS = ["200g {}", "1 cup {}", "2 tbsp {}", "1/2 cup {}, chopped", "1 1/2 cups {}", "2-3 {}", "a handful of {}", "1 can {} (400g), drained", "{} to taste"]
+
+# Hand-Labelled Ingredient Lines and the Table Row Each Should Match (None When No Row Fits)
+LABELLED = [
+    ("2 cups cooked jasmine rice", "cooked rice"), ("1 cup basmati rice, rinsed", "rice"), ("1 cup uncooked brown rice", "brown rice"),
+    ("3 cups cooked brown rice", "cooked brown rice"), ("1 cup quinoa (cooked)", "cooked quinoa"), ("3/4 cup dry quinoa", "quinoa"),
+    ("200g spaghetti", "pasta"), ("2 cups cooked penne", "cooked pasta"), ("1 cup dried red lentils", "lentil"),
+    ("1 1/2 cups cooked lentils", "cooked lentil"), ("2 cups leftover rice", "cooked rice"), ("1 cup steamed rice", "cooked rice"),
+    ("2 chicken breasts, sliced", "chicken breast"), ("1 tbsp olive oil", "olive oil"), ("1 tsp dried oregano", "oregano"),
+    ("1 can chickpeas (400g), drained", "chickpea"), ("2 cloves garlic, minced", "garlic"), ("1 large onion, diced", "onion"),
+    ("salt and pepper to taste", "salt"), ("1 cup shredded mozzarella", "mozzarella"), ("2 tbsp soy sauce", "soy sauce"),
+    ("150g rice noodles", "rice noodle"), ("2 cups cooked rice noodles", "cooked rice noodle"), ("1 cup rolled oats", "oat"),
+]
+
+# Fraction of Labelled Lines Matched to the Expected Row, and the Misses
+def accuracy(engine: NutritionEngine) -> tuple:
+    misses = []
+    for text, expected in LABELLED:
+        food = engine.parse(text)[0]
+        name = engine.names[food] if food >= 0 else None
+        if name != expected:
+            misses.append((text, name, expected))
+    return 1 - len(misses) / len(LABELLED), misses
+
+# Synthetic Generated Recipe
+def random_recipe(rng: random.Random) -> dict:
+    foods = [rng.choice(PROTEINS), rng.choice(VEGETABLES), rng.choice(STAPLES), *rng.sample(SEASONINGS, 4)]
+    return {
+        "servings": rng.choice([1, 2, 4]),
+        "ingredients": [rng.choice(AMOUNTS).format(food) for food in foods],
+        "macros": {"calories": rng.randrange(200, 900), "protein": rng.randrange(5, 70), "carbs": rng.randrange(5, 120), "fat": rng.randrange(2, 60)},
+    }
+
+# Per-Recipe Check Without NumPy (the Obvious Implementation)
+def scalar_verify(engine: NutritionEngine, recipe_data: dict) -> bool:
+    totals = [0.0] * len(MACRO_FIELDS)
+    for text in recipe_data["ingredients"]:
+        food, grams = engine.parse(text)
+        if food >= 0:
+            for column in range(len(MACRO_FIELDS)):
+                totals[column] += float(engine.per_gram[food, column]) * grams
+    reported = [recipe_data["macros"][field] for field in MACRO_FIELDS]
+    return any(
+        abs(total / recipe_data["servings"] - value) > max(TOLERANCE * value, float(absolute))
+        for total, value, absolute in zip(totals, reported, ABSOLUTE_TOLERANCE)
+    )
+
+# Recipes per Second Checking `recipes` in Batches of `size`
+def throughput(func, recipes: list, size: int) -> float:
+    start = time.perf_counter()
+    for offset in range(0, len(recipes), size):
+        func(recipes[offset:offset + size])
+    return len(recipes) / (time.perf_counter() - start)
+
+def main():
+
+    rng = random.Random(7)
+    recipes = [random_recipe(rng) for _ in range(RECIPES)]
+    engine = NutritionEngine()
+    engine.mode = "validate"
+
+    # First Pass Parses Every Distinct Line; Later Passes Hit the Parse Cache
+    cold = throughput(engine.verify, recipes, max(BATCH_SIZES))
+    lines = sum(len(recipe["ingredients"]) for recipe in recipes)
+    print(f"{RECIPES} recipes, {lines} ingredient lines, {engine.parse.cache_info().currsize} distinct")
+    print(f"cold parse cache: {cold:>10,.0f} recipes/s")
+    print(f"{'batch':>6} {'vectorised':>12} {'per-recipe':>12}")
+
+    for size in BATCH_SIZES:
+        vectorised = throughput(engine.verify, recipes, size)
+        scalar = throughput(lambda batch: [scalar_verify(engine, recipe) for recipe in batch], recipes, size)
+        print(f"{size:>6} {vectorised:>10,.0f}/s {scalar:>10,.0f}/s")
+
+    matched, misses = accuracy(engine)
+    print(f"labelled lines matched correctly: {matched:.0%}")
+    for text, name, expected in misses:
+        print(f"  {text!r}: {name} (expected {expected})")
+
+    metrics = engine.metrics()
+    print(f"matched {metrics['matched'] / metrics['ingredients']:.0%} of lines, "
+          f"{metrics['mismatched'] / metrics['recipes']:.0%} of random macros flagged")
+
+if __name__ == "__main__":
+    main()
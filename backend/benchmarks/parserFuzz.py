@@ -0,0 +1,76 @@
+# Run from backend/: python -m benchmarks.parserFuzz [cases]
+# Imports
+import os
+import sys
+import json
+import time
+import random
+from collections import Counter
+from services import recipeParser
+
+# Recorded Recipes Used as Seeds
+FIXTURES = os.path.join(os.path.dirname(__file__), "fixtures", "completions.json")
+
+# Mutations Seen in Real LLM Output
+def fenced(text: str, rng: random.Random) -> str:
+    return f"```json\n{text}\n```"
+
+def prose(text: str, rng: random.Random) -> str:
+    return f"Sure! Here is a recipe you will love:\n\n{text}\n\nLet me know if you want changes."
+
+def trailing_commas(text: str, rng: random.Random) -> str:
+    return text.replace("\n  }", ",\n  }").replace("\n  ]", ",\n  ]")
+
+def truncated(text: str, rng: random.Random) -> str:
+    return text[:rng.randint(int(len(text) * 0.6), len(text) - 1)]
+
+def compact(text: str, rng: random.Random) -> str:
+    return json.dumps(json.loads(text), separators=(",", ":"))
+
+MUTATIONS = [fenced, prose, trailing_commas, truncated, compact]
+
+# Build a Deterministic Corpus of Mutated Completions
+def build_corpus(recipes: list, cases: int, seed: int = 7) -> list:
+    rng = random.Random(seed)
+    corpus = []
+    for _ in range(cases):
+        text = json.dumps(rng.choice(recipes), indent=2)
+        for mutation in rng.sample(MUTATIONS, rng.randint(1, 3)):
+            if mutation is compact:
+                try:
+                    text = mutation(text, rng)
+                except ValueError:
+                    continue
+            else:
+                text = mutation(text, rng)
+        corpus.append(text)
+    return corpus
+
+if __name__ == "__main__":
+    with open(FIXTURES) as f:
+        recipes = json.load(f)["recipes"]
+    corpus = build_corpus(recipes, int(sys.argv[1]) if len(sys.argv) > 1 else 2000)
+
+    # Salvage Outcomes
+    outcomes = Counter()
+    repaired_fields = Counter()
+    for text in corpus:
+        try:
+            _, missing = recipeParser.validate_recipe(recipeParser.parse_json(text))
+        except ValueError:
+            outcomes["unparseable"] += 1
+            continue
+        outcomes["needs field repair" if missing else "valid"] += 1
+        repaired_fields.update(missing)
+    print(f"cases: {len(corpus)} -> {dict(outcomes)}")
+    print(f"fields needing targeted repair: {dict(repaired_fields)}")
+
+    # Throughput
+    start = time.perf_counter()
+    for text in corpus:
+        try:
+            recipeParser.validate_recipe(recipeParser.parse_json(text))
+        except ValueError:
+            pass
+    elapsed = time.perf_counter() - start
+    print(f"throughput: {len(corpus) / elapsed:.0f} completions/s ({elapsed / len(corpus) * 1e6:.1f}us each)")
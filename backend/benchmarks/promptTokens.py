@@ -0,0 +1,101 @@
+# Run from backend/: python -m benchmarks.promptTokens
+# Imports
+import os
+import json
+
+from models.recipe import UserPreferences
+from services import promptBuilder
+from services import recipeParser
+
+# Recorded Completions
+FIXTURES = os.path.join(os.path.dirname(__file__), "fixtures", "completions.json")
+
+# Previous Indented Generation Prompt (for Comparison)
+def legacy_generate_prompt(preferences: UserPreferences, existing_recipes: list) -> str:
+    existing_recipes_text = f"""
+            The user has already generated these recipes:
+            {', '.join(existing_recipes)}
+            Ensure the recipe is unique from these previously generated recipes.
+            Choose different ingredients, cooking methods, or dish type.
+            """
+    return f"""
+        Generate an simple, easy to cook, meal prep recipe based on these preferences:
+        Return ONLY valid JSON with this exact structure (no markdown, no extra text):
+
+        {{
+            "title": "Recipe Name/Name of Dish",
+            "description": "A one sentence description",
+            "cook_time": (int) total cook time in minutes,
+            "tags": ["dish type", "main ingredient", "secondary ingredient"],
+            "ingredients": ["ingredient with quantity", ...],
+            "steps": [
+                {{"step_number": 1, "instruction": "First step..."}},
+                {{"step_number": 2, "instruction": "Second step..."}}
+            ],
+            "macros": {{
+                "calories": (int) total calories,
+                "protein": (int) grams of protein,
+                "carbs": (int) grams of carbs,
+                "fat": (int) grams of fat
+            }}
+        }}
+
+        {preferences.to_prompt_string()}
+        {existing_recipes_text}
+        The recipe should include common household ingredients for university students.
+        Return ONLY the JSON object."""
+
+# Previous Indented Modification Prompt (for Comparison)
+def legacy_modify_prompt(original_recipe: dict, modification: str) -> str:
+    return f"""
+        Here's a recipe:
+        {json.dumps(original_recipe, indent=2)}
+        User wants to modify it: "{modification}"
+
+        Return ONLY the updated JSON with the same structure, incorporating their changes.
+        No markdown, just the JSON object."""
+
+# Previous Code-Fence Stripping Parser (for Comparison)
+def legacy_parse(content: str) -> dict:
+    content = content.strip()
+    if content.startswith("```"):
+        content = content.split("```")[1]
+        if content.startswith("json"):
+            content = content[4:]
+    return json.loads(content)
+
+# Share of Completions a Parser Fails On
+def parse_failure_rate(parse, completions: list) -> float:
+    failures = 0
+    for content in completions:
+        try:
+            parse(content)
+        except ValueError:
+            failures += 1
+    return failures / len(completions)
+
+if __name__ == "__main__":
+    with open(FIXTURES) as f:
+        fixtures = json.load(f)
+
+    preferences = UserPreferences()
+    history = [recipe["title"] for recipe in fixtures["recipes"]] * 3
+    recipe = {**fixtures["recipes"][0], "id": "00000000-0000-0000-0000-000000000000", "image_url": "https://images.unsplash.com/photo"}
+
+    # Estimated Input Tokens
+    rows = [
+        ("generate", legacy_generate_prompt(preferences, history), promptBuilder.generate_prompt(preferences, history)),
+        ("modify", legacy_modify_prompt(recipe, "make it vegetarian"), promptBuilder.modify_prompt(recipe, "make it vegetarian")),
+    ]
+    for name, legacy, compact in rows:
+        before, after = promptBuilder.estimate_tokens(legacy), promptBuilder.estimate_tokens(compact)
+        print(f"{name} prompt: {before} -> {after} tokens (-{(1 - after / before) * 100:.0f}%)")
+
+    # Output Budget
+    print(f"max_tokens: generate 2000 -> {promptBuilder.recipe_max_tokens()}, modify 2000 -> {promptBuilder.modify_max_tokens(recipe)}")
+
+    # Parse Failures on Recorded Output
+    for name, parse in (("legacy", legacy_parse), ("tolerant", recipeParser.parse_json)):
+        text_mode = parse_failure_rate(parse, fixtures["text_mode"])
+        json_mode = parse_failure_rate(parse, fixtures["json_mode"])
+        print(f"{name} parse failures: text mode {text_mode:.0%}, json mode {json_mode:.0%}")
@@ -0,0 +1,87 @@
+# Run from backend/: python -m benchmarks.recipeSearch
+# Imports
+import os
+import time
+import uuid
+import random
+from services.recipeIndex import RecipeIndex
+from services.stubProviders import CUISINES, PROTEINS, VEGETABLES, DISHES, STAPLES, SEASONINGS
+
+# Benchmark Settings
+RECIPES_PER_USER = [int(size) for size in os.getenv("BENCH_RECIPES", "1000,10000").split(",")]
+OTHER_USERS = int(os.getenv("BENCH_OTHER_USERS", "20"))
+PROBES = int(os.getenv("BENCH_PROBES", "200"))
+
+# Synthetic Stored Recipe
+def random_recipe(rng: random.Random) -> dict:
+    cuisine, protein, vegetable, dish = rng.choice(CUISINES), rng.choice(PROTEINS), rng.choice(VEGETABLES), rng.choice(DISHES)
+    return {
+        "id": str(uuid.UUID(int=rng.getrandbits(128))),
+        "title": f"{cuisine} {protein} and {vegetable} {dish}",
+        "image_url": "https://images.example.com/x.jpg",
+        "description": f"A {dish} of {protein} and {vegetable}.",
+        "cook_time": rng.choice([10, 15, 20, 25, 30, 40, 45, 60, 90]),
+        "tags": [dish, protein, vegetable],
+        "ingredients": [f"200g {protein}", f"1 cup {vegetable}", f"1 cup {rng.choice(STAPLES)}", *rng.sample(SEASONINGS, 3)],
+        "steps": [{"step_number": 1, "instruction": "Cook."}],
+        "macros": {"calories": rng.randrange(200, 900), "protein": rng.randrange(5, 70), "carbs": rng.randrange(5, 120), "fat": rng.randrange(2, 60)},
+    }
+
+# Searches Mirroring "Chicken, Under 30 Minutes, High Protein"
+QUERIES = {
+    "text": {"text": "chicken"},
+    "text + filters": {"text": "chicken", "filters": {"max_cook_time": 30, "min_protein": 40}},
+    "filters only": {"filters": {"max_cook_time": 30, "min_protein": 40}, "sort": "protein"},
+    "two terms": {"text": "broccoli rice"},
+}
+
+# Linear Scan over Decoded recipe_data (What Filtering Fetched Rows in Python Costs)
+def scan(recipes: list, text: str = "", filters: dict = None, sort: str = "relevance") -> list:
+    words = text.lower().split()
+    filters = filters or {}
+    hits = []
+    for recipe in recipes:
+        haystack = " ".join([recipe["title"], *recipe["tags"], *recipe["ingredients"]]).lower()
+        if not all(word in haystack for word in words):
+            continue
+        if recipe["cook_time"] > filters.get("max_cook_time", float("inf")):
+            continue
+        if recipe["macros"]["protein"] < filters.get("min_protein", 0):
+            continue
+        hits.append(recipe)
+    return hits[:20]
+
+# Mean Milliseconds per Call
+def time_calls(func) -> float:
+    start = time.perf_counter()
+    for _ in range(PROBES):
+        func()
+    return (time.perf_counter() - start) / PROBES * 1000
+
+def main():
+
+    rng = random.Random(7)
+    print(f"{'recipes':>8} {'query':>15} {'index ms':>9} {'scan ms':>8} {'hits':>5}")
+
+    for size in RECIPES_PER_USER:
+        index = RecipeIndex(":memory:")
+        recipes = [random_recipe(rng) for _ in range(size)]
+
+        # Build Incrementally, One Insert Batch per Stored Generation
+        start = time.perf_counter()
+        for offset in range(0, size, 5):
+            index.add("user", [(recipe, "history", None) for recipe in recipes[offset:offset + 5]])
+        for other in range(OTHER_USERS):
+            index.add(f"other-{other}", [(random_recipe(rng), "history", None) for _ in range(size // 10)])
+        build_us = (time.perf_counter() - start) / (size + OTHER_USERS * (size // 10)) * 1e6
+
+        for label, query in QUERIES.items():
+            index_ms = time_calls(lambda: index.search("user", **query))
+            scan_ms = time_calls(lambda: scan(recipes, **query))
+            hits = len(index.search("user", **query))
+            print(f"{size:>8} {label:>15} {index_ms:>9.2f} {scan_ms:>8.2f} {hits:>5}")
+        print(f"{size:>8} {'insert':>15} {build_us:>8.0f}us per recipe")
+        index.close()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,96 @@
+# Run from backend/: python -m benchmarks.serialization
+# Imports
+import os
+import json
+import time
+import asyncio
+import tracemalloc
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+from fastapi.routing import serialize_response
+from fastapi.utils import create_model_field
+from models.recipe import Recipe
+from services.serialization import FastJSONResponse
+
+# Benchmark Settings
+PAGE_SIZE = int(os.getenv("BENCH_PAGE_SIZE", "100"))
+ROUNDS = int(os.getenv("BENCH_ROUNDS", "200"))
+FIXTURES = os.path.join(os.path.dirname(__file__), "fixtures", "completions.json")
+
+# Full-View History Page as Returned by Supabase
+def history_page() -> dict:
+    with open(FIXTURES) as f:
+        recipes = json.load(f)["recipes"]
+    rows = [
+        {
+            "id": str(index),
+            "user_id": "user",
+            "recipe_title": recipes[index % len(recipes)]["title"],
+            "created_at": "2024-11-01T12:00:00.000000+00:00",
+            "recipe_data": {**recipes[index % len(recipes)], "id": str(index), "image_url": "https://images.example.com/x.jpg"},
+        }
+        for index in range(PAGE_SIZE)
+    ]
+    return {"recipes": rows, "next_cursor": None}
+
+# Mean Microseconds and Peak Allocated KiB per Call
+def measure(func) -> tuple:
+
+    func()
+    start = time.perf_counter()
+    for _ in range(ROUNDS):
+        func()
+    elapsed = (time.perf_counter() - start) / ROUNDS * 1e6
+
+    tracemalloc.start()
+    func()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed, peak / 1024
+
+def report(label: str, before, after):
+    (before_us, before_kib), (after_us, after_kib) = measure(before), measure(after)
+    print(
+        f"{label}: {before_us:.0f}us/{before_kib:.0f}KiB -> {after_us:.0f}us/{after_kib:.0f}KiB "
+        f"({before_us / after_us:.1f}x faster, {before_kib / max(after_kib, 1):.1f}x less peak memory)"
+    )
+
+def main():
+
+    page = history_page()
+    recipe = Recipe(**page["recipes"][0]["recipe_data"])
+    recipe_field = create_model_field(name="response", type_=Recipe)
+
+    # History Page: jsonable_encoder + json.dumps vs orjson Directly
+    report(
+        f"history page ({PAGE_SIZE} full recipes)",
+        lambda: JSONResponse(jsonable_encoder(page)).body,
+        lambda: FastJSONResponse(page).body
+    )
+
+    # Recipe: response_model Validation and Re-Serialization vs Compiled Serializer
+    # (Both Driven Through the Same Event Loop)
+    loop = asyncio.new_event_loop()
+
+    async def response_model_path():
+        return JSONResponse(await serialize_response(field=recipe_field, response_content=recipe, is_coroutine=True)).body
+
+    async def direct_path():
+        return FastJSONResponse(recipe).body
+
+    report(
+        "single recipe",
+        lambda: loop.run_until_complete(response_model_path()),
+        lambda: loop.run_until_complete(direct_path())
+    )
+    loop.close()
+
+    # Database Row: JSON Round Trip vs Single-Pass Dump
+    report(
+        "recipe to dict",
+        lambda: json.loads(recipe.model_dump_json()),
+        lambda: recipe.model_dump(mode="json")
+    )
+
+if __name__ == "__main__":
+    main()
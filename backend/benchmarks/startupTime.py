@@ -0,0 +1,100 @@
+# Run from backend/: python -m benchmarks.startupTime
+# Imports
+import os
+import re
+import sys
+import time
+import signal
+import statistics
+import subprocess
+import threading
+
+# Benchmark Settings
+WORKERS = int(os.getenv("BENCH_WORKERS", "4"))
+IMPORT_RUNS = int(os.getenv("BENCH_IMPORT_RUNS", "5"))
+PORT = int(os.getenv("BENCH_PORT", "8765"))
+TIMEOUT = 60
+
+# Stub Upstreams and a Throwaway Shared Cache
+ENV = {
+    **os.environ,
+    "UPSTREAM_MODE": "stub",
+    "SUPABASE_JWT_SECRET": "benchmark",
+    "GROQ_API_KEY": "benchmark",
+    "SHARED_CACHE_PATH": "/tmp/flavourfinder_startup_bench.db",
+    "WEB_CONCURRENCY": str(WORKERS),
+    "PORT": str(PORT),
+    "LOG_LEVEL": "WARNING",
+}
+
+# Launchers Compared: Uvicorn's Spawning Supervisor vs the Preloading Prefork Master
+LAUNCHERS = {
+    "uvicorn --workers": [sys.executable, "-m", "uvicorn", "main:app", "--port", str(PORT), "--workers", str(WORKERS)],
+    "serve.py (prefork)": [sys.executable, "serve.py"],
+}
+
+# Milliseconds to Import the App in a Fresh Interpreter
+def import_time() -> float:
+    code = "import time; start = time.perf_counter(); import main; print((time.perf_counter() - start) * 1000)"
+    runs = [float(subprocess.run([sys.executable, "-c", code], env=ENV, capture_output=True, text=True, check=True).stdout) for _ in range(IMPORT_RUNS)]
+    return statistics.median(runs)
+
+# Proportional Set Size (Shared Pages Split Between Processes) in MiB
+def pss_mib(pid: int) -> float:
+    with open(f"/proc/{pid}/smaps_rollup") as f:
+        return next(int(line.split()[1]) for line in f if line.startswith("Pss:")) / 1024
+
+# Server Process Whose Log Lines are Timestamped as they Arrive
+class Launch:
+
+    def __init__(self, command: list):
+        self.start = time.perf_counter()
+        self.process = subprocess.Popen(command, env=ENV, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True)
+        self.ready = []
+        self.pids = []
+        self.changed = threading.Condition()
+        threading.Thread(target=self._read, daemon=True).start()
+
+    def _read(self):
+        for line in self.process.stdout:
+            with self.changed:
+                match = re.search(r"Started server process \[(\d+)\]", line)
+                if match:
+                    self.pids.append(int(match.group(1)))
+                if "Application startup complete" in line:
+                    self.ready.append(time.perf_counter())
+                self.changed.notify_all()
+
+    # Seconds from `since` Until `count` Workers Have Finished Starting
+    def wait_ready(self, count: int, since: float) -> float:
+        with self.changed:
+            if not self.changed.wait_for(lambda: len(self.ready) >= count, TIMEOUT):
+                raise TimeoutError(f"{count} workers not ready after {TIMEOUT}s")
+        return self.ready[count - 1] - since
+
+    def stop(self):
+        self.process.send_signal(signal.SIGTERM)
+        self.process.wait(TIMEOUT)
+
+def main():
+
+    print(f"import main (fresh interpreter): {import_time():.0f}ms median of {IMPORT_RUNS}")
+    print(f"{'launcher':>20} {'all ready':>10} {'respawn':>9} {'worker PSS':>11}")
+
+    for label, command in LAUNCHERS.items():
+        launch = Launch(command)
+        try:
+            ready = launch.wait_ready(WORKERS, launch.start)
+            pss = sum(pss_mib(pid) for pid in launch.pids[:WORKERS])
+
+            # Kill a Settled Worker (Past the Crash-Loop Delay) and Time its Replacement
+            time.sleep(2)
+            killed = time.perf_counter()
+            os.kill(launch.pids[0], signal.SIGKILL)
+            respawn = launch.wait_ready(WORKERS + 1, killed)
+            print(f"{label:>20} {ready * 1000:>8.0f}ms {respawn * 1000:>7.0f}ms {pss:>8.0f}MiB")
+        finally:
+            launch.stop()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+# Run from backend/: python -m benchmarks.upstreamIncident
+# Imports
+import os
+import time
+import asyncio
+import statistics
+import httpx
+
+os.environ.setdefault("GROQ_API_KEY", "benchmark")
+os.environ.setdefault("IMAGE_CACHE_PATH", ":memory:")
+
+from groq import APITimeoutError
+from services.imageService import imageService
+from services.recipeService import recipeService
+from models.recipe import UserPreferences
+
+# Benchmark Settings
+TIMEOUT = float(os.getenv("BENCH_UPSTREAM_TIMEOUT", "1"))
+CALLS = int(os.getenv("BENCH_CALLS", "40"))
+
+# Unsplash Outage: Every Request Hangs Until the Client Timeout
+def hanging_unsplash() -> httpx.AsyncClient:
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        await asyncio.sleep(TIMEOUT)
+        raise httpx.ReadTimeout("timed out", request=request)
+
+    return httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+# Groq Outage: Every Completion Times Out
+class HangingGroq:
+
+    def __init__(self):
+        self.chat = self
+        self.completions = self
+
+    async def create(self, **kwargs):
+        await asyncio.sleep(TIMEOUT)
+        raise APITimeoutError(request=httpx.Request("POST", "https://api.groq.com/openai/v1/chat/completions"))
+
+    async def close(self):
+        pass
+
+# Sequential Call Latencies in Milliseconds
+async def measure(label: str, call) -> None:
+
+    latencies = []
+    for index in range(CALLS):
+        start = time.perf_counter()
+        try:
+            await call(index)
+        except Exception:
+            pass
+        latencies.append((time.perf_counter() - start) * 1000)
+
+    ordered = sorted(latencies)
+    print(
+        f"{label}: first={latencies[0]:.0f}ms p50={statistics.median(ordered):.1f}ms "
+        f"total={sum(latencies) / 1000:.1f}s over {CALLS} calls"
+    )
+
+async def main():
+
+    print(f"Upstream hangs for {TIMEOUT}s per request")
+
+    images = imageService(client=hanging_unsplash())
+    await measure("image during Unsplash outage", lambda index: images.get_recipe_image(f"dish {index}", [f"tag{index}"]))
+    print(f"  unsplash governor: {images.governor.metrics()}")
+    await images.close()
+
+    recipes = recipeService(client=HangingGroq())
+    await measure("recipe during Groq outage", lambda index: recipes.generate_recipe(UserPreferences()))
+    for name, governor in recipes.governors.items():
+        print(f"  {name}: {governor.metrics()}")
+    await recipes.close()
+
+if __name__ == "__main__":
+    asyncio.run(main())
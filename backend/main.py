@@ -1,14 +1,48 @@
 # Imports
+import os
+import logging
+from dotenv import load_dotenv
+
+# Load Environment Variables (Once, Before Any Module Reads its Settings)
+load_dotenv()
+
 from fastapi import FastAPI
+from fastapi.responses import PlainTextResponse
 from fastapi.middleware.cors import CORSMiddleware
+from contextlib import asynccontextmanager
 from routers import script, preferences
-from dotenv import load_dotenv
+from middleware import auth
+from middleware.metrics import MetricsMiddleware
+from middleware.compression import CompressionMiddleware, metrics as compression_metrics
+from services import telemetry, resourceVersions
+from services.serialization import FastJSONResponse
+from services.httpClient import metrics as http_metrics
+from services.singleFlight import metrics as single_flight_metrics
+from services.loopMonitor import loop_monitor
+from services.upstreamGovernor import metrics as upstream_metrics
+from services.supabaseClient import SupabaseClient
 
-# Load Environment Variables
-load_dotenv()
+# Application Logging (Upstream Diagnostics, Fallbacks and Failures)
+logging.basicConfig(level=os.getenv("LOG_LEVEL", "INFO"), format="%(levelname)s %(name)s: %(message)s")
+logging.getLogger("httpx").setLevel(logging.WARNING)
+
+# Create Service Clients and Background Workers Once per Worker Process, Close Them on Shutdown
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    telemetry.setup_tracing()
+    loop_monitor.start()
+    await script.startup()
+    await preferences.startup()
+    yield
+    await loop_monitor.stop()
+    await script.shutdown()
+    await preferences.shutdown()
+    await SupabaseClient.close()
+    auth.close()
+    resourceVersions.close()
 
 # Initialize FastAPI App
-app = FastAPI(title="FlavourFinder Backend API")
+app = FastAPI(title="FlavourFinder Backend API", lifespan=lifespan, default_response_class=FastJSONResponse)
 
 # Enable CORS for iOS app
 app.add_middleware(
@@ -19,6 +53,12 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Compress Large JSON Bodies (gzip, or Brotli When Installed)
+app.add_middleware(CompressionMiddleware)
+
+# Per-Route Latency Histograms (Including Compression Time)
+app.add_middleware(MetricsMiddleware)
+
 # Include Routers
 app.include_router(script.router)
 app.include_router(preferences.router)
@@ -32,3 +72,35 @@ async def root():
 @app.get("/health")
 async def health():
     return {"status": "healthy"}
+
+# Service Statistics (Group Name, Collector, Label for Per-Key Groups; Services Exist Once the Lifespan Starts)
+STATS = [
+    ("recipe_pool", lambda: script.recipe_pool.metrics(), None),
+    ("job_queue", lambda: script.job_queue.metrics(), None),
+    ("novelty_index", lambda: script.novelty_index.metrics(), None),
+    ("recipe_index", lambda: script.recipe_index.metrics(), None),
+    ("image_cache", lambda: script.image_service.cache.metrics(), None),
+    ("connections", http_metrics, "client"),
+    ("upstreams", upstream_metrics, "upstream"),
+    ("single_flight", single_flight_metrics, "group"),
+    ("token_cache", auth.metrics, None),
+    ("preference_cache", lambda: preferences.preference_service.metrics(), None),
+    ("resource_versions", resourceVersions.metrics, None),
+    ("compression", compression_metrics, None),
+    ("llm_usage", lambda: script.recipe_service.usage, None),
+    ("models", lambda: script.recipe_service.router.metrics(), "model"),
+    ("nutrition", lambda: script.recipe_service.nutrition.metrics(), None),
+    ("event_loop", loop_monitor.metrics, None),
+]
+for name, collect, label in STATS:
+    telemetry.register_collector(name, collect, label)
+
+# Cache Statistics Endpoint
+@app.get("/stats")
+async def stats():
+    return {name: collect() for name, collect, _ in STATS}
+
+# Prometheus Metrics Endpoint
+@app.get("/metrics", response_class=PlainTextResponse)
+async def metrics():
+    return PlainTextResponse(telemetry.render(), media_type="text/plain; version=0.0.4")
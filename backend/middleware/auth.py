@@ -2,44 +2,119 @@
 from fastapi import HTTPException, Header
 import jwt
 import os
+import time
+import hashlib
+import threading
 from typing import Optional
+from services.cache import MISSING
+from services.sharedCache import create_cache
 
 JWT_SECRET = os.getenv("SUPABASE_JWT_SECRET")
+JWKS_URL = os.getenv("SUPABASE_JWKS_URL")
+
+# Verified Token Cache (Keyed on Token Digest, Expires with the Token)
+TOKEN_CACHE_TTL = float(os.getenv("TOKEN_CACHE_TTL", "300"))
+_token_cache = None
+_token_cache_lock = threading.Lock()
+
+# Open the Token Cache on First Use, so Each Worker Process Gets its Own Connection
+# (Verified Tokens Never Change, so Workers Also Keep a Local Copy of Shared Entries)
+def _cache():
+    global _token_cache
+    if _token_cache is None:
+        _token_cache = create_cache(
+            "tokens",
+            maxsize=int(os.getenv("TOKEN_CACHE_SIZE", "10000")),
+            ttl=TOKEN_CACHE_TTL,
+            local_ttl=TOKEN_CACHE_TTL
+        )
+    return _token_cache
+
+# JWKS Client for Asymmetric Tokens (Keys Cached in Memory, Needs cryptography)
+_jwks_client = jwt.PyJWKClient(JWKS_URL, cache_keys=True, lifespan=3600) if JWKS_URL else None
+
+# Longest Token Accepted Before Decoding
+MAX_TOKEN_LENGTH = 4096
+
+# Decode and Verify Token Signature, Expiry and Audience
+def _decode(token: str) -> dict:
+
+    # Asymmetric Tokens Signed with a Published Key
+    if _jwks_client is not None and jwt.get_unverified_header(token).get("alg") != "HS256":
+        signing_key = _jwks_client.get_signing_key_from_jwt(token)
+        return jwt.decode(
+            token,
+            signing_key.key,
+            algorithms=["RS256", "ES256"],
+            audience="authenticated"
+        )
+
+    return jwt.decode(
+        token,
+        JWT_SECRET,
+        algorithms=["HS256"],
+        audience="authenticated"
+    )
 
 # Verify JWT Token and Extract User ID
 def verify_token(authorization: Optional[str] = Header(None)) -> str:
 
     if not authorization:
         raise HTTPException(status_code=401, detail="Missing authorization header")
-    
+
+    # Reject Malformed Headers Before Any Crypto
+    if not authorization.startswith("Bearer "):
+        raise HTTPException(status_code=401, detail="Invalid authorization format")
+
+    token = authorization[7:].strip()
+    if len(token) > MAX_TOKEN_LENGTH or token.count(".") != 2 or "" in token.split("."):
+        raise HTTPException(status_code=401, detail="Invalid token")
+
+    # Previously Verified Token
+    digest = hashlib.sha256(token.encode()).digest()
+    with _token_cache_lock:
+        user_id = _cache().get(digest)
+    if user_id is not MISSING:
+        return user_id
+
     try:
-        
-        if not authorization.startswith("Bearer "):
-            raise HTTPException(status_code=401, detail="Invalid authorization format")
-        
-        token = authorization.split("Bearer ")[1]
-        
+
         # Decode and Verify Token
-        payload = jwt.decode(
-            token,
-            JWT_SECRET,
-            algorithms=["HS256"],
-            audience="authenticated"
-        )
-        
-        # Extract User ID from Payload
-        user_id = payload.get("sub")
-        if not user_id:
-            raise HTTPException(status_code=401, detail="Invalid token payload")
-        
-        return user_id
-    
+        payload = _decode(token)
+
     except jwt.ExpiredSignatureError:
         raise HTTPException(status_code=401, detail="Token has expired")
-    
+
     except jwt.InvalidTokenError:
         raise HTTPException(status_code=401, detail="Invalid token")
-    
+
     except Exception as e:
         raise HTTPException(status_code=401, detail=f"Authentication failed: {str(e)}")
-    
\ No newline at end of file
+
+    # Extract User ID from Payload
+    user_id = payload.get("sub")
+    if not user_id:
+        raise HTTPException(status_code=401, detail="Invalid token payload")
+
+    # Cache Until the Token Expires
+    ttl = TOKEN_CACHE_TTL
+    if "exp" in payload:
+        ttl = min(ttl, payload["exp"] - time.time())
+    if ttl > 0:
+        with _token_cache_lock:
+            _cache().set(digest, user_id, ttl=ttl)
+
+    return user_id
+
+# Token Cache Metrics
+def metrics() -> dict:
+    with _token_cache_lock:
+        return _cache().metrics()
+
+# Close the Token Cache
+def close():
+    global _token_cache
+    with _token_cache_lock:
+        if _token_cache is not None:
+            _token_cache.close()
+            _token_cache = None
@@ -0,0 +1,105 @@
+# Imports
+import os
+import gzip
+from typing import Optional
+
+# Brotli is Optional (pip install brotli); Without it Only gzip is Offered
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+# Smallest Body Worth Compressing and Encoder Effort (Fast Levels: Bodies are Compressed per Request)
+COMPRESSION_MIN_SIZE = int(os.getenv("COMPRESSION_MIN_SIZE", "1024"))
+GZIP_LEVEL = int(os.getenv("GZIP_LEVEL", "5"))
+BROTLI_QUALITY = int(os.getenv("BROTLI_QUALITY", "4"))
+
+# Content Types that Compress Well
+COMPRESSIBLE_TYPES = (b"application/json", b"text/plain", b"text/html")
+
+_stats = {"compressed": 0, "bytes_in": 0, "bytes_out": 0}
+
+# Preferred Encoding the Client Accepts, or None
+def _encoding(scope) -> Optional[bytes]:
+    offered = set()
+    for name, value in scope["headers"]:
+        if name != b"accept-encoding":
+            continue
+        for item in value.lower().split(b","):
+            coding, _, params = item.partition(b";")
+            quality = params.strip().removeprefix(b"q=")
+            try:
+                accepted = float(quality or 1) > 0
+            except ValueError:
+                accepted = True
+            if accepted:
+                offered.add(coding.strip())
+    if brotli is not None and b"br" in offered:
+        return b"br"
+    if b"gzip" in offered:
+        return b"gzip"
+    return None
+
+# ASGI Middleware Compressing Complete Response Bodies Above a Size Threshold
+# (Streamed Bodies, Like Server-Sent Events, Pass Through so Every Chunk Still Flushes Immediately)
+class CompressionMiddleware:
+
+    # Constructor
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        encoding = _encoding(scope)
+        if encoding is None:
+            await self.app(scope, receive, send)
+            return
+
+        start = None
+
+        # Hold the Response Start Until the First Body Shows Whether it is Complete
+        async def send_wrapper(message):
+            nonlocal start
+            if message["type"] == "http.response.start":
+                headers = dict(message.get("headers", []))
+                content_type = headers.get(b"content-type", b"")
+                if b"content-encoding" in headers or not content_type.startswith(COMPRESSIBLE_TYPES):
+                    await send(message)
+                else:
+                    start = message
+                return
+
+            if start is None or message["type"] != "http.response.body":
+                await send(message)
+                return
+
+            held, start = start, None
+            body = message.get("body", b"")
+            if message.get("more_body", False) or len(body) < COMPRESSION_MIN_SIZE:
+                await send(held)
+                await send(message)
+                return
+
+            compressed = brotli.compress(body, quality=BROTLI_QUALITY) if encoding == b"br" else gzip.compress(body, compresslevel=GZIP_LEVEL)
+            vary = [value for name, value in held.get("headers", []) if name == b"vary"]
+            headers = [(name, value) for name, value in held.get("headers", []) if name not in (b"content-length", b"vary")]
+            headers += [
+                (b"content-encoding", encoding),
+                (b"content-length", str(len(compressed)).encode()),
+                (b"vary", b", ".join([*vary, b"Accept-Encoding"])),
+            ]
+            _stats["compressed"] += 1
+            _stats["bytes_in"] += len(body)
+            _stats["bytes_out"] += len(compressed)
+            await send({**held, "headers": headers})
+            await send({"type": "http.response.body", "body": compressed})
+
+        await self.app(scope, receive, send_wrapper)
+
+# Compression Totals
+def metrics() -> dict:
+    return {**_stats, "ratio": _stats["bytes_out"] / (_stats["bytes_in"] or 1), "brotli": brotli is not None}
@@ -0,0 +1,39 @@
+# Imports
+import time
+from services.telemetry import REQUEST_SECONDS
+
+# ASGI Middleware Recording Request Latency per Route Template
+class MetricsMiddleware:
+
+    # Constructor
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        start = time.perf_counter()
+        status = 500
+
+        # Capture Status from the Response Start Message
+        async def send_wrapper(message):
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+
+            # Label by Template ("/recipes/{recipe_id}") to Keep Cardinality Bounded
+            route = scope.get("route")
+            REQUEST_SECONDS.observe(
+                time.perf_counter() - start,
+                method=scope["method"],
+                route=route.path if route is not None else "unmatched",
+                status=status
+            )
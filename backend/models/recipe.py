@@ -1,6 +1,6 @@
 # Imports
-from pydantic import BaseModel
-from typing import List, Optional
+from pydantic import BaseModel, Field
+from typing import List, Literal, Optional
 
 # User Preferences Model
 class UserPreferences(BaseModel):
@@ -47,6 +47,7 @@ class Recipe(BaseModel):
     title: str
     description: str
     cook_time: int
+    servings: Optional[int] = Field(None, ge=1)
     tags: List[str]
     ingredients: List[str]
     steps: List[RecipeStep]
@@ -57,6 +58,41 @@ class RecipeGenerateRequest(BaseModel):
     preferences: UserPreferences
     existing_recipes: List[str] = []
     
+# Batch Recipe Generation Request
+class RecipeBatchRequest(BaseModel):
+    preferences: UserPreferences
+    count: int = Field(5, ge=1, le=7)
+
+# Batch Recipe Generation Response
+class RecipeBatchResponse(BaseModel):
+    recipes: List[Recipe]
+
+# Bulk Save Request
+class RecipeBulkSaveRequest(BaseModel):
+    recipes: List[Recipe] = Field(..., min_length=1, max_length=100)
+
+# Bulk Unsave Request
+class RecipeBulkUnsaveRequest(BaseModel):
+    recipe_ids: List[str] = Field(..., min_length=1, max_length=100)
+
+# Recipe Search Query Parameters (Terms Match Title, Tags and Ingredients; Bounds are Inclusive)
+class RecipeSearchQuery(BaseModel):
+    q: str = Field("", max_length=200)
+    source: Literal["all", "saved", "history"] = "all"
+    sort: Literal["relevance", "newest", "cook_time", "calories", "protein"] = "relevance"
+    view: Literal["summary", "full"] = "summary"
+    limit: int = Field(20, ge=1, le=100)
+    min_cook_time: Optional[int] = Field(None, ge=0)
+    max_cook_time: Optional[int] = Field(None, ge=0)
+    min_calories: Optional[int] = Field(None, ge=0)
+    max_calories: Optional[int] = Field(None, ge=0)
+    min_protein: Optional[int] = Field(None, ge=0)
+    max_protein: Optional[int] = Field(None, ge=0)
+    min_carbs: Optional[int] = Field(None, ge=0)
+    max_carbs: Optional[int] = Field(None, ge=0)
+    min_fat: Optional[int] = Field(None, ge=0)
+    max_fat: Optional[int] = Field(None, ge=0)
+
 # Recipe Modification Request
 class RecipeModifyRequest(BaseModel):
     original_recipe: dict
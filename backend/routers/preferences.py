@@ -1,33 +1,44 @@
 # Imports
-from fastapi import APIRouter, HTTPException, Depends
+from fastapi import APIRouter, HTTPException, Depends, Header, Response
+from typing import Optional
 from models.recipe import UserPreferences
-from services.supabaseClient import get_supabase
+from services.preferenceService import preferenceService
+from services import resourceVersions
 from middleware.auth import verify_token
 
 router = APIRouter(prefix="/preferences", tags=["preferences"])
 
+# Created per Worker Process in the App Lifespan
+preference_service: preferenceService = None
+
+# Open the Preference Cache
+async def startup():
+    global preference_service
+    preference_service = preferenceService()
+
+# Close the Preference Cache
+async def shutdown():
+    preference_service.close()
+
 # Get User Preferences
 @router.get("", response_model=UserPreferences)
-async def get_preferences(user_id: str = Depends(verify_token)):
+async def get_preferences(
+    response: Response,
+    if_none_match: Optional[str] = Header(None),
+    user_id: str = Depends(verify_token)
+):
     try:
-        supabase = get_supabase()
         
-        # Get User Preferences
-        response = supabase.table('user_preferences') \
-            .select('*') \
-            .eq('user_id', user_id) \
-            .single() \
-            .execute()
+        # Unchanged Since the Client's Copy
+        etag = resourceVersions.etag(user_id, "preferences")
+        if resourceVersions.not_modified(if_none_match, etag):
+            return Response(status_code=304, headers=resourceVersions.headers(etag))
         
         # Return Preferences or Default
-        if response.data:
-            return UserPreferences(**response.data)
-        else:
-            return UserPreferences()
+        response.headers.update(resourceVersions.headers(etag))
+        return await preference_service.get_preferences(user_id)
     
     except Exception as e:
-        if "PGRST116" in str(e):
-            return UserPreferences()
         raise HTTPException(status_code=500, detail=str(e))
 
 # Update User Preferences
@@ -37,28 +48,11 @@ async def update_preferences(
     user_id: str = Depends(verify_token)
 ):
     try:
-        supabase = get_supabase()
-        
-        # Check for Preferences
-        existing = supabase.table('user_preferences') \
-            .select('id') \
-            .eq('user_id', user_id) \
-            .execute()
-        
-        pref_dict = preferences.model_dump()
-        pref_dict['user_id'] = user_id
         
-        # Update or Insert Preferences
-        if existing.data:
-            response = supabase.table('user_preferences') \
-                .update(pref_dict) \
-                .eq('user_id', user_id) \
-                .execute()
-        else:
-            response = supabase.table('user_preferences') \
-                .insert(pref_dict) \
-                .execute()
-        return UserPreferences(**response.data[0])
+        # Insert or Update Preferences
+        updated = await preference_service.update_preferences(user_id, preferences)
+        resourceVersions.bump(user_id, "preferences")
+        return updated
     
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
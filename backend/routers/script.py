@@ -1,70 +1,380 @@
 # Imports
-from fastapi import APIRouter, HTTPException, Depends
-from models.recipe import Recipe, RecipeGenerateRequest, RecipeModifyRequest
+from fastapi import APIRouter, HTTPException, Depends, Query, Header, BackgroundTasks
+from fastapi.responses import Response, StreamingResponse
+from models.recipe import Recipe, RecipeGenerateRequest, RecipeBatchRequest, RecipeBatchResponse, RecipeModifyRequest, RecipeBulkSaveRequest, RecipeBulkUnsaveRequest, RecipeSearchQuery
 from services.recipeService import recipeService
 from services.imageService import imageService
+from services.recipePool import RecipePool
 from services.supabaseClient import get_supabase
+from services.pipeline import Pipeline
+from services.streamParser import RecipeStreamParser
+from services.jobQueue import JobQueue, QueueFull, UserLimitExceeded
+from services.noveltyIndex import NoveltyIndex
+from services.recipeIndex import RecipeIndex, NUMERIC_FIELDS
+from services.stubProviders import STUB_MODE
+from services.webhooks import check_url, UnsafeCallback
+from services import resourceVersions
+from services.serialization import FastJSONResponse, dumps
 from middleware.auth import verify_token
+from typing import Annotated, Literal, Optional
 import uuid
 import json
+import time
+import base64
+import asyncio
+import logging
+from datetime import datetime
+
+logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/recipes", tags=["recipes"])
-recipe_service = recipeService()
-image_service = imageService()
 
-# Generate Recipe Endpoint
+# Services (Created per Worker Process in the App Lifespan, so No Client or Connection Crosses a Fork)
+recipe_service: recipeService = None
+image_service: imageService = None
+recipe_pool: RecipePool = None
+novelty_index: NoveltyIndex = None
+recipe_index: RecipeIndex = None
+job_queue: JobQueue = None
+
+# Concurrent Single-Recipe Calls Used to Replace Batch Duplicates
+BATCH_TOP_UP_CONCURRENCY = 3
+
+# Maximum History Rows Loaded into a User's Novelty Index
+NOVELTY_HISTORY_LIMIT = 5000
+
+# Load a User's History Fingerprint Fields (Oldest First; Only Rows Stored at or After since When Given)
+async def _load_history(user_id: str, since: Optional[str] = None) -> list:
+
+    supabase = await get_supabase()
+    query = supabase.table('recipe_history') \
+        .select('title:recipe_title, tags:recipe_data->tags, ingredients:recipe_data->ingredients, created_at') \
+        .eq('user_id', user_id)
+    if since:
+        query = query.gte('created_at', since)
+    history_response = await query \
+        .order('created_at', desc=True) \
+        .limit(NOVELTY_HISTORY_LIMIT) \
+        .execute()
+    
+    return list(reversed(history_response.data))
+
+# Get the User's Novelty Index (History is Queried Only on an Index Miss or After Another Worker Stored Recipes)
+async def _novelty(user_id: str):
+    return await novelty_index.get(user_id, _load_history, resourceVersions.current(user_id, "history"))
+
+# Bump the History Version After an Insert (This Worker's Index Already Holds the New Recipes)
+def _history_stored(user_id: str):
+    before = resourceVersions.current(user_id, "history")
+    novelty_index.advance(user_id, before, resourceVersions.bump(user_id, "history"))
+
+# Store Generated Recipe in History (Runs After Response is Sent)
+async def _store_history(user_id: str, recipe: Recipe):
+    recipe_data = recipe.model_dump(mode="json")
+    novelty_index.add(user_id, recipe_data)
+    try:
+        supabase = await get_supabase()
+        await supabase.table('recipe_history').insert({
+            'user_id': user_id,
+            'recipe_title': recipe.title,
+            'recipe_data': recipe_data
+        }).execute()
+        _history_stored(user_id)
+        recipe_index.add(user_id, [(recipe_data, "history", None)])
+    except Exception as e:
+        logger.warning("Failed to store recipe history: %s", e)
+
+# Run the Generation Pipeline (History, LLM, Image) for a User
+async def _generate(user_id: str, preferences) -> tuple:
+
+    # Build Generation Pipeline
+    pipeline = Pipeline() \
+        .stage("history", lambda: _novelty(user_id)) \
+        .stage("llm", lambda history: recipe_pool.get_recipe(
+            preferences=preferences,
+            existing_recipes=history.avoid_summary(),
+            is_duplicate=lambda recipe_data: novelty_index.is_duplicate(history, recipe_data)
+        ), depends_on=["history"]) \
+        .stage("image", lambda llm: image_service.get_recipe_image(
+            llm["title"],
+            llm["tags"],
+            llm["ingredients"]
+        ), depends_on=["llm"])
+    
+    # Run Pipeline
+    results = await pipeline.run()
+    
+    # Create Complete Recipe
+    recipe = Recipe(
+        id=str(uuid.uuid4()),
+        image_url=results["image"],
+        **results["llm"]
+    )
+    return recipe, pipeline
+
+# Generation Job Handler (Runs on the Job Queue's Worker Pool)
+async def _run_generate_job(job) -> dict:
+
+    recipe, _ = await _generate(job.user_id, RecipeGenerateRequest(**job.payload).preferences)
+    await _store_history(job.user_id, recipe)
+    return recipe.model_dump(mode="json")
+
+# Create Service Clients and Start Background Workers
+async def startup():
+    global recipe_service, image_service, recipe_pool, novelty_index, recipe_index, job_queue
+    recipe_service = recipeService()
+    image_service = imageService()
+    recipe_pool = RecipePool(recipe_service)
+    novelty_index = NoveltyIndex()
+    recipe_index = RecipeIndex(":memory:" if STUB_MODE else None)
+    job_queue = JobQueue(_run_generate_job)
+    recipe_pool.start()
+    job_queue.start()
+
+# Stop Background Workers and Close Service Clients
+async def shutdown():
+    await job_queue.stop()
+    await recipe_pool.stop()
+    await recipe_service.close()
+    await image_service.close()
+    recipe_index.close()
+
+# Generate Recipe Endpoint (async=true Queues a Job and Returns its ID)
 @router.post("/generate", response_model=Recipe)
 async def generate_recipe(
     request: RecipeGenerateRequest,
+    background_tasks: BackgroundTasks,
+    run_async: bool = Query(False, alias="async"),
+    callback_url: Optional[str] = Query(None, pattern=r"^https?://"),
     user_id: str = Depends(verify_token)
 ):
+    # Queue Job (Callback URLs Must Point at a Public, Allowed Host)
+    if run_async:
+        try:
+            if callback_url:
+                check_url(callback_url)
+            job = job_queue.submit(user_id, request.model_dump(mode="json"), callback_url)
+        except UnsafeCallback as e:
+            raise HTTPException(status_code=400, detail=str(e))
+        except UserLimitExceeded as e:
+            raise HTTPException(status_code=429, detail=str(e))
+        except QueueFull as e:
+            raise HTTPException(status_code=503, detail=str(e), headers={"Retry-After": "5"})
+        return FastJSONResponse(
+            status_code=202,
+            content={"job_id": job.id, "status": job.status, "status_url": f"/recipes/jobs/{job.id}"}
+        )
+
     try:
-        supabase = get_supabase()
+        recipe, pipeline = await _generate(user_id, request.preferences)
         
-        # Get Previous 10 User Recipes to Avoid Duplicates
-        history_response = supabase.table('recipe_history') \
-            .select('recipe_title') \
-            .eq('user_id', user_id) \
-            .order('created_at', desc=True) \
-            .limit(10) \
-            .execute()
+        # Store in Recipe History Off the Response Path
+        background_tasks.add_task(_store_history, user_id, recipe)
         
-        existing_recipes = [item['recipe_title'] for item in history_response.data]
+        # Return Recipe (Serialized Once, Without Response Model Re-Validation)
+        return FastJSONResponse(recipe, headers={"Server-Timing": pipeline.server_timing()})
+    
+    # Handle Errors
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
 
-        # Generate Recipe with Groq
-        recipe_data = recipe_service.generate_recipe(
-            preferences=request.preferences,
-            existing_recipes=existing_recipes
-        )
-        
-        # Get Image from Unsplash
-        image_url = image_service.get_recipe_image(
-            recipe_data["title"],
-            recipe_data["tags"],
-            recipe_data["ingredients"]
-        )
-        
-        # Create Complete Recipe
-        recipe = Recipe(
-            id=str(uuid.uuid4()),
-            image_url=image_url,
-            **recipe_data
-        )
-        
-        # Store in Recipe History
-        supabase.table('recipe_history').insert({
-            'user_id': user_id,
-            'recipe_title': recipe.title,
-            'recipe_data': json.loads(recipe.model_dump_json())
-        }).execute()
-        
-        # Return Recipe
-        return recipe
+# Job Status Endpoint (wait > 0 Long-Polls Until the Job Finishes)
+@router.get("/jobs/{job_id}")
+async def get_job(
+    job_id: str,
+    wait: float = Query(0, ge=0, le=60),
+    user_id: str = Depends(verify_token)
+):
+    job = job_queue.get(job_id, user_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="Job not found")
     
+    await job_queue.wait(job, wait)
+    return job.to_dict()
+
+# Generate Distinct Recipes for a Batch
+async def _generate_distinct(preferences, count: int, novelty) -> list:
+
+    existing_recipes = novelty.avoid_summary()
+    seen = set()
+    recipes = []
+
+    # Keep Valid Recipes with Unseen Titles
+    def accept(candidates: list):
+        for recipe_data in candidates:
+            if len(recipes) >= count or not isinstance(recipe_data, dict):
+                continue
+            try:
+                Recipe(id="", image_url="", **recipe_data)
+            except Exception:
+                continue
+            if recipe_data["title"].lower() not in seen and not novelty_index.is_duplicate(novelty, recipe_data):
+                seen.add(recipe_data["title"].lower())
+                recipes.append(recipe_data)
+
+    # One Request for the Whole Batch (if it Fails, the Top-Up Generates Every Recipe Individually)
+    batch_error = None
+    try:
+        accept(await recipe_service.generate_recipes(preferences, count, existing_recipes))
+    except Exception as e:
+        batch_error = e
+        logger.warning("Batch generation failed (%s), generating %d recipes individually", e, count)
+
+    # Bounded Concurrent Top-Up for Duplicates or Invalid Entries
+    semaphore = asyncio.Semaphore(BATCH_TOP_UP_CONCURRENCY)
+
+    async def top_up():
+        async with semaphore:
+            try:
+                return await recipe_service.generate_recipe(
+                    preferences=preferences,
+                    existing_recipes=existing_recipes + [recipe["title"] for recipe in recipes]
+                )
+            except Exception:
+                return None
+
+    for _ in range(2):
+        missing = count - len(recipes)
+        if missing <= 0:
+            break
+        accept(await asyncio.gather(*(top_up() for _ in range(missing))))
+
+    if not recipes and batch_error is not None:
+        raise batch_error
+    return recipes
+
+# Generate Recipe Batch Endpoint
+@router.post("/generate/batch", response_model=RecipeBatchResponse)
+async def generate_recipe_batch(
+    request: RecipeBatchRequest,
+    user_id: str = Depends(verify_token)
+):
+    try:
+        supabase = await get_supabase()
+
+        # Build Batch Pipeline
+        pipeline = Pipeline() \
+            .stage("history", lambda: _novelty(user_id)) \
+            .stage("llm", lambda history: _generate_distinct(
+                request.preferences,
+                request.count,
+                history
+            ), depends_on=["history"]) \
+            .stage("images", lambda llm: asyncio.gather(*(
+                image_service.get_recipe_image(
+                    recipe_data["title"],
+                    recipe_data["tags"],
+                    recipe_data["ingredients"]
+                )
+                for recipe_data in llm
+            )), depends_on=["llm"])
+
+        # Run Pipeline
+        results = await pipeline.run()
+
+        # Create Complete Recipes
+        recipes = [
+            Recipe(id=str(uuid.uuid4()), image_url=image_url, **recipe_data)
+            for recipe_data, image_url in zip(results["llm"], results["images"])
+        ]
+
+        # Store All in Recipe History with One Insert
+        if recipes:
+            rows = [
+                {
+                    'user_id': user_id,
+                    'recipe_title': recipe.title,
+                    'recipe_data': recipe.model_dump(mode="json")
+                }
+                for recipe in recipes
+            ]
+            for row in rows:
+                novelty_index.add(user_id, row['recipe_data'])
+            start = time.perf_counter()
+            await supabase.table('recipe_history').insert(rows).execute()
+            _history_stored(user_id)
+            recipe_index.add(user_id, [(row['recipe_data'], "history", None) for row in rows])
+            pipeline.timings["persist"] = (time.perf_counter() - start) * 1000
+
+        # Return Recipes
+        return FastJSONResponse(RecipeBatchResponse(recipes=recipes), headers={"Server-Timing": pipeline.server_timing()})
+
     # Handle Errors
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
+# Format Server-Sent Event
+def _sse(event: str, data) -> str:
+    return f"event: {event}\ndata: {dumps(data)}\n\n"
+
+# Stream Recipe Generation Endpoint
+@router.post("/generate/stream")
+async def generate_recipe_stream(
+    request: RecipeGenerateRequest,
+    user_id: str = Depends(verify_token)
+):
+    try:
+        existing_recipes = (await _novelty(user_id)).avoid_summary()
+
+    # Handle Errors
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+    # Emit Each Field as Soon as it is Parsed (Except Macros)
+    async def events():
+        parser = RecipeStreamParser()
+        image_task = None
+        try:
+            async for chunk in recipe_service.stream_recipe(
+                preferences=request.preferences,
+                existing_recipes=existing_recipes
+            ):
+                for event, value in parser.feed(chunk):
+
+                    # Macros May be Corrected by the Nutrition Check, so They Arrive Only in the Final Recipe
+                    if event == "macros":
+                        continue
+                    yield _sse(event, value)
+
+                    # Start Image Lookup Once Tags are Known
+                    if event == "tags":
+                        image_task = asyncio.create_task(image_service.get_recipe_image(
+                            parser.fields.get("title", ""),
+                            value
+                        ))
+
+            # Image Lookup if Tags Never Arrived Separately
+            if image_task is None:
+                image_task = asyncio.create_task(image_service.get_recipe_image(
+                    parser.fields.get("title", ""),
+                    parser.fields.get("tags", [])
+                ))
+            image_url = await image_task
+            yield _sse("image", image_url)
+
+            # Fill Any Fields Lost to Malformed or Truncated Output (Keeping Steps Already Sent), Then Send Complete Recipe
+            recipe_data = await recipe_service.ensure_complete(parser.fields, partial_steps=parser.steps_truncated)
+            recipe = Recipe(
+                id=str(uuid.uuid4()),
+                image_url=image_url,
+                **recipe_data
+            )
+            yield _sse("recipe", recipe.model_dump(mode="json"))
+            await _store_history(user_id, recipe)
+
+        # Report Errors as an Event (Headers are Already Sent)
+        except Exception as e:
+            yield _sse("error", str(e))
+        finally:
+            if image_task is not None and not image_task.done():
+                image_task.cancel()
+
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
 # Modify Recipe Endpoint
 @router.post("/modify", response_model=Recipe)
 async def modify_recipe(
@@ -74,7 +384,7 @@ async def modify_recipe(
     try:
 
         # Modify Recipe with Groq
-        modified_data = recipe_service.modify_recipe(
+        modified_data = await recipe_service.modify_recipe(
             request.original_recipe,
             request.modification
         )
@@ -83,36 +393,110 @@ async def modify_recipe(
         recipe = Recipe(**modified_data)
 
         # Return Recipe
-        return recipe
+        return FastJSONResponse(recipe)
     
     # Handle Errors
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
+# Summary Projection for Recipe Lists
+SUMMARY_COLUMNS = ", ".join([
+    "id",
+    "created_at",
+    "recipe_id:recipe_data->>id",
+    "title:recipe_data->>title",
+    "image_url:recipe_data->>image_url",
+    "cook_time:recipe_data->cook_time",
+    "macros:recipe_data->macros",
+])
+MAX_PAGE_SIZE = 100
+
+# Encode Opaque Cursor from Last Row of a Page
+def _encode_cursor(row: dict) -> str:
+    raw = json.dumps([row['created_at'], row['id']]).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+# Decode Opaque Cursor (Values are Re-Serialised from a Parsed Timestamp and UUID, so Nothing from the Client Reaches the Filter String)
+def _decode_cursor(cursor: str) -> tuple:
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        created_at, row_id = json.loads(raw)
+        return datetime.fromisoformat(created_at).isoformat(timespec="microseconds"), str(uuid.UUID(row_id))
+    except Exception:
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+
+# Get Page of Recipes Ordered Newest First (Keyset on created_at, id)
+# (Answers 304 Without Querying When the Client's ETag Matches the Resource's Current Version)
+async def _recipe_page(table: str, resource: str, user_id: str, limit: int, cursor: Optional[str], view: str, if_none_match: Optional[str]) -> Response:
+
+    position = _decode_cursor(cursor) if cursor else None
+    etag = resourceVersions.etag(user_id, resource, limit, cursor, view)
+    if resourceVersions.not_modified(if_none_match, etag):
+        return Response(status_code=304, headers=resourceVersions.headers(etag))
+
+    supabase = await get_supabase()
+    query = supabase.table(table) \
+        .select('*' if view == "full" else SUMMARY_COLUMNS) \
+        .eq('user_id', user_id)
+
+    # Rows Strictly After the Cursor
+    if position:
+        created_at, row_id = position
+        query = query.or_(
+            f'created_at.lt."{created_at}",and(created_at.eq."{created_at}",id.lt."{row_id}")'
+        )
+
+    # Fetch One Extra Row to Detect a Next Page
+    response = await query \
+        .order('created_at', desc=True) \
+        .order('id', desc=True) \
+        .limit(limit + 1) \
+        .execute()
+
+    rows = response.data[:limit]
+    next_cursor = _encode_cursor(rows[-1]) if len(response.data) > limit else None
+    return FastJSONResponse({"recipes": rows, "next_cursor": next_cursor}, headers=resourceVersions.headers(etag))
+
 # Get Recipe History Endpoint
 @router.get("/history")
 async def get_recipe_history(
-    limit: int = 50,
+    limit: int = Query(50, ge=1, le=MAX_PAGE_SIZE),
+    cursor: Optional[str] = None,
+    view: Literal["summary", "full"] = "summary",
+    if_none_match: Optional[str] = Header(None),
     user_id: str = Depends(verify_token)
 ):
     try:
-        supabase = get_supabase()
         
-        # Get Recipe History
-        response = supabase.table('recipe_history') \
-            .select('*') \
-            .eq('user_id', user_id) \
-            .order('created_at', desc=True) \
-            .limit(limit) \
-            .execute()
-        
-        # Return Recipes
-        return {"recipes": response.data}
+        # Return Page of Recipes
+        return await _recipe_page('recipe_history', "history", user_id, limit, cursor, view, if_none_match)
     
     # Handle Errors
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
+# Insert Saved Recipes in One Call, Skipping Ones Already Saved
+# (Requires a Unique Constraint on saved_recipes (user_id, recipe_id))
+async def _upsert_saved(supabase, user_id: str, recipes: list):
+    return await supabase.table('saved_recipes').upsert(
+        [
+            {
+                'user_id': user_id,
+                'recipe_id': recipe.id,
+                'recipe_data': recipe.model_dump(mode="json")
+            }
+            for recipe in recipes
+        ],
+        on_conflict='user_id,recipe_id',
+        ignore_duplicates=True
+    ).execute()
+
+# Add Rows the Upsert Actually Inserted to the Search Index (Ignored Duplicates Come Back Empty)
+def _index_saved(user_id: str, rows: list):
+    recipe_index.add(user_id, [(row['recipe_data'], "saved", row.get('created_at')) for row in rows])
+
 # Save Recipe Endpoint
 @router.post("/save")
 async def save_recipe(
@@ -120,24 +504,14 @@ async def save_recipe(
     user_id: str = Depends(verify_token)
 ):
     try:
-        supabase = get_supabase()
-        
-        # Check if Recipe is Saved
-        existing = supabase.table('saved_recipes') \
-            .select('id') \
-            .eq('user_id', user_id) \
-            .eq('recipe_id', recipe.id) \
-            .execute()
+        supabase = await get_supabase()
         
-        if existing.data:
+        # Insert Unless Already Saved (Unique on user_id, recipe_id)
+        response = await _upsert_saved(supabase, user_id, [recipe])
+        if not response.data:
             raise HTTPException(status_code=400, detail="Recipe already saved")
-        
-        # Save Recipe
-        supabase.table('saved_recipes').insert({
-            'user_id': user_id,
-            'recipe_id': recipe.id,
-            'recipe_data': json.loads(recipe.model_dump_json())
-        }).execute()
+        resourceVersions.bump(user_id, "saved")
+        _index_saved(user_id, response.data)
         
         return {"message": "Recipe saved successfully"}
     
@@ -154,14 +528,16 @@ async def unsave_recipe(
     user_id: str = Depends(verify_token)
 ):
     try:
-        supabase = get_supabase()
+        supabase = await get_supabase()
         
         # Unsave Recipe
-        supabase.table('saved_recipes') \
+        await supabase.table('saved_recipes') \
             .delete() \
             .eq('user_id', user_id) \
             .eq('recipe_id', recipe_id) \
             .execute()
+        resourceVersions.bump(user_id, "saved")
+        recipe_index.remove_saved(user_id, [recipe_id])
         
         return {"message": "Recipe removed from saved"}
     
@@ -169,23 +545,158 @@ async def unsave_recipe(
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
+# Bulk Save Endpoint
+@router.post("/save/bulk")
+async def save_recipes_bulk(
+    request: RecipeBulkSaveRequest,
+    user_id: str = Depends(verify_token)
+):
+    try:
+        supabase = await get_supabase()
+        
+        # One Upsert for Every Distinct Recipe
+        recipes = list({recipe.id: recipe for recipe in request.recipes}.values())
+        response = await _upsert_saved(supabase, user_id, recipes)
+        if response.data:
+            resourceVersions.bump(user_id, "saved")
+        _index_saved(user_id, response.data)
+        
+        return {"saved": len(response.data), "already_saved": len(recipes) - len(response.data)}
+    
+    # Handle Errors
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+# Bulk Unsave Endpoint
+@router.post("/unsave/bulk")
+async def unsave_recipes_bulk(
+    request: RecipeBulkUnsaveRequest,
+    user_id: str = Depends(verify_token)
+):
+    try:
+        supabase = await get_supabase()
+        
+        # One Delete for Every Listed Recipe
+        recipe_ids = list(set(request.recipe_ids))
+        response = await supabase.table('saved_recipes') \
+            .delete() \
+            .eq('user_id', user_id) \
+            .in_('recipe_id', recipe_ids) \
+            .execute()
+        if response.data:
+            resourceVersions.bump(user_id, "saved")
+        recipe_index.remove_saved(user_id, recipe_ids)
+        
+        return {"removed": len(response.data)}
+    
+    # Handle Errors
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+# Saved Recipe IDs Endpoint (Compact Sync of Saved State)
+@router.get("/saved/ids")
+async def get_saved_recipe_ids(
+    if_none_match: Optional[str] = Header(None),
+    user_id: str = Depends(verify_token)
+):
+    try:
+        
+        # Unchanged Since the Client's Copy
+        etag = resourceVersions.etag(user_id, "saved", "ids")
+        if resourceVersions.not_modified(if_none_match, etag):
+            return Response(status_code=304, headers=resourceVersions.headers(etag))
+        
+        supabase = await get_supabase()
+        response = await supabase.table('saved_recipes') \
+            .select('recipe_id') \
+            .eq('user_id', user_id) \
+            .order('created_at', desc=True) \
+            .execute()
+        
+        return FastJSONResponse({"recipe_ids": [row['recipe_id'] for row in response.data]}, headers=resourceVersions.headers(etag))
+    
+    # Handle Errors
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
 # Get Saved Recipes Endpoint
 @router.get("/saved")
 async def get_saved_recipes(
+    limit: int = Query(50, ge=1, le=MAX_PAGE_SIZE),
+    cursor: Optional[str] = None,
+    view: Literal["summary", "full"] = "summary",
+    if_none_match: Optional[str] = Header(None),
     user_id: str = Depends(verify_token)
 ):
     try:
-        supabase = get_supabase()
         
-        # Get Saved Recipes
-        response = supabase.table('saved_recipes') \
-            .select('*') \
+        # Return Page of Saved Recipes
+        return await _recipe_page('saved_recipes', "saved", user_id, limit, cursor, view, if_none_match)
+    
+    # Handle Errors
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+# Most Rows per Table Indexed When a User First Searches
+SEARCH_BACKFILL_LIMIT = 5000
+
+# Load a User's Saved and History Recipes for the Search Index
+async def _load_searchable(user_id: str) -> list:
+
+    supabase = await get_supabase()
+    saved_response, history_response = await asyncio.gather(
+        supabase.table('saved_recipes') \
+            .select('recipe_data, created_at') \
+            .eq('user_id', user_id) \
+            .limit(SEARCH_BACKFILL_LIMIT) \
+            .execute(),
+        supabase.table('recipe_history') \
+            .select('recipe_data, created_at') \
             .eq('user_id', user_id) \
             .order('created_at', desc=True) \
+            .limit(SEARCH_BACKFILL_LIMIT) \
             .execute()
-        
-        return {"recipes": response.data}
-    
+    )
+
+    return [(row['recipe_data'], "history", row['created_at']) for row in history_response.data] + \
+        [(row['recipe_data'], "saved", row['created_at']) for row in saved_response.data]
+
+# Search Hit in the Shape of a History or Saved List Row
+def _search_hit(hit: dict, view: str) -> dict:
+    recipe_data = hit['recipe_data']
+    fields = recipe_data if view == "full" else {
+        "recipe_id": recipe_data.get("id"),
+        "title": recipe_data.get("title"),
+        "image_url": recipe_data.get("image_url"),
+        "cook_time": recipe_data.get("cook_time"),
+        "tags": recipe_data.get("tags"),
+        "macros": recipe_data.get("macros"),
+    }
+    return {**fields, "saved": hit['saved'], "in_history": hit['in_history'], "score": hit['score']}
+
+# Search Saved and History Recipes (Local Index; No Generation Cost)
+@router.get("/search")
+async def search_recipes(
+    query: Annotated[RecipeSearchQuery, Query()],
+    user_id: str = Depends(verify_token)
+):
+    try:
+
+        # Index Existing Recipes on a User's First Search
+        await recipe_index.ensure(user_id, _load_searchable)
+
+        hits = recipe_index.search(
+            user_id,
+            query.q,
+            filters=query.model_dump(include={f"{bound}_{field}" for bound in ("min", "max") for field in NUMERIC_FIELDS}),
+            source=query.source,
+            sort=query.sort,
+            limit=query.limit
+        )
+        return FastJSONResponse({"recipes": [_search_hit(hit, query.view) for hit in hits]})
+
     # Handle Errors
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
@@ -196,8 +707,8 @@ async def test_generation():
     try:
 
         from models.recipe import UserPreferences
-        recipe_data = recipe_service.generate_recipe(preferences=UserPreferences())
-        image_url = image_service.get_recipe_image(recipe_data["title"], recipe_data["ingredients"])
+        recipe_data = await recipe_service.generate_recipe(preferences=UserPreferences())
+        image_url = await image_service.get_recipe_image(recipe_data["title"], recipe_data["tags"])
         
         return {
             "status": "success",
@@ -207,3 +718,40 @@ async def test_generation():
     
     except Exception as e:
         return {"status": "error", "message": str(e)}
+
+# Get Full Recipe Endpoint
+@router.get("/{recipe_id}", response_model=Recipe)
+async def get_recipe(
+    recipe_id: str,
+    user_id: str = Depends(verify_token)
+):
+    try:
+        supabase = await get_supabase()
+        
+        # Look in Saved Recipes First
+        response = await supabase.table('saved_recipes') \
+            .select('recipe_data') \
+            .eq('user_id', user_id) \
+            .eq('recipe_id', recipe_id) \
+            .limit(1) \
+            .execute()
+        
+        # Then Recipe History
+        if not response.data:
+            response = await supabase.table('recipe_history') \
+                .select('recipe_data') \
+                .eq('user_id', user_id) \
+                .eq('recipe_data->>id', recipe_id) \
+                .limit(1) \
+                .execute()
+        
+        if not response.data:
+            raise HTTPException(status_code=404, detail="Recipe not found")
+        
+        return FastJSONResponse(response.data[0]['recipe_data'])
+    
+    # Handle Errors
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
@@ -0,0 +1,97 @@
+# Run from backend/: python serve.py
+# Imports
+import os
+import time
+import signal
+import socket
+import logging
+import uvicorn
+
+logger = logging.getLogger("serve")
+
+# Workers Exiting Sooner than this After Starting are Restarted After a Delay
+MIN_WORKER_LIFETIME = 1.0
+
+# Listening Socket Shared by Every Worker
+def bind(host: str, port: int) -> socket.socket:
+    sock = socket.socket(socket.AF_INET6 if ":" in host else socket.AF_INET, socket.SOCK_STREAM)
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+    sock.bind((host, port))
+    sock.listen(int(os.getenv("BACKLOG", "2048")))
+    return sock
+
+# Fork a Worker Serving the Preloaded App (its Lifespan Creates the Worker's Clients)
+def spawn(app, sock: socket.socket) -> int:
+
+    pid = os.fork()
+    if pid:
+        return pid
+
+    # Own Process Group so a Terminal Ctrl-C Reaches Only the Master, which Stops Workers Once
+    os.setpgid(0, 0)
+    signal.signal(signal.SIGTERM, signal.SIG_DFL)
+    signal.signal(signal.SIGINT, signal.SIG_DFL)
+    config = uvicorn.Config(app, timeout_keep_alive=int(os.getenv("KEEP_ALIVE", "5")))
+    uvicorn.Server(config).run(sockets=[sock])
+    os._exit(0)
+
+# Prefork Master: Preload, Bind, Fork Workers and Restart Any that Die
+def run():
+
+    # Import the App and its Heavy Dependencies Once; Forked Workers Share them Copy-on-Write
+    from main import app
+    from services.stubProviders import STUB_MODE
+    if not STUB_MODE:
+        import supabase  # noqa: F401
+
+    workers = int(os.getenv("WEB_CONCURRENCY", str(os.cpu_count() or 1)))
+    host = os.getenv("HOST", "0.0.0.0")
+    port = int(os.getenv("PORT", "8000"))
+
+    # Image, Preference, Token and Job Caches are Shared Through One SQLite File
+    if workers > 1:
+        os.environ.setdefault("SHARED_CACHE_PATH", "shared_cache.db")
+
+    # Each Worker Takes an Equal Slice of Every Provider Quota
+    os.environ["UPSTREAM_WORKERS"] = str(workers)
+
+    sock = bind(host, port)
+    children = {}
+    stopping = False
+
+    def stop(signum, frame):
+        nonlocal stopping
+        stopping = True
+        for pid in list(children):
+            try:
+                os.kill(pid, signal.SIGTERM)
+            except ProcessLookupError:
+                pass
+
+    signal.signal(signal.SIGTERM, stop)
+    signal.signal(signal.SIGINT, stop)
+
+    logger.info("Serving on %s:%s with %s workers", host, port, workers)
+    for _ in range(workers):
+        children[spawn(app, sock)] = time.monotonic()
+
+    # Supervise Until Every Worker has Exited
+    while children:
+        try:
+            pid, status = os.wait()
+        except ChildProcessError:
+            break
+        started = children.pop(pid, None)
+        if started is None or stopping:
+            continue
+
+        logger.warning("Worker %s exited with code %s, restarting", pid, os.waitstatus_to_exitcode(status))
+        if time.monotonic() - started < MIN_WORKER_LIFETIME:
+            time.sleep(MIN_WORKER_LIFETIME)
+        if not stopping:
+            children[spawn(app, sock)] = time.monotonic()
+
+    sock.close()
+
+if __name__ == "__main__":
+    run()
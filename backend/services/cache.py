@@ -0,0 +1,58 @@
+# Imports
+import time
+from collections import OrderedDict
+from typing import Any, Hashable, Optional
+
+# Sentinel for Missing Entries
+MISSING = object()
+
+# In-Memory Cache with Per-Entry TTL and LRU Eviction
+class TTLCache:
+
+    # Constructor
+    def __init__(self, maxsize: int = 1024, ttl: float = 300):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.entries: "OrderedDict[Hashable, tuple]" = OrderedDict()
+        self.stats = {"hits": 0, "misses": 0, "evictions": 0}
+
+    # Get Value or MISSING if Absent or Expired
+    def get(self, key: Hashable) -> Any:
+
+        entry = self.entries.get(key)
+        if entry is None:
+            self.stats["misses"] += 1
+            return MISSING
+
+        value, expires_at = entry
+        if expires_at <= time.monotonic():
+            del self.entries[key]
+            self.stats["misses"] += 1
+            return MISSING
+
+        self.entries.move_to_end(key)
+        self.stats["hits"] += 1
+        return value
+
+    # Store Value with Default or Custom TTL
+    def set(self, key: Hashable, value: Any, ttl: Optional[float] = None):
+
+        self.entries[key] = (value, time.monotonic() + (self.ttl if ttl is None else ttl))
+        self.entries.move_to_end(key)
+
+        # Evict Least Recently Used Entries
+        while len(self.entries) > self.maxsize:
+            self.entries.popitem(last=False)
+            self.stats["evictions"] += 1
+
+    # Remove Entry
+    def delete(self, key: Hashable):
+        self.entries.pop(key, None)
+
+    # Current Metrics
+    def metrics(self) -> dict:
+        return {**self.stats, "size": len(self.entries)}
+
+    # Nothing to Release (Matches SharedCache)
+    def close(self):
+        pass
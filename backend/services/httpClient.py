@@ -0,0 +1,59 @@
+# Imports
+import os
+import httpx
+
+# HTTP/2 Requires the Optional h2 Package
+try:
+    import h2  # noqa: F401
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
+# Per-Upstream Connection Statistics
+connection_stats = {}
+
+# Record Whether Each Request Opened a New Connection
+def _trace_hook(name: str):
+
+    stats = connection_stats.setdefault(name, {"requests": 0, "new_connections": 0})
+
+    async def trace(event: str, info: dict):
+        if event == "connection.connect_tcp.complete":
+            stats["new_connections"] += 1
+
+    async def on_request(request: httpx.Request):
+        stats["requests"] += 1
+        request.extensions["trace"] = trace
+
+    return on_request
+
+# Create a Pooled Keep-Alive Client for One Upstream Host
+def create_client(name: str, timeout: float = 10, **kwargs) -> httpx.AsyncClient:
+
+    prefix = f"HTTP_{name.upper()}_"
+
+    # Pool Settings (Per Upstream, Overridable by Environment)
+    limits = httpx.Limits(
+        max_connections=int(os.getenv(prefix + "MAX_CONNECTIONS", "100")),
+        max_keepalive_connections=int(os.getenv(prefix + "MAX_KEEPALIVE", "20")),
+        keepalive_expiry=float(os.getenv(prefix + "KEEPALIVE_EXPIRY", "60")),
+    )
+    http2 = HTTP2_AVAILABLE and os.getenv(prefix + "HTTP2", "1") == "1"
+
+    return httpx.AsyncClient(
+        timeout=timeout,
+        limits=limits,
+        http2=http2,
+        event_hooks={"request": [_trace_hook(name)]},
+        **kwargs
+    )
+
+# Connection Reuse Metrics
+def metrics() -> dict:
+    return {
+        name: {
+            **stats,
+            "reused": stats["requests"] - stats["new_connections"],
+        }
+        for name, stats in connection_stats.items()
+    }
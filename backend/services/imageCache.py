@@ -0,0 +1,119 @@
+# Imports
+import os
+import json
+import time
+import sqlite3
+from typing import List, Optional
+from services.cache import TTLCache, MISSING
+
+# Key for the Local Fallback Image Pool
+FALLBACK_KEY = "__fallback__"
+
+# Persistent Cache of Unsplash Search Results Keyed on Normalised Query
+class ImageCache:
+
+    # Constructor
+    def __init__(self, path: str = None):
+        self.path = path or os.getenv("IMAGE_CACHE_PATH", "image_cache.db")
+        self.ttl = float(os.getenv("IMAGE_CACHE_TTL", str(7 * 24 * 3600)))
+        self.negative_ttl = float(os.getenv("IMAGE_CACHE_NEGATIVE_TTL", "3600"))
+        self.max_entries = int(os.getenv("IMAGE_CACHE_MAX_ENTRIES", "5000"))
+        self.memory = TTLCache(maxsize=int(os.getenv("IMAGE_CACHE_MEMORY_ENTRIES", "1000")), ttl=self.ttl)
+
+        # On-Disk Store (WAL so Every Worker Process Can Share the File)
+        self.db = sqlite3.connect(self.path, timeout=5, check_same_thread=False)
+        self.db.execute("PRAGMA journal_mode=WAL")
+        self.db.execute("""
+            CREATE TABLE IF NOT EXISTS image_queries (
+                query TEXT PRIMARY KEY,
+                urls TEXT NOT NULL,
+                expires_at REAL NOT NULL,
+                last_used REAL NOT NULL
+            )
+        """)
+        self.db.commit()
+
+    # Normalise Query for Cache Key
+    @staticmethod
+    def normalise(query: str) -> str:
+        return " ".join(query.lower().split())
+
+    # Get Cached Result URLs (Empty List for Negative Hits, None for Misses)
+    def get(self, query: str) -> Optional[List[str]]:
+
+        key = self.normalise(query)
+        urls = self.memory.get(key)
+        if urls is not MISSING:
+            return urls
+
+        # Fall Through to Disk
+        now = time.time()
+        row = self.db.execute(
+            "SELECT urls, expires_at FROM image_queries WHERE query = ?", (key,)
+        ).fetchone()
+        if row is None or row[1] <= now:
+            return None
+
+        urls = json.loads(row[0])
+        self.memory.set(key, urls, ttl=row[1] - now)
+        self.db.execute("UPDATE image_queries SET last_used = ? WHERE query = ?", (now, key))
+        self.db.commit()
+        return urls
+
+    # Store Result URLs (Empty List is Cached Negatively)
+    def set(self, query: str, urls: List[str]):
+
+        key = self.normalise(query)
+        ttl = self.ttl if urls else self.negative_ttl
+        now = time.time()
+        self.memory.set(key, urls, ttl=ttl)
+        self.db.execute(
+            "INSERT OR REPLACE INTO image_queries (query, urls, expires_at, last_used) VALUES (?, ?, ?, ?)",
+            (key, json.dumps(urls), now + ttl, now)
+        )
+        self._prune(now)
+        self.db.commit()
+
+    # Drop Expired and Least Recently Used Rows
+    def _prune(self, now: float):
+        self.db.execute(
+            "DELETE FROM image_queries WHERE expires_at <= ? AND query != ?", (now, FALLBACK_KEY)
+        )
+        self.db.execute("""
+            DELETE FROM image_queries WHERE query IN (
+                SELECT query FROM image_queries ORDER BY last_used DESC LIMIT -1 OFFSET ?
+            ) AND query != ?
+        """, (self.max_entries, FALLBACK_KEY))
+
+    # Locally Held Pool of Random Food Images
+    def fallback_pool(self) -> List[str]:
+
+        urls = self.memory.get(FALLBACK_KEY)
+        if urls is not MISSING:
+            return urls
+
+        row = self.db.execute(
+            "SELECT urls FROM image_queries WHERE query = ?", (FALLBACK_KEY,)
+        ).fetchone()
+        urls = json.loads(row[0]) if row else []
+        self.memory.set(FALLBACK_KEY, urls, ttl=float("inf"))
+        return urls
+
+    # Replace Fallback Pool
+    def set_fallback_pool(self, urls: List[str]):
+        now = time.time()
+        self.memory.set(FALLBACK_KEY, urls, ttl=float("inf"))
+        self.db.execute(
+            "INSERT OR REPLACE INTO image_queries (query, urls, expires_at, last_used) VALUES (?, ?, ?, ?)",
+            (FALLBACK_KEY, json.dumps(urls), float("inf"), now)
+        )
+        self.db.commit()
+
+    # Current Metrics
+    def metrics(self) -> dict:
+        rows = self.db.execute("SELECT COUNT(*) FROM image_queries").fetchone()[0]
+        return {**self.memory.metrics(), "disk_entries": rows}
+
+    # Close On-Disk Store
+    def close(self):
+        self.db.close()
@@ -1,16 +1,40 @@
 # Imports
 import os
-import requests
+import httpx
 import random
+import logging
+from typing import List, Optional
+from services.imageCache import ImageCache
+from services.httpClient import create_client
+from services.singleFlight import SingleFlight
+from services.stubProviders import STUB_MODE, stub_unsplash_client
+from services import telemetry
+from services.telemetry import span
+from services.upstreamGovernor import UpstreamGovernor, UpstreamUnavailable
+
+logger = logging.getLogger(__name__)
+
+# Image Lookups by Outcome (cache_hit, negative_hit, search, fallback)
+IMAGE_LOOKUPS = telemetry.Counter("flavourfinder_image_lookups_total", "Recipe image lookups by outcome.", ("outcome",))
+
+# Unsplash Quota (Demo Apps: 50 Requests per Hour)
+UNSPLASH_RATE = 50 / 3600
+UNSPLASH_BURST = 50
 
 # Image Service Class
 class imageService:
 
-    def __init__(self):
+    def __init__(self, client: httpx.AsyncClient = None):
         self.unsplash_key = os.getenv("UNSPLASH_ACCESS_KEY")
         self.base_url = "https://api.unsplash.com"
+        self.client = client or (stub_unsplash_client() if STUB_MODE else create_client("unsplash"))
+        self.cache = ImageCache(":memory:" if STUB_MODE else None)
+        self.search_flight = SingleFlight("image_search")
+        self.governor = UpstreamGovernor("unsplash", rate=UNSPLASH_RATE, burst=UNSPLASH_BURST)
     
-    def get_recipe_image(self, recipe_title: str, tags: list, ingredients: list = None) -> str:
+    # Build Search Query from Tags or Title
+    @staticmethod
+    def _build_query(recipe_title: str, tags: list) -> str:
         
         visual_tags = [tag for tag in tags if tag.lower()]
         
@@ -26,15 +50,54 @@ class imageService:
             search_terms = recipe_title.lower().split()[:3]
             search_query = " ".join(search_terms) + " meal"
         
-        # Search
-        image_url = self._search_unsplash(search_query)
-        if image_url:
-            return image_url
+        return search_query
+    
+    async def get_recipe_image(self, recipe_title: str, tags: list, ingredients: list = None) -> str:
+        
+        search_query = self._build_query(recipe_title, tags)
+        
+        # Cached Results Page
+        urls = self.cache.get(search_query)
+        if urls is None:
+            IMAGE_LOOKUPS.inc(outcome="search")
+
+            # Search (Shared by Concurrent Lookups of the Same Query)
+            urls = await self.search_flight.do(
+                self.cache.normalise(search_query),
+                lambda: self._search_and_cache(search_query)
+            )
+        
+        else:
+            IMAGE_LOOKUPS.inc(outcome="cache_hit" if urls else "negative_hit")
+        
+        # Select Random Image from Results
+        if urls:
+            random_index = random.randint(0, min(10, len(urls) - 1))
+            logger.debug("Found image (index %d): %s", random_index, urls[random_index])
+            return urls[random_index]
         
         # Fallback Image
         return self._get_fallback_image()
     
-    def _search_unsplash(self, query: str, per_page: int = 15) -> str:
+    # Search and Store Results Page
+    async def _search_and_cache(self, query: str) -> Optional[List[str]]:
+        
+        urls = await self._search_unsplash(query)
+        if urls is not None:
+            self.cache.set(query, urls)
+        return urls
+    
+    # GET Under the Unsplash Governor (Error Statuses Raise)
+    async def _get(self, url: str, params: dict, headers: dict) -> httpx.Response:
+        
+        async def request():
+            response = await self.client.get(url, params=params, headers=headers)
+            response.raise_for_status()
+            return response
+        
+        return await self.governor.call(request)
+    
+    async def _search_unsplash(self, query: str, per_page: int = 15) -> Optional[List[str]]:
         
         # Unsplash Query
         url = f"{self.base_url}/search/photos"
@@ -53,40 +116,40 @@ class imageService:
         try:
 
             # API Call
-            response = requests.get(url, params=params, headers=headers, timeout=10)
+            with span("unsplash", "search"):
+                response = await self._get(url, params, headers)
             
             # Debug Logging
-            print(f"Unsplash search: '{query}' - Status: {response.status_code}")
-            
-            # Handle Errors
-            if response.status_code == 401:
-                print("Authorization failed. Check your Unsplash Access Key.")
-                return None
-            response.raise_for_status()
+            logger.debug("Unsplash search: '%s' - Status: %d", query, response.status_code)
             data = response.json()
             
-            # Select Random Image from Results
-            if data.get("results") and len(data["results"]) > 0:
-                random_index = random.randint(0, min(10, len(data["results"]) - 1))
-                image_url = data["results"][random_index]["urls"]["regular"]
-                print(f"Found image (index {random_index}): {image_url}")
-                return image_url
-            else:
-                print(f"No results found for '{query}'")
-                return None
+            # Collect Result URLs
+            urls = [result["urls"]["regular"] for result in data.get("results") or []]
+            if not urls:
+                logger.info("No results found for '%s'", query)
+            return urls
 
+        # Circuit Open or Over Quota (Caller Falls Back Without Another Request)
+        except UpstreamUnavailable as e:
+            logger.debug("Skipping Unsplash search for '%s': %s", query, e)
+            return None
+        
         # Handle Request Exceptions       
-        except requests.exceptions.RequestException as e:
-            print(f"Error fetching Unsplash image: {e}")
+        except httpx.HTTPError as e:
+            if isinstance(e, httpx.HTTPStatusError) and e.response.status_code == 401:
+                logger.error("Authorization failed. Check your Unsplash Access Key.")
+            else:
+                logger.warning("Error fetching Unsplash image: %s", e)
             return None
     
-    # Fallback Image Method
-    def _get_fallback_image(self) -> str:
+    # Fetch Random Food Images for the Fallback Pool
+    async def _fetch_random_images(self, count: int = 30) -> List[str]:
         
         # Random Image Query
         url = f"{self.base_url}/photos/random"
         params = {
             "query": "delicious food meal",
+            "count": count,
             "orientation": "landscape",
             "content_filter": "high"
         }
@@ -99,17 +162,82 @@ class imageService:
         try:
 
             # API Call
-            response = requests.get(url, params=params, headers=headers, timeout=10)
+            with span("unsplash", "random"):
+                response = await self._get(url, params, headers)
 
             # Handle Success
-            if response.status_code == 200:
-                data = response.json()
-                print(f"Using random fallback image")
-                return data["urls"]["regular"]
-        except:
-            pass
+            return [photo["urls"]["regular"] for photo in response.json()]
+        except (httpx.HTTPError, UpstreamUnavailable) as e:
+            logger.warning("Error fetching random Unsplash images: %s", e)
+        return []
+    
+    # Fallback Image Method
+    def _get_fallback_image(self) -> str:
+        
+        # Local Random Pool
+        pool = self.cache.fallback_pool()
+        IMAGE_LOOKUPS.inc(outcome="fallback")
+        if pool:
+            logger.debug("Using random fallback image")
+            return random.choice(pool)
         
         # Hard-Coded Fallback
-        print("Using hard-coded fallback image")
+        logger.debug("Using hard-coded fallback image")
         return "https://images.unsplash.com/photo-1546069901-ba9599a7e63c?w=800"
-    
\ No newline at end of file
+
+    # Pre-Fill Cache for Common Tag Combinations, Returning How Many Queries are Cached
+    # (Stops Once the Quota or Circuit Refuses a Search: at 50 Requests per Hour, Waiting Would Take Hours)
+    async def warm_cache(self, queries: List[str]) -> int:
+
+        # Fallback Pool
+        if not self.cache.fallback_pool():
+            self.cache.set_fallback_pool(await self._fetch_random_images())
+
+        # Search Results
+        cached = 0
+        for query in queries:
+            if self.cache.get(query) is not None:
+                cached += 1
+                continue
+            refused = self.governor.stats["rejected_rate"] + self.governor.stats["rejected_open"]
+            if await self._search_and_cache(query) is not None:
+                cached += 1
+            elif self.governor.stats["rejected_rate"] + self.governor.stats["rejected_open"] > refused:
+                logger.warning("Unsplash refused further searches; stopping warm-up after %d of %d queries", cached, len(queries))
+                break
+        return cached
+
+    # Close Underlying HTTP Client
+    async def close(self):
+        await self.client.aclose()
+        self.cache.close()
+
+# Warm-Up Command: python -m services.imageService [limit]
+if __name__ == "__main__":
+    import sys
+    import asyncio
+    from collections import Counter
+    from dotenv import load_dotenv
+    from services.supabaseClient import get_supabase
+
+    async def warm(limit: int):
+        load_dotenv()
+        service = imageService()
+
+        # Most Common Queries from Stored Recipes
+        supabase = await get_supabase()
+        response = await supabase.table('recipe_history') \
+            .select('recipe_title, recipe_data->tags') \
+            .limit(5000) \
+            .execute()
+        counts = Counter(
+            service.cache.normalise(service._build_query(row['recipe_title'], row.get('tags') or []))
+            for row in response.data
+        )
+        queries = [query for query, _ in counts.most_common(limit)]
+
+        cached = await service.warm_cache(queries)
+        print(f"Image cache holds {cached} of {len(queries)} queries: {service.cache.metrics()}")
+        await service.close()
+
+    asyncio.run(warm(int(sys.argv[1]) if len(sys.argv) > 1 else 200))
@@ -0,0 +1,256 @@
+# Imports
+import os
+import time
+import uuid
+import asyncio
+import logging
+import sqlite3
+import orjson
+from typing import Awaitable, Callable, Optional, Protocol
+from services.cache import TTLCache, MISSING
+from services.httpClient import create_client
+from services.sharedCache import SharedCache, shared_enabled
+from services.telemetry import span
+from services import webhooks
+
+logger = logging.getLogger(__name__)
+
+# Seconds Between Checks on a Job Owned by Another Worker Process
+SHARED_POLL_INTERVAL = 0.25
+
+# Raised When a Job Cannot be Admitted
+class QueueFull(Exception):
+    pass
+
+class UserLimitExceeded(Exception):
+    pass
+
+# Queued Unit of Work and its Outcome
+class Job:
+
+    def __init__(self, user_id: str, payload: dict, callback_url: Optional[str] = None):
+        self.id = str(uuid.uuid4())
+        self.user_id = user_id
+        self.payload = payload
+        self.callback_url = callback_url
+        self.status = "queued"
+        self.result = None
+        self.error = None
+        self.created_at = time.time()
+        self.started_at = None
+        self.finished_at = None
+        self.done = asyncio.Event()
+        self.remote = False
+
+    # Read-Only Copy of a Job Published by Another Worker Process
+    @classmethod
+    def from_snapshot(cls, snapshot: dict) -> "Job":
+        job = cls(snapshot["user_id"], None)
+        job.id = snapshot["job_id"]
+        job.status = snapshot["status"]
+        job.result = snapshot["result"]
+        job.error = snapshot["error"]
+        job.created_at = snapshot["created_at"]
+        job.started_at = snapshot["started_at"]
+        job.finished_at = snapshot["finished_at"]
+        job.remote = True
+        return job
+
+    @property
+    def finished(self) -> bool:
+        return self.status in ("succeeded", "failed")
+
+    def to_dict(self) -> dict:
+        return {
+            "job_id": self.id,
+            "status": self.status,
+            "result": self.result,
+            "error": self.error,
+            "created_at": self.created_at,
+            "started_at": self.started_at,
+            "finished_at": self.finished_at,
+        }
+
+# Interface for Queue Backends (put_nowait Raises asyncio.QueueFull When Full)
+class QueueBackend(Protocol):
+
+    def put_nowait(self, job: Job) -> None: ...
+
+    async def get(self) -> Job: ...
+
+    def qsize(self) -> int: ...
+
+# Default Backend: Bounded In-Process FIFO
+class InProcessQueue(asyncio.Queue):
+    pass
+
+# Bounded Worker Pool Running Jobs Off the Request Path
+class JobQueue:
+
+    # Constructor
+    def __init__(self, handler: Callable[[Job], Awaitable[dict]], backend: QueueBackend = None):
+        self.handler = handler
+        self.workers_count = int(os.getenv("JOB_WORKERS", "8"))
+        self.max_depth = int(os.getenv("JOB_QUEUE_MAX_DEPTH", "200"))
+        self.per_user_limit = int(os.getenv("JOB_PER_USER_LIMIT", "3"))
+        self.result_ttl = float(os.getenv("JOB_RESULT_TTL", "600"))
+        self.max_wait = float(os.getenv("JOB_MAX_WAIT", "30"))
+
+        self.backend = backend or InProcessQueue(maxsize=self.max_depth)
+        self.jobs = TTLCache(maxsize=int(os.getenv("JOB_STORE_SIZE", "10000")), ttl=self.result_ttl)
+
+        # Job Snapshots Visible to Every Worker Process (Only When Caches are Shared)
+        self.shared = SharedCache("jobs", maxsize=self.jobs.maxsize, ttl=self.result_ttl) if shared_enabled() else None
+        self.active = {}
+        self.running = 0
+        self.workers = []
+        self.webhook_client = None
+        self.stats = {
+            "submitted": 0, "rejected_full": 0, "rejected_user": 0,
+            "succeeded": 0, "failed": 0, "webhooks_sent": 0, "webhook_errors": 0, "webhooks_refused": 0,
+            "queue_ms_total": 0.0, "run_ms_total": 0.0,
+        }
+
+    # Admit a Job or Raise QueueFull / UserLimitExceeded
+    def submit(self, user_id: str, payload: dict, callback_url: Optional[str] = None) -> Job:
+
+        # Per-User Cap on Queued and Running Jobs
+        if self.active.get(user_id, 0) >= self.per_user_limit:
+            self.stats["rejected_user"] += 1
+            raise UserLimitExceeded(f"At most {self.per_user_limit} jobs may be pending per user")
+
+        # Global Admission Control
+        job = Job(user_id, payload, callback_url)
+        try:
+            self.backend.put_nowait(job)
+        except asyncio.QueueFull:
+            self.stats["rejected_full"] += 1
+            raise QueueFull("Job queue is full")
+
+        self.active[user_id] = self.active.get(user_id, 0) + 1
+        self.jobs.set(job.id, job, ttl=self.result_ttl + self.max_wait * 10)
+        self._publish(job, ttl=self.result_ttl + self.max_wait * 10)
+        self.stats["submitted"] += 1
+        return job
+
+    # Share a Job's State with Other Worker Processes
+    def _publish(self, job: Job, ttl: float):
+        if self.shared is None:
+            return
+        try:
+            self.shared.set(job.id, {**job.to_dict(), "user_id": job.user_id}, ttl=ttl)
+        except sqlite3.Error as e:
+            logger.warning("Publishing job %s failed: %s", job.id, e)
+
+    # Look Up a Job Owned by a User (Falling Back to Jobs Queued on Other Workers)
+    def get(self, job_id: str, user_id: str) -> Optional[Job]:
+        job = self.jobs.get(job_id)
+        if job is MISSING and self.shared is not None:
+            snapshot = self.shared.get(job_id)
+            job = MISSING if snapshot is MISSING else Job.from_snapshot(snapshot)
+        if job is MISSING or job.user_id != user_id:
+            return None
+        return job
+
+    # Long-Poll Until the Job Finishes or the Timeout Elapses
+    async def wait(self, job: Job, timeout: float) -> Job:
+        if job.finished or timeout <= 0:
+            return job
+        if job.remote:
+            return await self._poll(job, min(timeout, self.max_wait))
+        try:
+            await asyncio.wait_for(asyncio.shield(job.done.wait()), min(timeout, self.max_wait))
+        except asyncio.TimeoutError:
+            pass
+        return job
+
+    # Re-Read the Shared Snapshot of a Job Running on Another Worker
+    async def _poll(self, job: Job, timeout: float) -> Job:
+        deadline = time.monotonic() + timeout
+        while not job.finished and time.monotonic() < deadline:
+            await asyncio.sleep(min(SHARED_POLL_INTERVAL, deadline - time.monotonic()))
+            snapshot = self.shared.get(job.id)
+            if snapshot is not MISSING:
+                job = Job.from_snapshot(snapshot)
+        return job
+
+    # Run One Job and Record its Outcome
+    async def _run(self, job: Job):
+
+        job.status = "running"
+        job.started_at = time.time()
+        self._publish(job, ttl=self.result_ttl + self.max_wait * 10)
+        self.running += 1
+        self.stats["queue_ms_total"] += (job.started_at - job.created_at) * 1000
+        try:
+            job.result = await self.handler(job)
+            job.status = "succeeded"
+            self.stats["succeeded"] += 1
+        except Exception as e:
+            job.error = str(e)
+            job.status = "failed"
+            self.stats["failed"] += 1
+        finally:
+            job.finished_at = time.time()
+            self.running -= 1
+            self.stats["run_ms_total"] += (job.finished_at - job.started_at) * 1000
+            self.active[job.user_id] -= 1
+            if not self.active[job.user_id]:
+                del self.active[job.user_id]
+            self.jobs.set(job.id, job, ttl=self.result_ttl)
+            self._publish(job, ttl=self.result_ttl)
+            job.done.set()
+
+        if job.callback_url:
+            await self._deliver(job)
+
+    # POST the Finished Job to its Callback URL (Signed; the Host is Re-Checked Against Private Ranges)
+    async def _deliver(self, job: Job):
+
+        if self.webhook_client is None:
+            self.webhook_client = create_client("webhook")
+        try:
+            with span("webhook", "deliver"):
+                response = await webhooks.post(self.webhook_client, job.callback_url, orjson.dumps(job.to_dict()))
+            response.raise_for_status()
+            self.stats["webhooks_sent"] += 1
+        except webhooks.UnsafeCallback as e:
+            self.stats["webhooks_refused"] += 1
+            logger.warning("Refused webhook for job %s: %s", job.id, e)
+        except Exception as e:
+            self.stats["webhook_errors"] += 1
+            logger.warning("Webhook delivery for job %s failed: %s", job.id, e)
+
+    # Worker Loop
+    async def _worker(self):
+        while True:
+            job = await self.backend.get()
+            await self._run(job)
+
+    # Start Worker Pool
+    def start(self):
+        if not self.workers:
+            self.workers = [asyncio.create_task(self._worker()) for _ in range(self.workers_count)]
+
+    # Stop Worker Pool
+    async def stop(self):
+        for worker in self.workers:
+            worker.cancel()
+        await asyncio.gather(*self.workers, return_exceptions=True)
+        self.workers = []
+        if self.webhook_client is not None:
+            await self.webhook_client.aclose()
+            self.webhook_client = None
+        if self.shared is not None:
+            self.shared.close()
+
+    # Current Metrics
+    def metrics(self) -> dict:
+        finished = self.stats["succeeded"] + self.stats["failed"]
+        return {
+            **self.stats,
+            "queue_depth": self.backend.qsize(),
+            "running": self.running,
+            "queue_ms_avg": self.stats["queue_ms_total"] / (finished or 1),
+            "run_ms_avg": self.stats["run_ms_total"] / (finished or 1),
+        }
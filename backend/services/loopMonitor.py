@@ -0,0 +1,54 @@
+# Imports
+import os
+import time
+import asyncio
+
+# Sampling Interval (Seconds)
+LOOP_MONITOR_INTERVAL = float(os.getenv("LOOP_MONITOR_INTERVAL", "0.1"))
+
+# Measure How Late the Event Loop Runs a Scheduled Wake-Up
+class LoopMonitor:
+
+    # Constructor
+    def __init__(self, interval: float = LOOP_MONITOR_INTERVAL):
+        self.interval = interval
+        self.task = None
+        self.reset()
+
+    def reset(self):
+        self.stats = {"samples": 0, "lag_ms_total": 0.0, "lag_ms_max": 0.0, "lag_ms_last": 0.0}
+
+    async def _run(self):
+        while True:
+            start = time.perf_counter()
+            await asyncio.sleep(self.interval)
+            lag_ms = max(0.0, (time.perf_counter() - start - self.interval) * 1000)
+            self.stats["samples"] += 1
+            self.stats["lag_ms_total"] += lag_ms
+            self.stats["lag_ms_max"] = max(self.stats["lag_ms_max"], lag_ms)
+            self.stats["lag_ms_last"] = lag_ms
+
+    def start(self):
+        if self.task is None:
+            self.task = asyncio.create_task(self._run())
+
+    async def stop(self):
+        if self.task is not None:
+            self.task.cancel()
+            try:
+                await self.task
+            except asyncio.CancelledError:
+                pass
+            self.task = None
+
+    def metrics(self) -> dict:
+        samples = self.stats["samples"]
+        return {
+            "samples": samples,
+            "lag_ms_avg": self.stats["lag_ms_total"] / samples if samples else 0.0,
+            "lag_ms_max": self.stats["lag_ms_max"],
+            "lag_ms_last": self.stats["lag_ms_last"],
+        }
+
+# Shared Monitor for the Server Process
+loop_monitor = LoopMonitor()
@@ -0,0 +1,264 @@
+# Imports
+import os
+import re
+import zlib
+import random
+import asyncio
+import numpy as np
+from datetime import datetime, timedelta
+from collections import Counter, OrderedDict, deque
+from typing import Awaitable, Callable, Iterable, List, Optional
+
+# MinHash Settings (16 Bands of 4 Rows Flag Pairs Above ~0.5 Jaccard)
+NUM_PERMUTATIONS = 64
+BANDS = 16
+ROWS = NUM_PERMUTATIONS // BANDS
+
+# Mersenne Prime Small Enough that a * hash + b Never Overflows 64 Bits
+PRIME = (1 << 31) - 1
+
+# Fixed Permutations so Signatures are Stable Across Processes
+_rng = random.Random(0x5EED)
+_permutations = [(_rng.randrange(1, PRIME), _rng.randrange(0, PRIME)) for _ in range(NUM_PERMUTATIONS)]
+MULTIPLIERS = np.array([a for a, _ in _permutations], dtype=np.uint64)[:, None]
+OFFSETS = np.array([b for _, b in _permutations], dtype=np.uint64)[:, None]
+
+# Odd Weights Folding Each Band's Rows into One 64-Bit Bucket Key (Wrapping Arithmetic)
+BAND_MIX = np.array([_rng.randrange(1, 1 << 64) | 1 for _ in range(ROWS)], dtype=np.uint64)
+
+# Seconds of History Re-Read Before the Newest Indexed Row on a Refresh (Rows Commit Slightly Out of Order)
+REFRESH_OVERLAP = timedelta(seconds=float(os.getenv("NOVELTY_REFRESH_OVERLAP", "5")))
+
+# Words Ignored When Fingerprinting
+STOPWORDS = {
+    "a", "an", "and", "the", "with", "of", "in", "on", "for", "style", "easy", "simple", "quick",
+    "cup", "cups", "tbsp", "tsp", "tablespoon", "tablespoons", "teaspoon", "teaspoons",
+    "g", "kg", "ml", "l", "oz", "lb", "lbs", "pinch", "clove", "cloves", "can", "large", "small",
+    "medium", "chopped", "diced", "sliced", "minced", "fresh", "to", "taste",
+}
+
+# Lowercase Words Without Punctuation, Numbers or Stopwords
+def _words(text: str) -> List[str]:
+    return [word for word in re.findall(r"[a-z]+", text.lower()) if word not in STOPWORDS]
+
+# Normalised Title for Exact Matching
+def normalise_title(title: str) -> str:
+    return " ".join(sorted(_words(title)))
+
+# Feature Set: Title Words and Bigrams, Tags and Ingredient Names
+def features(recipe_data: dict) -> set:
+
+    title = _words(recipe_data.get("title") or "")
+    result = {f"w:{word}" for word in title}
+    result.update(f"b:{first}_{second}" for first, second in zip(title, title[1:]))
+    for tag in recipe_data.get("tags") or []:
+        result.add(f"t:{' '.join(_words(tag))}")
+    for ingredient in recipe_data.get("ingredients") or []:
+        words = _words(ingredient)
+        if words:
+            result.add(f"i:{words[-1]}")
+    return result
+
+# MinHash Signatures of Many Feature Sets (One Row per Set; Every Permutation Applied in One Array Operation)
+def signatures(feature_sets: List[Iterable[str]]) -> np.ndarray:
+
+    hashes, lengths = [], []
+    for feature_set in feature_sets:
+        values = [zlib.crc32(feature.encode()) % PRIME for feature in feature_set] or [0]
+        hashes.extend(values)
+        lengths.append(len(values))
+    if not lengths:
+        return np.zeros((0, NUM_PERMUTATIONS), dtype=np.uint64)
+
+    # Permutations x Features, so Each Set's Minimum is a Contiguous Reduction
+    permuted = (MULTIPLIERS * np.array(hashes, dtype=np.uint64) + OFFSETS) % PRIME
+    starts = np.concatenate(([0], np.cumsum(lengths)[:-1]))
+    return np.minimum.reduceat(permuted, starts, axis=1).T
+
+# MinHash Signature of a Feature Set
+def signature(feature_set: Iterable[str]) -> np.ndarray:
+    return signatures([feature_set])[0]
+
+# Signatures of Recipes (CPU Only, so History Loads Run it Off the Event Loop)
+def fingerprint(recipes: List[dict]) -> np.ndarray:
+    return signatures([features(recipe_data) for recipe_data in recipes])
+
+# Estimated Jaccard Similarity of Two Signatures
+def similarity(first: np.ndarray, second: np.ndarray) -> float:
+    return int(np.count_nonzero(first == second)) / NUM_PERMUTATIONS
+
+# LSH Bucket Keys of Many Signatures (One Row of BANDS Keys per Signature)
+def band_keys(sigs: np.ndarray) -> np.ndarray:
+    return (sigs.reshape(len(sigs), BANDS, ROWS) * BAND_MIX).sum(axis=2)
+
+# LSH Band Keys of a Signature
+def bands(sig: np.ndarray) -> List[tuple]:
+    return list(enumerate(band_keys(sig[None])[0].tolist()))
+
+# Near-Duplicate Index over One User's History
+class UserNovelty:
+
+    # Constructor
+    def __init__(self, threshold: float, recent: int, version: Optional[str] = None):
+        self.threshold = threshold
+        self.version = version
+        self.loaded_at: Optional[datetime] = None
+        self.signatures: List[np.ndarray] = []
+        self.buckets = {}
+        self.titles = set()
+        self.recent = deque(maxlen=recent)
+        self.main_ingredients = Counter()
+
+    def __len__(self) -> int:
+        return len(self.signatures)
+
+    # Add a Recipe (Incremental; Cost Independent of History Size)
+    def add(self, recipe_data: dict):
+        sig = signature(features(recipe_data))
+        self._insert(recipe_data, sig, bands(sig))
+
+    def _insert(self, recipe_data: dict, sig: np.ndarray, keys: List[tuple]):
+
+        index = len(self.signatures)
+        self.signatures.append(sig)
+        for key in keys:
+            self.buckets.setdefault(key, []).append(index)
+
+        self.titles.add(normalise_title(recipe_data.get("title") or ""))
+        self.recent.append(recipe_data.get("title") or "")
+        tags = recipe_data.get("tags") or []
+        if len(tags) > 1:
+            self.main_ingredients[tags[1].lower()] += 1
+
+    # Add History Rows with Precomputed Signatures, Skipping Titles Already Indexed
+    # (a Refresh Re-Reads this Worker's Own Writes and the Overlap Window)
+    def extend(self, rows: List[dict], sigs: np.ndarray, skip_known: bool = False):
+        for recipe_data, sig, keys in zip(rows, sigs, band_keys(sigs).tolist()):
+            if not (skip_known and normalise_title(recipe_data.get("title") or "") in self.titles):
+                self._insert(recipe_data, sig, list(enumerate(keys)))
+            if recipe_data.get("created_at"):
+                created_at = datetime.fromisoformat(recipe_data["created_at"])
+                self.loaded_at = created_at if self.loaded_at is None else max(self.loaded_at, created_at)
+
+    # Whether a Recipe Repeats Something in the History
+    def is_duplicate(self, recipe_data: dict) -> bool:
+
+        if normalise_title(recipe_data.get("title") or "") in self.titles:
+            return True
+
+        # Compare Only Against Recipes Sharing an LSH Band
+        sig = signature(features(recipe_data))
+        candidates = set()
+        for key in bands(sig):
+            candidates.update(self.buckets.get(key, ()))
+        return any(similarity(sig, self.signatures[index]) >= self.threshold for index in candidates)
+
+    # Compact Avoid List for the Prompt (Latest Titles and Most Repeated Main Ingredients)
+    def avoid_summary(self, ingredients: int = 2) -> List[str]:
+        frequent = [f"another {name} dish" for name, count in self.main_ingredients.most_common(ingredients) if count > 1]
+        return list(reversed(self.recent)) + frequent
+
+# Per-User Novelty Indexes with LRU Eviction
+# (Each Index Remembers the History Version it Reflects, so Writes by Other Worker Processes Trigger a Refresh)
+class NoveltyIndex:
+
+    # Constructor
+    def __init__(self):
+        self.max_users = int(os.getenv("NOVELTY_INDEX_USERS", "5000"))
+        self.threshold = float(os.getenv("NOVELTY_THRESHOLD", "0.5"))
+        self.recent = int(os.getenv("NOVELTY_PROMPT_TITLES", "3"))
+        self.users: "OrderedDict[str, UserNovelty]" = OrderedDict()
+        self.loading = {}
+        self.pending = {}
+        self.stats = {"hits": 0, "loads": 0, "stale": 0, "refreshed_rows": 0, "evictions": 0, "duplicates": 0}
+
+    # Get a User's Index, Loading their History Once on a Miss and Only Newer Rows When it Lags the Current History Version
+    # (load_history(user_id, since) Returns Rows Oldest First, All of Them When since is None)
+    async def get(self, user_id: str, load_history: Callable[[str, Optional[str]], Awaitable[List[dict]]], version: Optional[str] = None) -> UserNovelty:
+
+        novelty = self.users.get(user_id)
+        if novelty is not None and (version is None or novelty.version == version):
+            self.users.move_to_end(user_id)
+            self.stats["hits"] += 1
+            return novelty
+
+        # Concurrent Misses for a User Share One Load
+        task = self.loading.get(user_id)
+        if task is None:
+            if novelty is None:
+                task = asyncio.ensure_future(self._load(user_id, load_history, version))
+            else:
+                self.stats["stale"] += 1
+                task = asyncio.ensure_future(self._refresh(novelty, user_id, load_history, version))
+            self.loading[user_id] = task
+            task.add_done_callback(lambda _: self.loading.pop(user_id, None))
+        return await asyncio.shield(task)
+
+    async def _load(self, user_id: str, load_history: Callable[[str, Optional[str]], Awaitable[List[dict]]], version: Optional[str]) -> UserNovelty:
+
+        # The Index is Built Off the Event Loop (Thousands of Rows Take Tens of Milliseconds) Before Anything Else Can See it
+        try:
+            rows = await load_history(user_id, None)
+            novelty = await asyncio.to_thread(self._build, rows, version)
+        except BaseException:
+            # Nothing is Registered for a Failed Load, so the Next get Starts Clean
+            self.pending.pop(user_id, None)
+            raise
+        self.stats["loads"] += 1
+
+        # Recipes Stored While the History Query was in Flight
+        for recipe_data in self.pending.pop(user_id, []):
+            novelty.add(recipe_data)
+
+        self.users[user_id] = novelty
+        self.users.move_to_end(user_id)
+        while len(self.users) > self.max_users:
+            self.users.popitem(last=False)
+            self.stats["evictions"] += 1
+        return novelty
+
+    def _build(self, rows: List[dict], version: Optional[str]) -> UserNovelty:
+        novelty = UserNovelty(self.threshold, self.recent, version)
+        novelty.extend(rows, fingerprint(rows))
+        return novelty
+
+    # Add Rows Stored Since the Index was Last Loaded (Re-Reading an Overlap Window; Known Titles are Skipped)
+    async def _refresh(self, novelty: UserNovelty, user_id: str, load_history: Callable[[str, Optional[str]], Awaitable[List[dict]]], version: Optional[str]) -> UserNovelty:
+
+        since = (novelty.loaded_at - REFRESH_OVERLAP).isoformat() if novelty.loaded_at else None
+        rows = await load_history(user_id, since)
+        sigs = await asyncio.to_thread(fingerprint, rows)
+        novelty.extend(rows, sigs, skip_known=True)
+        novelty.version = version
+        self.stats["refreshed_rows"] += len(rows)
+        return novelty
+
+    # Record a New Recipe for a User Whose Index is Loaded or Loading
+    def add(self, user_id: str, recipe_data: dict):
+        novelty = self.users.get(user_id)
+        if novelty is not None:
+            novelty.add(recipe_data)
+        elif user_id in self.loading:
+            self.pending.setdefault(user_id, []).append(recipe_data)
+
+    # Move a User's Index to the Version a Local Write Produced, if it Was Current Before the Write
+    # (Otherwise Another Process Changed the History and the Next get Refreshes it)
+    def advance(self, user_id: str, before: str, after: str):
+        novelty = self.users.get(user_id)
+        if novelty is not None and novelty.version == before:
+            novelty.version = after
+
+    # Check and Count a Near-Duplicate
+    def is_duplicate(self, novelty: UserNovelty, recipe_data: dict) -> bool:
+        duplicate = novelty.is_duplicate(recipe_data)
+        if duplicate:
+            self.stats["duplicates"] += 1
+        return duplicate
+
+    # Current Metrics
+    def metrics(self) -> dict:
+        return {
+            **self.stats,
+            "users": len(self.users),
+            "recipes": sum(len(novelty) for novelty in self.users.values()),
+        }
@@ -0,0 +1,299 @@
+# Imports
+import os
+import re
+import csv
+import numpy as np
+from functools import lru_cache
+from typing import List, Tuple
+
+# Bundled per-100g Table (Name, Aliases, kcal, Protein, Carbs, Fat, Density g/ml, Grams per Piece)
+NUTRITION_TABLE = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "data", "nutrition.csv")
+
+# Macro Fields in Column Order
+MACRO_FIELDS = ("calories", "protein", "carbs", "fat")
+
+# Unit Conversions (Weights in Grams, Volumes in Millilitres, Fixed Measures in Grams)
+WEIGHT_UNITS = {"g": 1, "gram": 1, "kg": 1000, "kilogram": 1000, "oz": 28.35, "ounce": 28.35, "lb": 453.6, "pound": 453.6}
+VOLUME_UNITS = {
+    "ml": 1, "millilitre": 1, "milliliter": 1, "l": 1000, "litre": 1000, "liter": 1000,
+    "cup": 240, "tbsp": 15, "tbs": 15, "tablespoon": 15, "tsp": 5, "teaspoon": 5,
+}
+FIXED_UNITS = {"can": 400, "tin": 400, "clove": 5, "pinch": 0.4, "dash": 0.6, "handful": 30, "stick": 113, "bunch": 100}
+PIECE_UNITS = {"slice", "piece", "head", "fillet", "breast", "stalk", "sprig", "whole"}
+
+# Unicode Fractions Written by Models
+FRACTIONS = {"½": 0.5, "⅓": 1 / 3, "⅔": 2 / 3, "¼": 0.25, "¾": 0.75, "⅛": 0.125}
+
+# Leading Quantity (Mixed Numbers, Fractions, Decimals, Ranges) then an Optional Unit
+_NUMBER = r"\d+\s+\d+/\d+|\d+/\d+|\d*\.\d+|\d+|[½⅓⅔¼¾⅛]|an?\b"
+_UNITS = "|".join(sorted({*WEIGHT_UNITS, *VOLUME_UNITS, *FIXED_UNITS, *PIECE_UNITS}, key=len, reverse=True))
+INGREDIENT = re.compile(
+    rf"^\s*(?P<quantity>{_NUMBER})?(?:\s*(?:-|to)\s*(?P<upper>{_NUMBER}))?\s*"
+    rf"(?:(?P<unit>{_UNITS})(?:e?s)?\b\.?)?\s*(?:of\s+)?(?P<name>.*)$"
+)
+
+# Longest Alias Searched For (Words)
+MAX_ALIAS_WORDS = 4
+
+# Qualifiers Choosing Between a Raw Row and its "cooked ..." Row (Grains, Pasta and Pulses Roughly Triple in Weight)
+COOKED_WORDS = {"cooked", "boiled", "steamed", "leftover", "prepared"}
+RAW_WORDS = {"raw", "uncooked", "dry", "dried"}
+
+# Relative and Absolute Differences Tolerated Before Reported Macros are Replaced
+TOLERANCE = 0.25
+ABSOLUTE_TOLERANCE = np.array([60.0, 6.0, 8.0, 6.0])
+
+# Largest Serving Count Inferred for Recipes that Do Not State One
+MAX_SERVINGS = 12
+
+# Singular Form of a Word ("tomatoes" -> "tomato", "berries" -> "berry")
+def _singular(word: str) -> str:
+    if len(word) <= 3 or word.endswith(("ss", "us", "is")):
+        return word
+    if word.endswith("ies"):
+        return word[:-3] + "y"
+    if word.endswith(("oes", "ches", "shes")):
+        return word[:-2]
+    if word.endswith("s"):
+        return word[:-1]
+    return word
+
+# Lowercase Singular Words of a Food Name
+def _words(text: str) -> List[str]:
+    return [_singular(word) for word in re.findall(r"[a-z]+", text.lower())]
+
+# Numeric Value of a Quantity Token
+def _number(token: str) -> float:
+    token = token.strip()
+    if token in FRACTIONS:
+        return FRACTIONS[token]
+    if token in ("a", "an"):
+        return 1.0
+    if " " in token:
+        whole, fraction = token.split(None, 1)
+        return float(whole) + _number(fraction)
+    if "/" in token:
+        numerator, denominator = token.split("/")
+        return float(numerator) / float(denominator) if float(denominator) else 0.0
+    return float(token)
+
+# Numeric Field from Model Output (Anything Else Counts as Absent)
+def _value(value) -> float:
+    return float(value) if isinstance(value, (int, float)) and not isinstance(value, bool) else 0.0
+
+# Ingredient Table in NumPy Arrays with Vectorised Batch Computation
+class NutritionEngine:
+
+    # Constructor
+    def __init__(self, path: str = None):
+        self.path = path or os.getenv("NUTRITION_TABLE", NUTRITION_TABLE)
+        # Report-Only by Default; "override" Rewrites Macros that Disagree with the Table
+        self.mode = os.getenv("NUTRITION_MODE", "validate")
+        self.min_coverage = float(os.getenv("NUTRITION_MIN_COVERAGE", "0.75"))
+        self.stats = {"recipes": 0, "confirmed": 0, "overridden": 0, "mismatched": 0, "low_coverage": 0, "ingredients": 0, "matched": 0}
+
+        # Per-Gram Nutrients (Foods x Macros), Densities and Piece Weights (NaN Where Unknown)
+        names, rows, densities, pieces = [], [], [], []
+        self.aliases = {}
+        with open(self.path, newline="") as f:
+            for index, row in enumerate(csv.DictReader(f)):
+                names.append(row["name"])
+                rows.append([float(row[column]) for column in ("kcal", "protein", "carbs", "fat")])
+                densities.append(float(row["density"] or 1))
+                pieces.append(float(row["piece_g"]) if row["piece_g"] else np.nan)
+                for alias in [row["name"], *filter(None, row["aliases"].split("|"))]:
+                    self.aliases.setdefault(" ".join(_words(alias)), index)
+
+        self.names = names
+
+        # Raw Row -> "cooked <name>" Row, and Back
+        self.cooked = {
+            self.aliases[" ".join(_words(name.removeprefix("cooked ")))]: index
+            for index, name in enumerate(names)
+            if name.startswith("cooked ") and " ".join(_words(name.removeprefix("cooked "))) in self.aliases
+        }
+        self.raw = {cooked: raw for raw, cooked in self.cooked.items()}
+        self.per_gram = np.array(rows) / 100
+        self.density = np.array(densities)
+        self.piece_grams = np.array(pieces)
+
+        # Ingredient Lines Repeat Heavily Across Recipes, so Parses are Memoised
+        self.parse = lru_cache(maxsize=int(os.getenv("NUTRITION_PARSE_CACHE", "20000")))(self._parse)
+
+    # Table Row for Food Words (Longest, Then Rightmost, Matching Alias), or -1
+    def _alias(self, words: List[str]) -> int:
+        for size in range(min(MAX_ALIAS_WORDS, len(words)), 0, -1):
+            for start in range(len(words) - size, -1, -1):
+                food = self.aliases.get(" ".join(words[start:start + size]))
+                if food is not None:
+                    return food
+        return -1
+
+    # Table Row for a Food Name, or -1
+    # (A Cooked or Raw Qualifier in the Name or its Notes Switches to the Matching Row Where the Table Has Both)
+    def match(self, name: str, notes: str = "") -> int:
+        words = _words(name)
+        food = self._alias(words)
+        if food < 0:
+            return -1
+        qualifiers = {*words, *_words(notes)}
+        if qualifiers & COOKED_WORDS:
+            return self.cooked.get(food, food)
+        if qualifiers & RAW_WORDS:
+            return self.raw.get(food, food)
+        return food
+
+    # Food Row and Grams for an Ingredient Line (Food -1 When Unrecognised)
+    def _parse(self, text: str) -> Tuple[int, float]:
+
+        # Drop Notes ("diced", "(about 400g)", "or tofu") Before Reading the Quantity
+        # (Parenthesised Notes Still Count as Qualifiers: "1 cup quinoa (cooked)")
+        lowered = text.lower()
+        line = re.split(r",|\bor\b|;", re.sub(r"\([^)]*\)", " ", lowered), maxsplit=1)[0]
+        parsed = INGREDIENT.match(line)
+        name = parsed.group("name")
+        food = self.match(name, " ".join(re.findall(r"\(([^)]*)\)", lowered)))
+        if food < 0:
+            return -1, 0.0
+        # Seasoning and Garnish Without an Amount ("salt to taste", "fresh cilantro")
+        if "to taste" in line or "as needed" in line or not (parsed.group("quantity") or parsed.group("unit")):
+            return food, 0.0
+
+        quantity = _number(parsed.group("quantity")) if parsed.group("quantity") else 1.0
+        if parsed.group("upper"):
+            quantity = (quantity + _number(parsed.group("upper"))) / 2
+
+        unit = parsed.group("unit")
+        if unit in WEIGHT_UNITS:
+            return food, quantity * WEIGHT_UNITS[unit]
+        if unit in VOLUME_UNITS:
+            return food, quantity * VOLUME_UNITS[unit] * self.density[food]
+        if unit in FIXED_UNITS:
+            return food, quantity * FIXED_UNITS[unit]
+
+        # Counted Items ("2 chicken breasts", "1 onion") Need a Known Piece Weight
+        piece = self.piece_grams[food]
+        if np.isnan(piece):
+            return -1, 0.0
+        return food, quantity * piece
+
+    # Total Macros per Recipe (Recipes x Macros) and the Fraction of Ingredient Lines Recognised
+    def compute(self, recipes: List[dict]) -> Tuple[np.ndarray, np.ndarray]:
+
+        foods, grams, owners = [], [], []
+        lines = np.zeros(len(recipes))
+        for index, recipe_data in enumerate(recipes):
+            for text in recipe_data.get("ingredients") or []:
+                if not isinstance(text, str):
+                    continue
+                lines[index] += 1
+                food, weight = self.parse(text)
+                if food >= 0:
+                    foods.append(food)
+                    grams.append(weight)
+                    owners.append(index)
+
+        # One Gather and Multiply for Every Ingredient, then Per-Recipe Sums
+        owners = np.array(owners, dtype=np.intp)
+        contributions = self.per_gram[np.array(foods, dtype=np.intp)] * np.array(grams)[:, None]
+        totals = np.stack(
+            [np.bincount(owners, weights=contributions[:, column], minlength=len(recipes)) for column in range(len(MACRO_FIELDS))],
+            axis=1
+        ) if len(recipes) else np.zeros((0, len(MACRO_FIELDS)))
+        coverage = np.bincount(owners, minlength=len(recipes)) / np.maximum(lines, 1)
+
+        self.stats["ingredients"] += int(lines.sum())
+        self.stats["matched"] += len(foods)
+        return totals, coverage
+
+    # Check Reported Macros Against Computed Ones, Replacing Them in Place When Far Off
+    # (Servings Come from the Recipe, or are Inferred from Reported Calories for Older Recipes)
+    def verify(self, recipes: List[dict]) -> List[dict]:
+
+        if self.mode == "off":
+            return recipes
+        checked = [recipe_data for recipe_data in recipes if isinstance(recipe_data, dict) and isinstance(recipe_data.get("ingredients"), list)]
+        if not checked:
+            return recipes
+
+        totals, coverage = self.compute(checked)
+        reported = np.array([
+            [_value((recipe_data.get("macros") or {}).get(field)) for field in MACRO_FIELDS]
+            for recipe_data in checked
+        ])
+        stated = np.array([_value(recipe_data.get("servings")) for recipe_data in checked])
+        inferred = np.clip(np.rint(totals[:, 0] / np.maximum(reported[:, 0], 1)), 1, MAX_SERVINGS)
+        servings = np.where(stated > 0, stated, inferred)
+        computed = np.rint(totals / servings[:, None])
+
+        # Off When Any Macro Misses by Both the Relative and Absolute Tolerance
+        difference = np.abs(computed - reported)
+        mismatched = ((difference > TOLERANCE * reported) & (difference > ABSOLUTE_TOLERANCE)).any(axis=1)
+        trusted = coverage >= self.min_coverage
+
+        self.stats["recipes"] += len(checked)
+        self.stats["low_coverage"] += int((~trusted).sum())
+        self.stats["confirmed"] += int((trusted & ~mismatched).sum())
+        self.stats["mismatched"] += int((trusted & mismatched).sum())
+
+        if self.mode != "override":
+            return recipes
+        for index in np.flatnonzero(trusted & mismatched):
+            checked[index]["macros"] = {field: int(value) for field, value in zip(MACRO_FIELDS, computed[index])}
+            self.stats["overridden"] += 1
+        return recipes
+
+    # Current Metrics
+    def metrics(self) -> dict:
+        cache = self.parse.cache_info()
+        return {**self.stats, "parse_cache_hits": cache.hits, "parse_cache_size": cache.currsize, "foods": len(self.names)}
+
+# Recompute Stored Macros: python -m services.nutritionEngine [limit]
+if __name__ == "__main__":
+    import sys
+    import asyncio
+    from dotenv import load_dotenv
+    from services import resourceVersions
+    from services.sharedCache import shared_enabled
+    from services.supabaseClient import get_supabase
+
+    # Table and the Versioned Resource Clients Revalidate Against
+    TABLES = {"recipe_history": "history", "saved_recipes": "saved"}
+
+    async def recompute(limit: int):
+
+        load_dotenv()
+        supabase = await get_supabase()
+        engine = NutritionEngine()
+        if engine.mode != "override":
+            print(f"NUTRITION_MODE={engine.mode}: reporting mismatches only; set NUTRITION_MODE=override to rewrite stored macros")
+
+        for table, resource in TABLES.items():
+            response = await supabase.table(table) \
+                .select('id, user_id, recipe_data') \
+                .order('created_at', desc=True) \
+                .limit(limit) \
+                .execute()
+
+            # One Vectorised Pass over Every Row, then Write Back Only Changed Ones
+            rows = response.data
+            before = [(row["recipe_data"] or {}).get("macros") for row in rows]
+            engine.verify([row["recipe_data"] for row in rows])
+            changed = [row for row, macros in zip(rows, before) if (row["recipe_data"] or {}).get("macros") != macros]
+            for row in changed:
+                await supabase.table(table).update({"recipe_data": row["recipe_data"]}).eq("id", row["id"]).execute()
+
+            # New Versions so Clients Holding the Old Macros Get a Full Response Instead of 304
+            users = {row["user_id"] for row in changed}
+            for user_id in users:
+                resourceVersions.bump(user_id, resource)
+            print(f"{table}: {len(changed)} of {len(rows)} recipes updated for {len(users)} users")
+
+        # Without a Shared Cache the Versions Live in the Server Process, Which Cannot See These Bumps
+        if not shared_enabled():
+            print("SHARED_CACHE_PATH is not set: restart the server so clients stop revalidating against old versions")
+        resourceVersions.close()
+
+        print(engine.metrics())
+
+    asyncio.run(recompute(int(sys.argv[1]) if len(sys.argv) > 1 else 10000))
@@ -0,0 +1,48 @@
+# Imports
+import time
+import asyncio
+from typing import Awaitable, Callable, Dict, Iterable
+
+# Dependency Graph of Async Stages
+class Pipeline:
+
+    # Constructor
+    def __init__(self):
+        self.stages = {}
+        self.timings: Dict[str, float] = {}
+
+    # Register a Stage (Receives Dependency Results as Keyword Arguments)
+    def stage(self, name: str, func: Callable[..., Awaitable], depends_on: Iterable[str] = ()):
+        self.stages[name] = (func, tuple(depends_on))
+        return self
+
+    # Run Every Stage as Soon as its Dependencies Finish
+    async def run(self) -> dict:
+
+        tasks = {}
+
+        async def run_stage(name: str):
+            func, depends_on = self.stages[name]
+            inputs = {dep: await tasks[dep] for dep in depends_on}
+            start = time.perf_counter()
+            try:
+                return await func(**inputs)
+            finally:
+                self.timings[name] = (time.perf_counter() - start) * 1000
+
+        for name in self.stages:
+            tasks[name] = asyncio.ensure_future(run_stage(name))
+
+        # Cancel Remaining Stages if Any Stage Fails
+        try:
+            await asyncio.gather(*tasks.values())
+        except BaseException:
+            for task in tasks.values():
+                task.cancel()
+            raise
+
+        return {name: task.result() for name, task in tasks.items()}
+
+    # Format Stage Timings as a Server-Timing Header
+    def server_timing(self) -> str:
+        return ", ".join(f"{name};dur={duration:.1f}" for name, duration in self.timings.items())
@@ -0,0 +1,68 @@
+# Imports
+import os
+from models.recipe import UserPreferences
+from services.cache import MISSING
+from services.sharedCache import create_cache
+from services.supabaseClient import get_supabase
+
+# Preference Columns Stored per User
+PREFERENCE_COLUMNS = ", ".join(UserPreferences.model_fields)
+
+# Preference Service Class
+class preferenceService:
+
+    # Constructor
+    def __init__(self):
+        self.cache = create_cache(
+            "preferences",
+            maxsize=int(os.getenv("PREFERENCE_CACHE_SIZE", "10000")),
+            ttl=float(os.getenv("PREFERENCE_CACHE_TTL", "600"))
+        )
+
+    # Function to Get User Preferences (Read-Through)
+    async def get_preferences(self, user_id: str) -> UserPreferences:
+
+        # Cached Preference Fields (None Means No Row)
+        cached = self.cache.get(user_id)
+        if cached is not MISSING:
+            return UserPreferences(**cached) if cached else UserPreferences()
+
+        supabase = await get_supabase()
+        response = await supabase.table('user_preferences') \
+            .select(PREFERENCE_COLUMNS) \
+            .eq('user_id', user_id) \
+            .limit(1) \
+            .execute()
+
+        # Remember Missing Rows as Well
+        preferences = UserPreferences(**response.data[0]) if response.data else None
+        self.cache.set(user_id, preferences.model_dump(mode="json") if preferences else None)
+        return preferences or UserPreferences()
+
+    # Function to Update User Preferences (Write-Through)
+    async def update_preferences(self, user_id: str, preferences: UserPreferences) -> UserPreferences:
+
+        pref_dict = preferences.model_dump()
+        pref_dict['user_id'] = user_id
+
+        # Single Round Trip Insert or Update (Requires Unique user_id)
+        supabase = await get_supabase()
+        response = await supabase.table('user_preferences') \
+            .upsert(pref_dict, on_conflict='user_id') \
+            .execute()
+
+        updated = UserPreferences(**response.data[0])
+        self.cache.set(user_id, updated.model_dump(mode="json"))
+        return updated
+
+    # Drop Cached Preferences for User
+    def invalidate(self, user_id: str):
+        self.cache.delete(user_id)
+
+    # Current Metrics
+    def metrics(self) -> dict:
+        return self.cache.metrics()
+
+    # Release Cache Connection
+    def close(self):
+        self.cache.close()
@@ -0,0 +1,104 @@
+# Imports
+import json
+from typing import List
+from models.recipe import UserPreferences
+
+# Compact Recipe Schema Shown to the Model
+RECIPE_SCHEMA = (
+    '{"title":str,"description":str (one sentence),"cook_time":int (total minutes),"servings":int,'
+    '"tags":[dish type,main ingredient,secondary ingredient],"ingredients":[str with quantity],'
+    '"steps":[{"step_number":int,"instruction":str}],'
+    '"macros":{"calories":int,"protein":int (g),"carbs":int (g),"fat":int (g)} (per serving)}'
+)
+
+# Expected Output Size per Recipe (Tokens) and Headroom
+RECIPE_OUTPUT_TOKENS = 900
+OUTPUT_HEADROOM = 1.4
+
+# Fields the Model Does Not Need to See or Return
+SERVER_FIELDS = ("id", "image_url")
+
+# Strip Indentation, Blank Lines and Repeated Spaces
+def compact(text: str) -> str:
+    lines = (" ".join(line.split()) for line in text.splitlines())
+    return "\n".join(line for line in lines if line)
+
+# Rough Token Count (~4 Characters per Token for English and JSON)
+def estimate_tokens(text: str) -> int:
+    return len(text) // 4 + 1
+
+# Output Budget for a Number of Recipes
+def recipe_max_tokens(count: int = 1) -> int:
+    return int(RECIPE_OUTPUT_TOKENS * count * OUTPUT_HEADROOM) + 100
+
+# Previously Generated Titles to Avoid
+def _avoid_text(existing_recipes: List[str] = None) -> str:
+    if not existing_recipes:
+        return ""
+    return f"Must differ from (ingredients, method or dish type): {'; '.join(existing_recipes)}"
+
+# Prompt for One Recipe
+def generate_prompt(preferences: UserPreferences, existing_recipes: List[str] = None) -> str:
+    return compact(f"""
+        Generate a simple, easy to cook, meal prep recipe using common household ingredients for university students.
+        {preferences.to_prompt_string()}
+        {_avoid_text(existing_recipes)}
+        Return ONLY a JSON object: {RECIPE_SCHEMA}
+    """)
+
+# Prompt for Several Distinct Recipes
+def batch_prompt(preferences: UserPreferences, count: int, existing_recipes: List[str] = None) -> str:
+    return compact(f"""
+        Generate {count} different simple, easy to cook, meal prep recipes for one week using common household ingredients for university students.
+        Each recipe must use a different main ingredient and dish type.
+        {preferences.to_prompt_string()}
+        {_avoid_text(existing_recipes)}
+        Return ONLY a JSON object: {{"recipes":[{RECIPE_SCHEMA}, ...]}}
+    """)
+
+# Prompt for Modifying a Recipe
+def modify_prompt(original_recipe: dict, modification: str) -> str:
+    recipe = {key: value for key, value in original_recipe.items() if key not in SERVER_FIELDS}
+    return compact(f"""
+        Recipe: {json.dumps(recipe, separators=(",", ":"))}
+        User wants to modify it: "{modification}"
+        Return ONLY the updated recipe as a JSON object with the same structure, incorporating their changes.
+    """)
+
+# Output Budget for a Modification (Roughly the Size of the Original)
+def modify_max_tokens(original_recipe: dict) -> int:
+    size = estimate_tokens(json.dumps(original_recipe, separators=(",", ":")))
+    return max(int(size * OUTPUT_HEADROOM) + 200, recipe_max_tokens())
+
+# Schema Fragments for Targeted Repair
+FIELD_SCHEMAS = {
+    "title": '"title":str',
+    "description": '"description":str (one sentence)',
+    "cook_time": '"cook_time":int (total minutes)',
+    "servings": '"servings":int',
+    "tags": '"tags":[dish type,main ingredient,secondary ingredient]',
+    "ingredients": '"ingredients":[str with quantity]',
+    "steps": '"steps":[{"step_number":int,"instruction":str}] (complete list)',
+    "macros": '"macros":{"calories":int,"protein":int (g),"carbs":int (g),"fat":int (g)} (per serving)',
+}
+
+# Expected Output Size of Each Field (Tokens)
+FIELD_TOKENS = {"steps": 500, "ingredients": 200, "description": 60, "tags": 30, "macros": 40}
+
+# Schema for the Rest of a Truncated Steps List
+STEPS_TAIL_SCHEMA = '"steps":[{"step_number":int,"instruction":str}] (only the steps after the last given step, numbered on from it)'
+
+# Prompt Asking Only for Missing Recipe Fields (and the Rest of the Steps When They Were Cut Off)
+def repair_prompt(partial_recipe: dict, missing: List[str], continue_steps: bool = False) -> str:
+    schemas = [FIELD_SCHEMAS.get(field, f'"{field}"') for field in missing]
+    if continue_steps:
+        schemas.append(STEPS_TAIL_SCHEMA)
+    schema = ",".join(schemas)
+    return compact(f"""
+        Partial recipe: {json.dumps(partial_recipe, separators=(",", ":"))}
+        Return ONLY a JSON object with the missing fields, consistent with the partial recipe: {{{schema}}}
+    """)
+
+# Output Budget for Missing Fields
+def repair_max_tokens(missing: List[str]) -> int:
+    return int(sum(FIELD_TOKENS.get(field, 30) for field in missing) * OUTPUT_HEADROOM) + 50
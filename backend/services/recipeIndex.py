@@ -0,0 +1,239 @@
+# Imports
+import os
+import re
+import time
+import asyncio
+import sqlite3
+import threading
+import orjson
+from datetime import datetime, timezone
+from typing import Awaitable, Callable, Iterable, List, Optional, Tuple
+
+# Numeric Columns with a Sorted Index per User
+NUMERIC_FIELDS = ("cook_time", "calories", "protein", "carbs", "fat")
+
+# Result Orderings (Relevance Only Applies When There are Search Terms)
+ORDERINGS = {
+    "relevance": "score ASC",
+    "newest": "r.created_at DESC",
+    "cook_time": "r.cook_time ASC",
+    "calories": "r.calories ASC",
+    "protein": "r.protein DESC",
+}
+
+# Column Weights for Ranking (Owner, Title, Tags, Ingredients)
+BM25_WEIGHTS = "0.0, 10.0, 5.0, 1.0"
+
+# Longest Search Phrase Turned into Terms
+MAX_TERMS = 8
+
+# Owner Token Restricting Full-Text Matches to One User's Rows
+def _owner(user_id: str) -> str:
+    return "u" + re.sub(r"[^0-9a-z]", "", user_id.lower())
+
+# Search Phrase as Prefix Terms that Must All Match (Punctuation Never Reaches the FTS Parser)
+def match_terms(text: str) -> List[str]:
+    return [f'"{word}"*' for word in re.findall(r"[0-9a-z]+", text.lower())[:MAX_TERMS]]
+
+# Full-Text and Numeric Index over Each User's Saved and History Recipes
+# (SQLite FTS5 is the Inverted Index; B-Tree Indexes on (user_id, column) are the Sorted Numeric Indexes)
+class RecipeIndex:
+
+    # Constructor
+    def __init__(self, path: str = None):
+        self.path = path or os.getenv("RECIPE_INDEX_PATH", "recipe_index.db")
+        self.lock = threading.Lock()
+        self.loading = {}
+        self.indexed = set()
+        self.stats = {"searches": 0, "search_ms_total": 0.0, "backfills": 0, "indexed": 0, "removed": 0}
+
+        # On-Disk Store (WAL so Every Worker Process Can Share the File)
+        self.db = sqlite3.connect(self.path, timeout=5, isolation_level=None, check_same_thread=False)
+        self.db.execute("PRAGMA journal_mode=WAL")
+        self.db.execute("""
+            CREATE TABLE IF NOT EXISTS recipes (
+                rowid INTEGER PRIMARY KEY,
+                user_id TEXT NOT NULL,
+                recipe_id TEXT NOT NULL,
+                saved INTEGER NOT NULL DEFAULT 0,
+                in_history INTEGER NOT NULL DEFAULT 0,
+                created_at TEXT NOT NULL,
+                cook_time INTEGER,
+                calories INTEGER,
+                protein INTEGER,
+                carbs INTEGER,
+                fat INTEGER,
+                recipe_data BLOB NOT NULL,
+                UNIQUE (user_id, recipe_id)
+            )
+        """)
+        for field in NUMERIC_FIELDS:
+            self.db.execute(f"CREATE INDEX IF NOT EXISTS recipes_{field} ON recipes (user_id, {field})")
+        self.db.execute("CREATE INDEX IF NOT EXISTS recipes_created_at ON recipes (user_id, created_at)")
+        self.db.execute("""
+            CREATE VIRTUAL TABLE IF NOT EXISTS recipes_fts USING fts5(
+                owner, title, tags, ingredients, tokenize = 'porter unicode61 remove_diacritics 2'
+            )
+        """)
+        self.db.execute("CREATE TABLE IF NOT EXISTS indexed_users (user_id TEXT PRIMARY KEY, indexed_at REAL NOT NULL)")
+
+    # Index (recipe_data, source, created_at) Entries for a User; created_at None Means Now
+    # (Idempotent; a Recipe Seen Again Only Gains a Source)
+    def add(self, user_id: str, recipes: Iterable[Tuple[dict, str, Optional[str]]]):
+
+        now = datetime.now(timezone.utc).isoformat()
+        with self.lock:
+            self.db.execute("BEGIN IMMEDIATE")
+            try:
+                for recipe_data, source, created_at in recipes:
+                    self._add(user_id, recipe_data, source, created_at or now)
+                self.db.execute("COMMIT")
+            except BaseException:
+                self.db.execute("ROLLBACK")
+                raise
+
+    def _add(self, user_id: str, recipe_data: dict, source: str, created_at: str):
+
+        recipe_id = recipe_data.get("id")
+        if not recipe_id:
+            return
+        saved, in_history = int(source == "saved"), int(source == "history")
+
+        row = self.db.execute(
+            "SELECT rowid FROM recipes WHERE user_id = ? AND recipe_id = ?", (user_id, recipe_id)
+        ).fetchone()
+        if row is not None:
+            self.db.execute(
+                "UPDATE recipes SET saved = MAX(saved, ?), in_history = MAX(in_history, ?) WHERE rowid = ?",
+                (saved, in_history, row[0])
+            )
+            return
+
+        macros = recipe_data.get("macros") or {}
+        rowid = self.db.execute(
+            """
+            INSERT INTO recipes (user_id, recipe_id, saved, in_history, created_at, cook_time, calories, protein, carbs, fat, recipe_data)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            """,
+            (
+                user_id, recipe_id, saved, in_history, created_at,
+                recipe_data.get("cook_time"), macros.get("calories"), macros.get("protein"),
+                macros.get("carbs"), macros.get("fat"), orjson.dumps(recipe_data)
+            )
+        ).lastrowid
+        self.db.execute(
+            "INSERT INTO recipes_fts (rowid, owner, title, tags, ingredients) VALUES (?, ?, ?, ?, ?)",
+            (
+                rowid, _owner(user_id), recipe_data.get("title") or "",
+                " ".join(recipe_data.get("tags") or []), " ".join(recipe_data.get("ingredients") or [])
+            )
+        )
+        self.stats["indexed"] += 1
+
+    # Drop the Saved Mark, Removing Recipes that are Not Also in History
+    def remove_saved(self, user_id: str, recipe_ids: List[str]):
+
+        if not recipe_ids:
+            return
+        marks = ", ".join("?" for _ in recipe_ids)
+        with self.lock:
+            self.db.execute("BEGIN IMMEDIATE")
+            try:
+                self.db.execute(
+                    f"UPDATE recipes SET saved = 0 WHERE user_id = ? AND recipe_id IN ({marks})", (user_id, *recipe_ids)
+                )
+                orphans = [row[0] for row in self.db.execute(
+                    f"SELECT rowid FROM recipes WHERE user_id = ? AND recipe_id IN ({marks}) AND in_history = 0",
+                    (user_id, *recipe_ids)
+                )]
+                for rowid in orphans:
+                    self.db.execute("DELETE FROM recipes_fts WHERE rowid = ?", (rowid,))
+                    self.db.execute("DELETE FROM recipes WHERE rowid = ?", (rowid,))
+                self.db.execute("COMMIT")
+            except BaseException:
+                self.db.execute("ROLLBACK")
+                raise
+        self.stats["removed"] += len(orphans)
+
+    # Index a User's Existing Recipes Once (Concurrent Callers Share One Load)
+    async def ensure(self, user_id: str, load_recipes: Callable[[str], Awaitable[List[tuple]]]):
+
+        if user_id in self.indexed:
+            return
+        with self.lock:
+            done = self.db.execute("SELECT 1 FROM indexed_users WHERE user_id = ?", (user_id,)).fetchone()
+        if done:
+            self.indexed.add(user_id)
+            return
+
+        task = self.loading.get(user_id)
+        if task is None:
+            task = asyncio.ensure_future(self._backfill(user_id, load_recipes))
+            self.loading[user_id] = task
+            task.add_done_callback(lambda _: self.loading.pop(user_id, None))
+        await asyncio.shield(task)
+
+    async def _backfill(self, user_id: str, load_recipes: Callable[[str], Awaitable[List[tuple]]]):
+        self.add(user_id, await load_recipes(user_id))
+        with self.lock:
+            self.db.execute("INSERT OR REPLACE INTO indexed_users (user_id, indexed_at) VALUES (?, ?)", (user_id, time.time()))
+        self.indexed.add(user_id)
+        self.stats["backfills"] += 1
+
+    # Ranked, Filtered Search over One User's Recipes
+    # (filters Maps min_<field> / max_<field> to Bounds; source is "all", "saved" or "history")
+    def search(self, user_id: str, text: str = "", filters: dict = None, source: str = "all", sort: str = "relevance", limit: int = 20) -> List[dict]:
+
+        start = time.perf_counter()
+        clauses, params = ["r.user_id = ?"], [user_id]
+        if source == "saved":
+            clauses.append("r.saved = 1")
+        elif source == "history":
+            clauses.append("r.in_history = 1")
+        for field in NUMERIC_FIELDS:
+            for bound, operator in (("min", ">="), ("max", "<=")):
+                value = (filters or {}).get(f"{bound}_{field}")
+                if value is not None:
+                    clauses.append(f"r.{field} {operator} ?")
+                    params.append(value)
+
+        # Terms Go Through the Inverted Index; Filters Alone Use the Numeric Indexes
+        terms = match_terms(text or "")
+        if terms:
+            sql = f"""
+                SELECT r.recipe_data, r.saved, r.in_history, bm25(recipes_fts, {BM25_WEIGHTS}) AS score
+                FROM recipes_fts JOIN recipes r ON r.rowid = recipes_fts.rowid
+                WHERE recipes_fts MATCH ? AND {" AND ".join(clauses)}
+            """
+            params.insert(0, f"owner:{_owner(user_id)} AND " + " AND ".join(terms))
+        else:
+            sql = f"SELECT r.recipe_data, r.saved, r.in_history, 0.0 AS score FROM recipes r WHERE {' AND '.join(clauses)}"
+            if sort == "relevance":
+                sort = "newest"
+
+        sql += f" ORDER BY {ORDERINGS[sort]}, r.rowid DESC LIMIT ?"
+        with self.lock:
+            rows = self.db.execute(sql, (*params, limit)).fetchall()
+
+        self.stats["searches"] += 1
+        self.stats["search_ms_total"] += (time.perf_counter() - start) * 1000
+        return [
+            {"recipe_data": orjson.loads(recipe_data), "saved": bool(saved), "in_history": bool(in_history), "score": abs(score)}
+            for recipe_data, saved, in_history, score in rows
+        ]
+
+    # Current Metrics
+    def metrics(self) -> dict:
+        with self.lock:
+            rows = self.db.execute("SELECT COUNT(*) FROM recipes").fetchone()[0]
+            users = self.db.execute("SELECT COUNT(*) FROM indexed_users").fetchone()[0]
+        return {
+            **self.stats,
+            "search_ms_avg": self.stats["search_ms_total"] / (self.stats["searches"] or 1),
+            "rows": rows,
+            "users": users,
+        }
+
+    # Close On-Disk Store
+    def close(self):
+        self.db.close()
@@ -0,0 +1,177 @@
+# Imports
+import json
+from typing import List, Tuple
+from pydantic import ValidationError
+from models.recipe import Recipe, RecipeStep
+
+# Maximum Cut-Back Attempts When Repairing Truncated Output
+MAX_CUT_ATTEMPTS = 64
+
+# Remove Commas Directly Before a Closing Bracket (Outside Strings)
+def remove_trailing_commas(text: str) -> str:
+
+    out = []
+    in_string = False
+    escaped = False
+    pending_comma = None
+
+    for char in text:
+        if in_string:
+            out.append(char)
+            if escaped:
+                escaped = False
+            elif char == "\\":
+                escaped = True
+            elif char == '"':
+                in_string = False
+            continue
+
+        if pending_comma is not None:
+            if char.isspace():
+                pending_comma.append(char)
+                continue
+            if char not in "}]":
+                out.extend(pending_comma)
+            pending_comma = None
+
+        if char == ",":
+            pending_comma = [char]
+            continue
+
+        out.append(char)
+        if char == '"':
+            in_string = True
+
+    if pending_comma is not None:
+        out.extend(pending_comma)
+    return "".join(out)
+
+# Scan from an Opening Brace to its Matching Close
+def _scan(text: str, start: int):
+
+    stack = []
+    in_string = False
+    escaped = False
+    commas = []
+
+    for index in range(start, len(text)):
+        char = text[index]
+
+        if in_string:
+            if escaped:
+                escaped = False
+            elif char == "\\":
+                escaped = True
+            elif char == '"':
+                in_string = False
+            continue
+
+        if char == '"':
+            in_string = True
+        elif char in "{[":
+            stack.append("}" if char == "{" else "]")
+        elif char in "}]":
+            if stack:
+                stack.pop()
+            if not stack:
+                return text[start:index + 1], None
+        elif char == ",":
+            commas.append((index, "".join(reversed(stack))))
+
+    return None, (stack, in_string, commas)
+
+# Close a Truncated Object, Cutting Back to Earlier Commas if Needed
+def _close_truncated(text: str, start: int, stack: list, in_string: bool, commas: list) -> dict:
+
+    # Close at the Point of Truncation
+    body = text[start:] + ('"' if in_string else "")
+    body = body.rstrip().rstrip(",:").rstrip()
+    candidates = [body + "".join(reversed(stack))]
+
+    # Drop the Partial Trailing Element
+    for index, closers in reversed(commas[-MAX_CUT_ATTEMPTS:]):
+        candidates.append(text[start:index] + closers)
+
+    for candidate in candidates:
+        try:
+            value = json.loads(remove_trailing_commas(candidate))
+            if isinstance(value, dict):
+                return value
+        except ValueError:
+            continue
+
+    raise ValueError("Could not repair truncated JSON")
+
+# Parse the First JSON Object in Text, Repairing Common Defects
+def parse_json(text: str) -> dict:
+
+    # Strict Fast Path
+    try:
+        value = json.loads(text)
+        if isinstance(value, dict):
+            return value
+    except ValueError:
+        pass
+
+    # Skip Prose and Code Fences Before the Object
+    start = text.find("{")
+    if start == -1:
+        raise ValueError("No JSON object found")
+
+    # Balanced Object (Ignore Anything After it)
+    complete, state = _scan(text, start)
+    if complete is not None:
+        return json.loads(remove_trailing_commas(complete))
+
+    return _close_truncated(text, start, *state)
+
+# Lenient Parse of a Single JSON Value
+def loads_lenient(text: str):
+    try:
+        return json.loads(text)
+    except ValueError:
+        return json.loads(remove_trailing_commas(text))
+
+# Valid Steps Numbered After a Given Step (Steps Repeating Earlier Ones are Dropped)
+def steps_after(steps, last: int) -> List[dict]:
+    if not isinstance(steps, list):
+        return []
+    tail = []
+    for step in steps:
+        try:
+            step = RecipeStep(**step).model_dump()
+        except (TypeError, ValidationError):
+            continue
+        if step["step_number"] > last:
+            tail.append(step)
+    return tail
+
+# Validate Recipe Data and List Fields that Need Repair
+def validate_recipe(recipe_data: dict) -> Tuple[dict, List[str]]:
+
+    recipe_data = dict(recipe_data)
+
+    # Keep Only Complete Steps (a Truncated Final Step is Dropped)
+    if isinstance(recipe_data.get("steps"), list):
+        steps = []
+        for step in recipe_data["steps"]:
+            try:
+                steps.append(RecipeStep(**step).model_dump())
+            except (TypeError, ValidationError):
+                continue
+        recipe_data["steps"] = steps or None
+
+    # Keep Only String Ingredients and Tags
+    for field in ("ingredients", "tags"):
+        if isinstance(recipe_data.get(field), list):
+            recipe_data[field] = [item for item in recipe_data[field] if isinstance(item, str)] or None
+
+    try:
+        fields = {key: value for key, value in recipe_data.items() if value is not None and key not in ("id", "image_url")}
+        Recipe(id="", image_url="", **fields)
+        return recipe_data, []
+    except ValidationError as e:
+        missing = sorted({str(error["loc"][0]) for error in e.errors() if error["loc"]})
+        for field in missing:
+            recipe_data.pop(field, None)
+        return recipe_data, missing
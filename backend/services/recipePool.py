@@ -0,0 +1,188 @@
+# Imports
+import os
+import time
+import asyncio
+import logging
+from collections import OrderedDict
+from typing import Callable, List, Optional
+from models.recipe import Recipe, UserPreferences
+from services.singleFlight import SingleFlight
+
+logger = logging.getLogger(__name__)
+
+# Pooled Recipe Entry
+class PoolEntry:
+
+    def __init__(self, recipe_data: dict):
+        self.recipe_data = recipe_data
+        self.created_at = time.monotonic()
+        self.serves = 0
+
+# Pool of Generated Recipes Keyed on Preference Levels
+class RecipePool:
+
+    # Constructor
+    def __init__(self, recipe_service):
+        self.recipe_service = recipe_service
+        self.pool_size = int(os.getenv("RECIPE_POOL_SIZE", "5"))
+        self.ttl = float(os.getenv("RECIPE_POOL_TTL", "3600"))
+        self.max_serves = int(os.getenv("RECIPE_POOL_MAX_SERVES", "3"))
+        self.max_keys = int(os.getenv("RECIPE_POOL_MAX_KEYS", "243"))
+        self.refill_concurrency = int(os.getenv("RECIPE_POOL_REFILL_CONCURRENCY", "2"))
+        self.hot_window = float(os.getenv("RECIPE_POOL_HOT_WINDOW", "900"))
+
+        # Least Recently Used Key First
+        self.pools: "OrderedDict[tuple, List[PoolEntry]]" = OrderedDict()
+        self.requested = {}
+        self.refill_needed = asyncio.Event()
+        self.worker: Optional[asyncio.Task] = None
+        self.generate_flight = SingleFlight("generate")
+        self.stats = {"hits": 0, "misses": 0, "refills": 0, "refill_errors": 0, "evictions": 0}
+
+    # Cache Key for a Set of Preferences
+    @staticmethod
+    def key(preferences: UserPreferences) -> tuple:
+        return (
+            preferences.effort_level,
+            preferences.skill_level,
+            preferences.calorie_consciousness,
+            preferences.protein_preference,
+            preferences.spice_level,
+        )
+
+    # Get Fresh Entries for Key (Optionally Marking it Recently Used)
+    def _entries(self, key: tuple, touch: bool = True) -> List[PoolEntry]:
+
+        now = time.monotonic()
+        entries = [
+            entry for entry in self.pools.get(key, [])
+            if now - entry.created_at < self.ttl and entry.serves < self.max_serves
+        ]
+        self.pools[key] = entries
+        if touch:
+            self.pools.move_to_end(key)
+
+        # Evict Least Recently Used Keys
+        while len(self.pools) > self.max_keys:
+            evicted, _ = self.pools.popitem(last=False)
+            self.requested.pop(evicted, None)
+            self.stats["evictions"] += 1
+
+        return entries
+
+    # Add a Validated Recipe to the Pool
+    def add(self, preferences: UserPreferences, recipe_data: dict):
+
+        # Validate Before Pooling
+        Recipe(id="", image_url="", **recipe_data)
+
+        entries = self._entries(self.key(preferences))
+        if len(entries) < self.pool_size:
+            entries.append(PoolEntry(recipe_data))
+
+    # Take a Pooled Recipe the User has Not Seen (or a Near-Duplicate of)
+    def take(self, preferences: UserPreferences, exclude_titles: List[str] = None, is_duplicate: Callable[[dict], bool] = None) -> Optional[dict]:
+
+        key = self.key(preferences)
+        self.requested[key] = (preferences, time.monotonic())
+        entries = self._entries(key)
+        excluded = {title.lower() for title in exclude_titles or []}
+
+        # Least Served Unseen Entry
+        candidates = [
+            entry for entry in entries
+            if entry.recipe_data["title"].lower() not in excluded
+            and not (is_duplicate and is_duplicate(entry.recipe_data))
+        ]
+        if len(entries) < self.pool_size:
+            self.refill_needed.set()
+        if not candidates:
+            self.stats["misses"] += 1
+            return None
+
+        entry = min(candidates, key=lambda entry: entry.serves)
+        entry.serves += 1
+        self.stats["hits"] += 1
+        return dict(entry.recipe_data)
+
+    # Serve from Pool or Generate a Fresh Recipe
+    async def get_recipe(self, preferences: UserPreferences, existing_recipes: List[str] = None, is_duplicate: Callable[[dict], bool] = None) -> dict:
+
+        pooled = self.take(preferences, existing_recipes, is_duplicate)
+        if pooled is not None:
+            return pooled
+
+        # Concurrent Misses for the Same Key Share One Generation
+        recipe_data = await self.generate_flight.do(
+            self.key(preferences),
+            lambda: self._generate(preferences, existing_recipes)
+        )
+
+        # Shared Result Already Seen by this User
+        excluded = {title.lower() for title in existing_recipes or []}
+        if recipe_data["title"].lower() in excluded or (is_duplicate and is_duplicate(recipe_data)):
+            recipe_data = await self._generate(preferences, existing_recipes)
+        return dict(recipe_data)
+
+    # Generate a Fresh Recipe and Pool it
+    async def _generate(self, preferences: UserPreferences, existing_recipes: List[str] = None) -> dict:
+
+        recipe_data = await self.recipe_service.generate_recipe(
+            preferences=preferences,
+            existing_recipes=existing_recipes
+        )
+        try:
+            self.add(preferences, recipe_data)
+        except Exception:
+            pass
+        return recipe_data
+
+    # Generate One Recipe into the Pool
+    async def _refill_one(self, preferences: UserPreferences, semaphore: asyncio.Semaphore):
+        async with semaphore:
+            try:
+                recipe_data = await self.recipe_service.generate_recipe(preferences=preferences)
+                self.add(preferences, recipe_data)
+                self.stats["refills"] += 1
+            except Exception as e:
+                self.stats["refill_errors"] += 1
+                logger.warning("Recipe pool refill failed: %s", e)
+
+    # Background Worker Keeping Requested Keys Topped Up
+    async def _refill_loop(self):
+
+        semaphore = asyncio.Semaphore(self.refill_concurrency)
+        while True:
+            await self.refill_needed.wait()
+            self.refill_needed.clear()
+
+            # Hot Keys Only, Most Recently Used First
+            jobs = []
+            now = time.monotonic()
+            for key in reversed(list(self.pools)):
+                preferences, requested_at = self.requested.get(key, (None, 0))
+                if preferences is None or now - requested_at > self.hot_window:
+                    continue
+                deficit = self.pool_size - len(self._entries(key, touch=False))
+                jobs.extend(self._refill_one(preferences, semaphore) for _ in range(deficit))
+            await asyncio.gather(*jobs)
+
+    # Start Background Worker
+    def start(self):
+        if self.worker is None:
+            self.worker = asyncio.create_task(self._refill_loop())
+
+    # Stop Background Worker
+    async def stop(self):
+        if self.worker is not None:
+            self.worker.cancel()
+            await asyncio.gather(self.worker, return_exceptions=True)
+            self.worker = None
+
+    # Current Metrics
+    def metrics(self) -> dict:
+        return {
+            **self.stats,
+            "keys": len(self.pools),
+            "entries": sum(len(entries) for entries in self.pools.values()),
+        }
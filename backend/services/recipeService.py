@@ -1,109 +1,336 @@
 # Imports
 import os
 import json
-from groq import Groq
-from dotenv import load_dotenv
-from typing import List
+import time
+import logging
+from groq import AsyncGroq, BadRequestError, RateLimitError, InternalServerError, APIConnectionError, APITimeoutError
+from typing import AsyncIterator, List, Optional
 from models.recipe import UserPreferences
+from services.httpClient import create_client
+from services.nutritionEngine import NutritionEngine
+from services.stubProviders import STUB_MODE, StubLLMClient
+from services.singleFlight import SingleFlight
+from services.telemetry import span, record_tokens
+from services.upstreamGovernor import UpstreamGovernor, UpstreamUnavailable
+from services import promptBuilder, recipeParser
 
-# Load Environment Variables
-load_dotenv()
+logger = logging.getLogger(__name__)
+
+# Models
+DEFAULT_MODEL = "llama-3.3-70b-versatile"
+JSON_MODE_MODELS = {"llama-3.3-70b-versatile", "llama-3.1-8b-instant"}
+
+# Largest Completion Each Model Accepts (Unlisted Models Assume the Smallest)
+MODEL_MAX_OUTPUT_TOKENS = {"llama-3.3-70b-versatile": 32768, "llama-3.1-8b-instant": 8192}
+DEFAULT_MAX_OUTPUT_TOKENS = 8192
+
+# Model Tiers (Overridable by Environment)
+MODEL_TIERS = {
+    "fast": os.getenv("GROQ_FAST_MODEL", "llama-3.1-8b-instant"),
+    "large": os.getenv("GROQ_LARGE_MODEL", DEFAULT_MODEL),
+}
+
+# Upstream Errors that Move a Request to the Next Model
+FALLBACK_ERRORS = (RateLimitError, InternalServerError, APIConnectionError, APITimeoutError, UpstreamUnavailable)
+
+# Output Groq Rejected in JSON Mode (a ValueError, so Invalid Output Handling Applies)
+class InvalidJSONOutput(ValueError):
+
+    # Constructor
+    def __init__(self, model: str, content: str):
+        super().__init__(f"{model} output failed JSON validation")
+        self.model = model
+        self.content = content
+
+# Rejected Generation from a json_validate_failed Error, or None for Other Bad Requests
+def _failed_generation(error: BadRequestError) -> Optional[str]:
+    body = error.body if isinstance(error.body, dict) else {}
+    if isinstance(body.get("error"), dict):
+        body = body["error"]
+    if body.get("code") != "json_validate_failed":
+        return None
+    return body.get("failed_generation") or ""
+
+# Groq Quota per Model (Free Tier: 30 Requests per Minute)
+GROQ_RATE = 0.5
+GROQ_BURST = 30
+
+# Model Routing Layer
+class ModelRouter:
+
+    # Constructor
+    def __init__(self):
+        self.fast_max_words = int(os.getenv("ROUTER_FAST_MAX_WORDS", "8"))
+        self.stats = {}
+
+    # Function to Pick a Tier for a Task
+    def classify(self, task: str, modification: str = None) -> str:
+
+        # Short Single-Change Modifications ("make it vegetarian", "less spicy")
+        if task == "modify" and modification:
+            words = modification.split()
+            if len(words) <= self.fast_max_words and " and " not in modification and "," not in modification:
+                return "fast"
+
+        return "large"
+
+    # Models to Try in Order, Starting with the Chosen Tier
+    def route(self, tier: str) -> list:
+        models = [MODEL_TIERS[tier]]
+        models += [model for model in MODEL_TIERS.values() if model not in models]
+        return models
+
+    # Largest Output Every Model on a Tier's Route Accepts (a Fallback Must Not Reject the Same Request)
+    def max_output_tokens(self, tier: str) -> int:
+        return min(MODEL_MAX_OUTPUT_TOKENS.get(model, DEFAULT_MAX_OUTPUT_TOKENS) for model in self.route(tier))
+
+    # Record Outcome of a Call
+    def record(self, model: str, outcome: str, latency_ms: float = None):
+        stats = self.stats.setdefault(model, {
+            "requests": 0, "success": 0, "upstream_errors": 0, "rejected_output": 0, "validation_failures": 0, "latency_ms_total": 0.0
+        })
+        if outcome == "validation_failures":
+            stats[outcome] += 1
+            return
+        stats["requests"] += 1
+        stats[outcome] += 1
+        if latency_ms is not None:
+            stats["latency_ms_total"] += latency_ms
+
+    # Current Metrics
+    def metrics(self) -> dict:
+        return {
+            model: {**stats, "latency_ms_avg": stats["latency_ms_total"] / stats["requests"] if stats["requests"] else 0.0}
+            for model, stats in self.stats.items()
+        }
 
 # Recipe Service Class
 class recipeService:
 
     # Constructor
-    def __init__(self):
-        self.client = Groq(api_key=os.getenv("GROQ_API_KEY"))
+    def __init__(self, client=None):
+        self.client = client or self._default_client()
+        self.router = ModelRouter()
+        self.modify_flight = SingleFlight("modify")
+        self.nutrition = NutritionEngine()
+        self.governors = {}
+        self.usage = {"requests": 0, "prompt_tokens": 0, "completion_tokens": 0, "salvaged": 0, "parse_failures": 0, "field_repairs": 0}
+    
+    # Groq Client, or the Local Stand-In When UPSTREAM_MODE=stub
+    @staticmethod
+    def _default_client():
+        if STUB_MODE:
+            return StubLLMClient()
+        return AsyncGroq(
+            api_key=os.getenv("GROQ_API_KEY"),
+            http_client=create_client("groq", timeout=60),
+            max_retries=int(os.getenv("GROQ_MAX_RETRIES", "0"))
+        )
+    
+    # Rate Limiter and Circuit Breaker for a Model (Groq Quotas are per Model)
+    def _governor(self, model: str) -> UpstreamGovernor:
+        if model not in self.governors:
+            self.governors[model] = UpstreamGovernor(
+                f"groq:{model}",
+                rate=GROQ_RATE,
+                burst=GROQ_BURST,
+                max_wait=2,
+                transient_errors=(APIConnectionError, APITimeoutError),
+                env_name="groq"
+            )
+        return self.governors[model]
+    
+    # Request Options for JSON Output Where the Model Supports It
+    def _json_mode(self, model: str) -> dict:
+        if model in JSON_MODE_MODELS:
+            return {"response_format": {"type": "json_object"}}
+        return {}
+    
+    # Function to Call the First Available Model on a Tier's Route
+    async def _create(self, prompt: str, temperature: float, max_tokens: int, tier: str):
+        
+        models = self.router.route(tier)
+        max_tokens = min(max_tokens, self.router.max_output_tokens(tier))
+        for index, model in enumerate(models):
+            start = time.perf_counter()
+            try:
+                
+                # Make Request to Groq
+                with span("groq", "chat", model=model, tier=tier):
+                    response = await self._governor(model).call(lambda: self.client.chat.completions.create(
+                        model=model,
+                        messages=[{"role": "user", "content": prompt}],
+                        temperature=temperature,
+                        max_tokens=max_tokens,
+                        **self._json_mode(model)
+                    ))
+                self.router.record(model, "success", (time.perf_counter() - start) * 1000)
+                return model, response
+            
+            # JSON Mode Rejections Still Carry the Generated Text
+            except BadRequestError as e:
+                content = _failed_generation(e)
+                if content is None:
+                    raise
+                self.router.record(model, "rejected_output", (time.perf_counter() - start) * 1000)
+                raise InvalidJSONOutput(model, content) from e
+            
+            # Fall Back on Rate Limits and Provider Errors
+            except FALLBACK_ERRORS as e:
+                self.router.record(model, "upstream_errors", (time.perf_counter() - start) * 1000)
+                if index == len(models) - 1:
+                    raise
+                logger.warning("Model %s failed (%s), falling back to %s", model, type(e).__name__, models[index + 1])
+    
+    # Function to Run a Completion and Parse its JSON
+    async def _complete(self, prompt: str, temperature: float, max_tokens: int, tier: str = "large") -> dict:
+        
+        try:
+            model, response = await self._create(prompt, temperature, max_tokens, tier)
+        
+        # Groq Rejected Malformed or Truncated JSON, so Salvage the Text it Returned
+        except InvalidJSONOutput as e:
+            self.usage["requests"] += 1
+            model, content = e.model, e.content
+        
+        else:
+            
+            # Record Token Usage
+            self.usage["requests"] += 1
+            if response.usage:
+                self.usage["prompt_tokens"] += response.usage.prompt_tokens
+                self.usage["completion_tokens"] += response.usage.completion_tokens
+                record_tokens(model, response.usage.prompt_tokens, response.usage.completion_tokens)
+            content = response.choices[0].message.content
+        
+        # Parse the JSON Response
+        try:
+            return json.loads(content)
+        except ValueError:
+            pass
+        
+        # Salvage Malformed Output Without Regenerating
+        try:
+            data = recipeParser.parse_json(content)
+            self.usage["salvaged"] += 1
+            return data
+        except ValueError:
+            self.usage["parse_failures"] += 1
+            self.router.record(model, "validation_failures")
+            raise
+    
+    # Function to Complete a Recipe on a Tier, Escalating to the Large Tier on Invalid Output
+    # (Including Output Groq Rejected in JSON Mode that Could Not be Salvaged)
+    async def _complete_recipe(self, prompt: str, temperature: float, max_tokens: int, tier: str) -> dict:
+        
+        if tier != "large":
+            try:
+                recipe_data = await self._complete(prompt, temperature, max_tokens, tier)
+                _, missing = recipeParser.validate_recipe(recipe_data)
+                if not missing:
+                    return self.nutrition.verify([recipe_data])[0]
+                self.router.record(MODEL_TIERS[tier], "validation_failures")
+            except ValueError:
+                pass
+        
+        return await self.ensure_complete(await self._complete(prompt, temperature, max_tokens, "large"))
+    
+    # Function to Validate a Recipe, Fill Missing Fields with a Targeted Request and Check its Macros
+    # (partial_steps: the Steps Were Cut Off, so Only Those After the Last One are Requested and Appended)
+    async def ensure_complete(self, recipe_data: dict, partial_steps: bool = False) -> dict:
+        
+        recipe_data, missing = recipeParser.validate_recipe(recipe_data)
+        continue_steps = partial_steps and "steps" not in missing
+        if not missing and not continue_steps:
+            return self.nutrition.verify([recipe_data])[0]
+        
+        # Ask Only for the Missing Fields
+        self.usage["field_repairs"] += 1
+        prompt = promptBuilder.repair_prompt(recipe_data, missing, continue_steps)
+        max_tokens = promptBuilder.repair_max_tokens(missing + ["steps"] if continue_steps else missing)
+        patch = await self._complete(prompt, temperature=0.3, max_tokens=max_tokens, tier="fast")
+        
+        # Merge Only What was Asked For (Fields Already Streamed to the Client Stay as Sent)
+        repaired = {field: patch[field] for field in missing if field in patch}
+        if continue_steps:
+            repaired["steps"] = recipe_data["steps"] + recipeParser.steps_after(patch.get("steps"), recipe_data["steps"][-1]["step_number"])
+        
+        recipe_data, missing = recipeParser.validate_recipe({**recipe_data, **repaired})
+        if missing:
+            raise ValueError(f"Recipe is missing fields: {', '.join(missing)}")
+        return self.nutrition.verify([recipe_data])[0]
     
     # Function to Generate Recipe
-    def generate_recipe(self, preferences: UserPreferences, existing_recipes: List[str] = None) -> dict:
-
-        # Convert Existing Recipes to String
-        existing_recipes_text = ""
-        if existing_recipes and len(existing_recipes) > 0:
-            existing_recipes_text = f"""
-            The user has already generated these recipes:
-            {', '.join(existing_recipes)}
-            Ensure the recipe is unique from these previously generated recipes.
-            Choose different ingredients, cooking methods, or dish type.
-            """
-        
-        # Convert Preferences to String
-        preferences_text = preferences.to_prompt_string()
-        
-        # Create Prompt
-        prompt = f"""
-        Generate an simple, easy to cook, meal prep recipe based on these preferences:
-        Return ONLY valid JSON with this exact structure (no markdown, no extra text):
-
-        {{
-            "title": "Recipe Name/Name of Dish",
-            "description": "A one sentence description",
-            "cook_time": (int) total cook time in minutes,
-            "tags": ["dish type", "main ingredient", "secondary ingredient"],
-            "ingredients": ["ingredient with quantity", ...],
-            "steps": [
-                {{"step_number": 1, "instruction": "First step..."}},
-                {{"step_number": 2, "instruction": "Second step..."}}
-            ],
-            "macros": {{
-                "calories": (int) total calories,
-                "protein": (int) grams of protein,
-                "carbs": (int) grams of carbs,
-                "fat": (int) grams of fat
-            }}
-        }}
-
-        {preferences_text}
-        {existing_recipes_text}
-        The recipe should include common household ingredients for university students.
-        Return ONLY the JSON object."""
-
-        # Make Request to Groq
-        response = self.client.chat.completions.create(
-            model="llama-3.3-70b-versatile",
-            messages=[{"role": "user", "content": prompt}],
+    async def generate_recipe(self, preferences: UserPreferences, existing_recipes: List[str] = None) -> dict:
+
+        prompt = promptBuilder.generate_prompt(preferences, existing_recipes)
+        return await self._complete_recipe(
+            prompt,
             temperature=0.9,
-            max_tokens=2000,
+            max_tokens=promptBuilder.recipe_max_tokens(),
+            tier=self.router.classify("generate")
         )
+    
+    # Function to Generate Several Distinct Recipes in One Request
+    async def generate_recipes(self, preferences: UserPreferences, count: int, existing_recipes: List[str] = None) -> List[dict]:
+
+        prompt = promptBuilder.batch_prompt(preferences, count, existing_recipes)
+        batch = await self._complete(prompt, temperature=0.9, max_tokens=promptBuilder.recipe_max_tokens(count))
         
-        # Parse the JSON Response
-        content = response.choices[0].message.content.strip()
-        if content.startswith("```"):
-            content = content.split("```")[1]
-            if content.startswith("json"):
-                content = content[4:]
-        recipe_data = json.loads(content)
-        
-        return recipe_data
+        # Check the Whole Batch's Macros in One Vectorised Pass
+        return self.nutrition.verify(batch.get("recipes", []))
     
-    # Function to Modify Recipe
-    def modify_recipe(self, original_recipe: dict, modification: str) -> dict:
-        
-        # Create Prompt
-        prompt = f"""
-        Here's a recipe:
-        {json.dumps(original_recipe, indent=2)}
-        User wants to modify it: "{modification}"
-
-        Return ONLY the updated JSON with the same structure, incorporating their changes.
-        No markdown, just the JSON object."""
-
-        # Make Request to Groq
-        response = self.client.chat.completions.create(
-            model="llama-3.3-70b-versatile",
-            messages=[{"role": "user", "content": prompt}],
+    # Function to Stream Recipe Generation as Text Chunks
+    async def stream_recipe(self, preferences: UserPreferences, existing_recipes: List[str] = None) -> AsyncIterator[str]:
+
+        prompt = promptBuilder.generate_prompt(preferences, existing_recipes)
+        
+        # Make Streaming Request to Groq (JSON Mode Does Not Support Streaming; the Incremental Parser Skips Prose)
+        with span("groq", "stream", model=MODEL_TIERS["large"]):
+            stream = await self._governor(MODEL_TIERS["large"]).call(lambda: self.client.chat.completions.create(
+                model=MODEL_TIERS["large"],
+                messages=[{"role": "user", "content": prompt}],
+                temperature=0.9,
+                max_tokens=promptBuilder.recipe_max_tokens(),
+                stream=True
+            ))
+        self.usage["requests"] += 1
+        
+        # Yield Content Deltas
+        async for chunk in stream:
+            if chunk.choices and chunk.choices[0].delta.content:
+                yield chunk.choices[0].delta.content
+            
+            # Final Chunk Carries Token Usage
+            if chunk.x_groq and chunk.x_groq.usage:
+                self.usage["prompt_tokens"] += chunk.x_groq.usage.prompt_tokens
+                self.usage["completion_tokens"] += chunk.x_groq.usage.completion_tokens
+                record_tokens(MODEL_TIERS["large"], chunk.x_groq.usage.prompt_tokens, chunk.x_groq.usage.completion_tokens)
+    
+    # Function to Modify Recipe (Identical Concurrent Requests Share One Call)
+    async def modify_recipe(self, original_recipe: dict, modification: str) -> dict:
+        
+        key = (json.dumps(original_recipe, sort_keys=True), modification.strip().lower())
+        return await self.modify_flight.do(key, lambda: self._modify_recipe(original_recipe, modification))
+    
+    # Function to Make Modification Request
+    async def _modify_recipe(self, original_recipe: dict, modification: str) -> dict:
+        
+        prompt = promptBuilder.modify_prompt(original_recipe, modification)
+        modified_data = await self._complete_recipe(
+            prompt,
             temperature=0.7,
-            max_tokens=2000,
+            max_tokens=promptBuilder.modify_max_tokens(original_recipe),
+            tier=self.router.classify("modify", modification)
         )
         
-        # Parse the JSON Response
-        content = response.choices[0].message.content.strip()
-        if content.startswith("```"):
-            content = content.split("```")[1]
-            if content.startswith("json"):
-                content = content[4:]
-        modified_data = json.loads(content)
+        # Restore Fields Not Sent to the Model
+        for field in promptBuilder.SERVER_FIELDS:
+            if field in original_recipe:
+                modified_data.setdefault(field, original_recipe[field])
 
         return modified_data
+
+    # Close Underlying HTTP Client
+    async def close(self):
+        await self.client.close()
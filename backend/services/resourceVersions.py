@@ -0,0 +1,80 @@
+# Imports
+import os
+import hashlib
+import threading
+from typing import Optional
+from services.cache import MISSING
+from services.sharedCache import create_cache
+
+# Version Tokens (Random per Change, so a Restart or Eviction Can Never Reissue an Old ETag)
+VERSION_CACHE_TTL = float(os.getenv("VERSION_CACHE_TTL", "86400"))
+_versions = None
+_versions_lock = threading.Lock()
+_stats = {"checks": 0, "not_modified": 0, "bumps": 0}
+
+# Open the Version Store on First Use, so Each Worker Process Gets its Own Connection
+def _cache():
+    global _versions
+    if _versions is None:
+        _versions = create_cache(
+            "versions",
+            maxsize=int(os.getenv("VERSION_CACHE_SIZE", "100000")),
+            ttl=VERSION_CACHE_TTL
+        )
+    return _versions
+
+# Fresh Version Token
+def _token() -> str:
+    return os.urandom(8).hex()
+
+# Current Version of a User's Resource ("history", "saved", "preferences"; Unknown Versions Start a New One)
+def current(user_id: str, resource: str) -> str:
+    key = f"{resource}:{user_id}"
+    with _versions_lock:
+        version = _cache().get(key)
+        if version is MISSING:
+            version = _token()
+            _cache().set(key, version)
+    return version
+
+# Mark a User's Resource Changed and Return its New Version
+# (Call After the Write Succeeds, Including Out-of-Band Writes Such as Maintenance Scripts)
+def bump(user_id: str, resource: str) -> str:
+    version = _token()
+    with _versions_lock:
+        _cache().set(f"{resource}:{user_id}", version)
+    _stats["bumps"] += 1
+    return version
+
+# Weak ETag for One View of a Resource (variant Holds Query Parameters that Change the Body)
+# (Taken Before Fetching, so a Write Landing Mid-Fetch Costs One Extra Refetch, Never a Stale 304)
+def etag(user_id: str, resource: str, *variant) -> str:
+    digest = hashlib.blake2b(repr(variant).encode(), digest_size=4).hexdigest()
+    return f'W/"{current(user_id, resource)}.{digest}"'
+
+# True When an If-None-Match Header Already Holds the ETag
+def not_modified(if_none_match: Optional[str], tag: str) -> bool:
+    _stats["checks"] += 1
+    if not if_none_match:
+        return False
+    candidates = {candidate.strip() for candidate in if_none_match.split(",")}
+    matched = "*" in candidates or tag in candidates or tag[2:] in candidates
+    _stats["not_modified"] += matched
+    return matched
+
+# Headers Sent with Full and 304 Responses (Clients Keep the Body but Revalidate Every Time)
+def headers(tag: str) -> dict:
+    return {"ETag": tag, "Cache-Control": "private, no-cache"}
+
+# Version Store Metrics
+def metrics() -> dict:
+    with _versions_lock:
+        return {**_stats, **_cache().metrics()}
+
+# Close the Version Store
+def close():
+    global _versions
+    with _versions_lock:
+        if _versions is not None:
+            _versions.close()
+            _versions = None
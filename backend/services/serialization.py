@@ -0,0 +1,20 @@
+# Imports
+import orjson
+from typing import Any
+from pydantic import BaseModel
+from fastapi.responses import ORJSONResponse
+
+# JSON Response Serialized in One Pass
+# (Pydantic Models via their Compiled Serializer, Everything Else via orjson)
+class FastJSONResponse(ORJSONResponse):
+
+    def render(self, content: Any) -> bytes:
+        if isinstance(content, BaseModel):
+            return content.__pydantic_serializer__.to_json(content)
+        if isinstance(content, bytes):
+            return content
+        return orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS)
+
+# Compact JSON Text (for SSE Payloads)
+def dumps(value: Any) -> str:
+    return orjson.dumps(value).decode()
@@ -0,0 +1,131 @@
+# Imports
+import os
+import time
+import sqlite3
+import threading
+import multiprocessing
+import orjson
+from typing import Any, Hashable, Optional
+from services.cache import TTLCache, MISSING
+
+# Writes Between Sweeps of Expired and Overflowing Entries
+PRUNE_EVERY = 256
+
+# TTLCache-Compatible Store in a SQLite File Shared by Every Worker Process on the Host
+# (Values Must be JSON-Serialisable; Keys are Strings or Bytes)
+class SharedCache:
+
+    # Constructor
+    def __init__(self, namespace: str, maxsize: int = 1024, ttl: float = 300, path: str = None, local_ttl: float = 0):
+        self.namespace = namespace
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.path = path or os.getenv("SHARED_CACHE_PATH", "shared_cache.db")
+        self.stats = {"hits": 0, "misses": 0, "evictions": 0, "local_hits": 0}
+        self.writes = 0
+        self.lock = threading.Lock()
+
+        # Per-Process Copy for Entries that Never Change Once Written (0 Disables)
+        self.local = TTLCache(maxsize=maxsize, ttl=local_ttl) if local_ttl > 0 else None
+
+        # WAL Lets Workers Read While Another Writes; Writers Wait on the Busy Timeout
+        self.db = sqlite3.connect(self.path, timeout=5, isolation_level=None, check_same_thread=False)
+        self.db.execute("PRAGMA journal_mode=WAL")
+        self.db.execute("PRAGMA synchronous=NORMAL")
+        self.db.execute("""
+            CREATE TABLE IF NOT EXISTS cache_entries (
+                namespace TEXT NOT NULL,
+                key BLOB NOT NULL,
+                value BLOB NOT NULL,
+                expires_at REAL NOT NULL,
+                PRIMARY KEY (namespace, key)
+            ) WITHOUT ROWID
+        """)
+        self.db.execute("CREATE INDEX IF NOT EXISTS cache_entries_expiry ON cache_entries (namespace, expires_at)")
+
+    # Get Value or MISSING if Absent or Expired
+    def get(self, key: Hashable) -> Any:
+
+        if self.local is not None:
+            value = self.local.get(key)
+            if value is not MISSING:
+                self.stats["local_hits"] += 1
+                return value
+
+        now = time.time()
+        with self.lock:
+            row = self.db.execute(
+                "SELECT value, expires_at FROM cache_entries WHERE namespace = ? AND key = ?", (self.namespace, key)
+            ).fetchone()
+        if row is None or row[1] <= now:
+            self.stats["misses"] += 1
+            return MISSING
+
+        value = orjson.loads(row[0])
+        if self.local is not None:
+            self.local.set(key, value, ttl=min(self.local.ttl, row[1] - now))
+        self.stats["hits"] += 1
+        return value
+
+    # Store Value with Default or Custom TTL
+    def set(self, key: Hashable, value: Any, ttl: Optional[float] = None):
+
+        ttl = self.ttl if ttl is None else ttl
+        if self.local is not None:
+            self.local.set(key, value, ttl=min(self.local.ttl, ttl))
+
+        with self.lock:
+            self.db.execute(
+                "INSERT OR REPLACE INTO cache_entries (namespace, key, value, expires_at) VALUES (?, ?, ?, ?)",
+                (self.namespace, key, orjson.dumps(value), time.time() + ttl)
+            )
+            self.writes += 1
+            if self.writes % PRUNE_EVERY == 0:
+                self._prune()
+
+    # Remove Entry (Other Workers' Local Copies Expire on their Own)
+    def delete(self, key: Hashable):
+        if self.local is not None:
+            self.local.delete(key)
+        with self.lock:
+            self.db.execute("DELETE FROM cache_entries WHERE namespace = ? AND key = ?", (self.namespace, key))
+
+    # Drop Expired Entries, then the Soonest-Expiring Beyond maxsize
+    def _prune(self):
+        self.db.execute(
+            "DELETE FROM cache_entries WHERE namespace = ? AND expires_at <= ?", (self.namespace, time.time())
+        )
+        evicted = self.db.execute("""
+            DELETE FROM cache_entries WHERE namespace = ? AND key IN (
+                SELECT key FROM cache_entries WHERE namespace = ? ORDER BY expires_at DESC LIMIT -1 OFFSET ?
+            )
+        """, (self.namespace, self.namespace, self.maxsize)).rowcount
+        self.stats["evictions"] += max(evicted, 0)
+
+    # Current Metrics
+    def metrics(self) -> dict:
+        with self.lock:
+            size = self.db.execute(
+                "SELECT COUNT(*) FROM cache_entries WHERE namespace = ?", (self.namespace,)
+            ).fetchone()[0]
+        return {**self.stats, "size": size}
+
+    # Close Connection
+    def close(self):
+        self.db.close()
+
+# Whether Caches Must be Shared: SHARED_CACHE_PATH is Set, or More than One Worker is Configured
+# (serve.py's UPSTREAM_WORKERS, WEB_CONCURRENCY, or a Process Spawned by Uvicorn's --workers, Which Runs as a multiprocessing Child)
+# Per-Process Copies Would Let One Worker Answer 304 or Serve Preferences After Another Worker Took a Write
+def shared_enabled() -> bool:
+    if os.getenv("SHARED_CACHE_PATH"):
+        return True
+    workers = int(os.getenv("UPSTREAM_WORKERS", os.getenv("WEB_CONCURRENCY", "1")))
+    return workers > 1 or multiprocessing.parent_process() is not None
+
+# Shared Store When Caches Must be Shared (in SHARED_CACHE_PATH, or shared_cache.db in the Working Directory),
+# Otherwise a Per-Process TTLCache
+def create_cache(namespace: str, maxsize: int, ttl: float, local_ttl: float = 0):
+    if shared_enabled():
+        return SharedCache(namespace, maxsize=maxsize, ttl=ttl, local_ttl=local_ttl)
+    return TTLCache(maxsize=maxsize, ttl=ttl)
@@ -0,0 +1,36 @@
+# Imports
+import asyncio
+from typing import Awaitable, Callable, Hashable
+
+# Registry of Single-Flight Groups for Metrics
+flight_groups = {}
+
+# Share One Upstream Call Between Concurrent Identical Requests
+class SingleFlight:
+
+    # Constructor
+    def __init__(self, name: str):
+        self.name = name
+        self.in_flight = {}
+        self.stats = {"calls": 0, "coalesced": 0}
+        flight_groups[name] = self
+
+    # Run func Once per Key While a Call for that Key is in Flight
+    async def do(self, key: Hashable, func: Callable[[], Awaitable]):
+
+        self.stats["calls"] += 1
+        future = self.in_flight.get(key)
+
+        if future is None:
+            future = asyncio.ensure_future(func())
+            self.in_flight[key] = future
+            future.add_done_callback(lambda _: self.in_flight.pop(key, None))
+        else:
+            self.stats["coalesced"] += 1
+
+        # Shield so One Cancelled Caller Does Not Cancel the Others
+        return await asyncio.shield(future)
+
+# Coalescing Metrics
+def metrics() -> dict:
+    return {name: {**group.stats, "in_flight": len(group.in_flight)} for name, group in flight_groups.items()}
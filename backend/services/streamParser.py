@@ -0,0 +1,111 @@
+# Imports
+import json
+from services.recipeParser import loads_lenient
+from typing import List, Tuple
+
+# Incremental Parser for a Streamed Recipe JSON Object
+class RecipeStreamParser:
+
+    # Constructor
+    def __init__(self):
+        self.buffer = ""
+        self.position = 0
+        self.depth = 0
+        self.in_string = False
+        self.escaped = False
+        self.started = False
+        self.done = False
+
+        # Current Top-Level Field
+        self.key = None
+        self.key_start = None
+        self.value_start = None
+
+        # Current Element of the Steps Array
+        self.step_start = None
+
+        # Parsed Fields (Steps are Appended as Each One is Emitted; Malformed Fields and Steps are Left Out for Repair)
+        self.fields = {}
+
+    # Whether the Stream Stopped Inside the Steps Array (Steps Already Emitted are Kept; the Rest is Missing)
+    @property
+    def steps_truncated(self) -> bool:
+        return not self.done and self.key == "steps" and self.value_start is not None
+
+    # Feed a Chunk and Return Completed (event, value) Pairs
+    def feed(self, chunk: str) -> List[Tuple[str, object]]:
+
+        events = []
+        self.buffer += chunk
+
+        while self.position < len(self.buffer) and not self.done:
+            char = self.buffer[self.position]
+            index = self.position
+            self.position += 1
+
+            # Skip Prose or Code Fences Before the Object
+            if not self.started:
+                if char == "{":
+                    self.started = True
+                    self.depth = 1
+                continue
+
+            # String Contents
+            if self.in_string:
+                if self.escaped:
+                    self.escaped = False
+                elif char == "\\":
+                    self.escaped = True
+                elif char == '"':
+                    self.in_string = False
+                    if self.depth == 1 and self.value_start is None:
+                        try:
+                            self.key = json.loads(self.buffer[self.key_start:index + 1])
+                        except ValueError:
+                            self.key = None
+                continue
+
+            if char == '"':
+                self.in_string = True
+                if self.depth == 1 and self.value_start is None:
+                    self.key_start = index
+                continue
+
+            # Top-Level Value Begins After the Colon
+            if char == ":" and self.depth == 1 and self.value_start is None:
+                self.value_start = index + 1
+                continue
+
+            if char in "{[":
+                self.depth += 1
+                if self.key == "steps" and self.depth == 3 and char == "{":
+                    self.step_start = index
+                continue
+
+            if char in "}]":
+                self.depth -= 1
+                if self.key == "steps" and self.depth == 2 and self.step_start is not None:
+                    try:
+                        step = loads_lenient(self.buffer[self.step_start:index + 1])
+                        self.fields.setdefault("steps", []).append(step)
+                        events.append(("step", step))
+                    except ValueError:
+                        pass
+                    self.step_start = None
+
+            # Top-Level Value Ends at a Comma or the Closing Brace
+            if self.depth == 1 and char == "," or self.depth == 0:
+                if self.value_start is not None and self.key is not None and not (self.key == "steps" and "steps" in self.fields):
+                    try:
+                        value = loads_lenient(self.buffer[self.value_start:index])
+                        self.fields[self.key] = value
+                        if self.key != "steps":
+                            events.append((self.key, value))
+                    except ValueError:
+                        pass
+                self.key = None
+                self.value_start = None
+                if self.depth == 0:
+                    self.done = True
+
+        return events
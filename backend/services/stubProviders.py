@@ -0,0 +1,303 @@
+# Imports
+import os
+import re
+import json
+import time
+import random
+import asyncio
+import itertools
+from datetime import datetime, timezone
+from types import SimpleNamespace
+import httpx
+from groq import BadRequestError
+from groq.types.chat import ChatCompletion, ChatCompletionChunk
+
+# Stand-Ins are Used When UPSTREAM_MODE=stub
+STUB_MODE = os.getenv("UPSTREAM_MODE", "live") == "stub"
+
+# Recorded Recipes Served by the LLM Stand-In
+FIXTURES = os.getenv(
+    "STUB_FIXTURES",
+    os.path.join(os.path.dirname(__file__), "..", "benchmarks", "fixtures", "completions.json")
+)
+
+# Vocabulary for Varied Stub Recipes
+CUISINES = ["Korean", "Mexican", "Italian", "Thai", "Greek", "Indian", "Japanese", "Moroccan", "Cajun", "Vietnamese"]
+PROTEINS = ["chicken", "tofu", "beef", "salmon", "chickpea", "egg", "pork", "lentil", "shrimp", "turkey", "tempeh", "black bean"]
+VEGETABLES = ["broccoli", "spinach", "pepper", "zucchini", "carrot", "cabbage", "mushroom", "kale", "eggplant", "corn", "pea", "cauliflower"]
+DISHES = ["rice bowl", "stir fry", "curry", "wrap", "soup", "pasta", "traybake", "salad", "noodles", "skillet", "bake", "fried rice"]
+STAPLES = ["rice", "noodles", "quinoa", "couscous", "potato", "pasta", "tortilla", "bread", "barley", "bulgur"]
+SEASONINGS = ["garlic", "ginger", "soy sauce", "cumin", "paprika", "lime", "basil", "chili flakes", "sesame oil", "oregano", "coconut milk", "yogurt"]
+
+# Configurable Latency Distribution ("fixed:1.2", "uniform:0.5,2", "lognormal:0.3,0.4")
+class LatencyModel:
+
+    def __init__(self, spec: str):
+        kind, _, params = spec.partition(":")
+        self.kind = kind
+        self.params = [float(value) for value in params.split(",") if value]
+
+    def sample(self) -> float:
+        if self.kind == "fixed":
+            return self.params[0]
+        if self.kind == "uniform":
+            return random.uniform(*self.params)
+        if self.kind == "lognormal":
+            return random.lognormvariate(*self.params)
+        return 0.0
+
+    async def wait(self):
+        delay = self.sample()
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+# Deterministic Chat Completion Client with Groq's Interface
+class StubLLMClient:
+
+    # Constructor
+    def __init__(self, latency: str = None, tokens_per_second: float = None):
+        self.latency = LatencyModel(latency or os.getenv("STUB_LLM_LATENCY", "lognormal:0.3,0.4"))
+        self.tokens_per_second = tokens_per_second or float(os.getenv("STUB_LLM_TOKENS_PER_SECOND", "250"))
+        with open(FIXTURES) as f:
+            self.recipes = json.load(f)["recipes"]
+        self.counter = itertools.count()
+        self.chat = SimpleNamespace(completions=SimpleNamespace(create=self.create))
+
+    # Next Recipe (Deterministic per Call Number, Varied Title, Tags and Ingredients)
+    def _recipe(self) -> dict:
+        index = next(self.counter)
+        rng = random.Random(index)
+        recipe = dict(self.recipes[index % len(self.recipes)])
+        cuisine, protein, vegetable, dish = rng.choice(CUISINES), rng.choice(PROTEINS), rng.choice(VEGETABLES), rng.choice(DISHES)
+        recipe["title"] = f"{cuisine} {protein.title()} and {vegetable.title()} {dish.title()}"
+        recipe["servings"] = 2
+        recipe["tags"] = [dish, protein, vegetable]
+        recipe["ingredients"] = [
+            f"200g {protein}", f"1 cup {vegetable}", f"1 cup {rng.choice(STAPLES)}",
+            *(f"1 tbsp {seasoning}" for seasoning in rng.sample(SEASONINGS, 3))
+        ]
+        return recipe
+
+    # Output Text for a Prompt
+    def _content(self, prompt: str) -> str:
+        batch = re.match(r"Generate (\d+) different", prompt)
+        if batch:
+            return json.dumps({"recipes": [self._recipe() for _ in range(int(batch.group(1)))]})
+        if prompt.startswith("Partial recipe:"):
+            return json.dumps({key: value for key, value in self.recipes[0].items() if key != "title"})
+        return json.dumps(self._recipe())
+
+    # Chat Completion (Streaming or Not)
+    async def create(self, model: str, messages: list, max_tokens: int = None, stream: bool = False, **kwargs):
+
+        # Groq Refuses JSON Mode on Streaming Requests
+        if stream and kwargs.get("response_format"):
+            request = httpx.Request("POST", "https://api.groq.com/openai/v1/chat/completions")
+            body = {"error": {"message": "json mode cannot be combined with streaming", "type": "invalid_request_error"}}
+            raise BadRequestError("Error code: 400", response=httpx.Response(400, request=request, json=body), body=body)
+
+        content = self._content(messages[-1]["content"])
+        prompt_tokens = len(messages[-1]["content"]) // 4
+        completion_tokens = len(content) // 4
+        usage = {"prompt_tokens": prompt_tokens, "completion_tokens": completion_tokens, "total_tokens": prompt_tokens + completion_tokens}
+        await self.latency.wait()
+
+        if stream:
+            return self._stream(model, content, usage)
+
+        await asyncio.sleep(completion_tokens / self.tokens_per_second)
+        return ChatCompletion.model_validate({
+            "id": "stub", "object": "chat.completion", "created": int(time.time()), "model": model,
+            "choices": [{"index": 0, "finish_reason": "stop", "message": {"role": "assistant", "content": content}}],
+            "usage": usage,
+        })
+
+    # Stream Content in Token-Sized Chunks
+    async def _stream(self, model: str, content: str, usage: dict):
+        for start in range(0, len(content), 16):
+            await asyncio.sleep(4 / self.tokens_per_second)
+            yield ChatCompletionChunk.model_validate({
+                "id": "stub", "object": "chat.completion.chunk", "created": int(time.time()), "model": model,
+                "choices": [{"index": 0, "finish_reason": None, "delta": {"content": content[start:start + 16]}}],
+                "x_groq": None,
+            })
+        yield ChatCompletionChunk.model_validate({
+            "id": "stub", "object": "chat.completion.chunk", "created": int(time.time()), "model": model,
+            "choices": [], "x_groq": {"id": "stub", "usage": usage, "error": None},
+        })
+
+    async def close(self):
+        pass
+
+# HTTP Client Serving Unsplash-Shaped Responses
+def stub_unsplash_client(latency: str = None) -> httpx.AsyncClient:
+
+    latency_model = LatencyModel(latency or os.getenv("STUB_IMAGE_LATENCY", "lognormal:-2.5,0.5"))
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        await latency_model.wait()
+        if request.url.path.endswith("/photos/random"):
+            count = int(request.url.params.get("count", "1"))
+            return httpx.Response(200, json=[
+                {"urls": {"regular": f"https://images.example.com/random-{index}.jpg"}} for index in range(count)
+            ])
+        query = request.url.params.get("query", "").replace(" ", "-")
+        return httpx.Response(200, json={"results": [
+            {"urls": {"regular": f"https://images.example.com/{query}-{index}.jpg"}} for index in range(15)
+        ]})
+
+    return httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+# Response Returned by the In-Memory Supabase Stand-In
+class StubResponse:
+
+    def __init__(self, data):
+        self.data = data
+
+# Chainable Query over One In-Memory Table
+class StubQuery:
+
+    def __init__(self, store: "InMemorySupabase", table: str):
+        self.store = store
+        self.table_name = table
+        self.action = "select"
+        self.columns = "*"
+        self.payload = None
+        self.filters = []
+        self.orders = []
+        self.row_limit = None
+        self.on_conflict = ""
+        self.ignore_duplicates = False
+
+    # Read Column or JSON Path ("recipe_data->>title")
+    @staticmethod
+    def _value(row: dict, column: str):
+        if "->" in column:
+            base, _, path = column.partition("->")
+            return (row.get(base) or {}).get(path.lstrip(">"))
+        return row.get(column)
+
+    def select(self, columns: str = "*", **kwargs):
+        self.columns = columns
+        return self
+
+    def insert(self, payload, **kwargs):
+        self.action, self.payload = "insert", payload
+        return self
+
+    def upsert(self, payload, on_conflict: str = "", ignore_duplicates: bool = False, **kwargs):
+        self.action, self.payload = "upsert", payload
+        self.on_conflict, self.ignore_duplicates = on_conflict, ignore_duplicates
+        return self
+
+    def update(self, payload):
+        self.action, self.payload = "update", payload
+        return self
+
+    def delete(self):
+        self.action = "delete"
+        return self
+
+    def eq(self, column: str, value):
+        self.filters.append(lambda row: str(self._value(row, column)) == str(value))
+        return self
+
+    def in_(self, column: str, values):
+        values = {str(value) for value in values}
+        self.filters.append(lambda row: str(self._value(row, column)) in values)
+        return self
+
+    def lt(self, column: str, value):
+        self.filters.append(lambda row: str(self._value(row, column)) < str(value))
+        return self
+
+    def gt(self, column: str, value):
+        self.filters.append(lambda row: str(self._value(row, column)) > str(value))
+        return self
+
+    def gte(self, column: str, value):
+        self.filters.append(lambda row: str(self._value(row, column)) >= str(value))
+        return self
+
+    # Keyset Cursor Filter Used by Paginated Endpoints
+    def or_(self, expression: str):
+        match = re.fullmatch(r'created_at\.lt\."([^"]+)",and\(created_at\.eq\."([^"]+)",id\.lt\."([^"]+)"\)', expression)
+        if not match:
+            raise NotImplementedError(f"Unsupported filter: {expression}")
+        created_at, _, row_id = match.groups()
+        self.filters.append(lambda row: (row["created_at"], str(row["id"])) < (created_at, row_id))
+        return self
+
+    def order(self, column: str, desc: bool = False):
+        self.orders.append((column, desc))
+        return self
+
+    def limit(self, count: int):
+        self.row_limit = count
+        return self
+
+    # Apply Column Projection ("alias:recipe_data->>field")
+    def _project(self, row: dict) -> dict:
+        if self.columns.strip() == "*":
+            return dict(row)
+        projected = {}
+        for column in (column.strip() for column in self.columns.split(",")):
+            alias, _, source = column.rpartition(":")
+            projected[alias or source.split("->")[-1].lstrip(">")] = self._value(row, source)
+        return projected
+
+    async def execute(self) -> StubResponse:
+
+        await self.store.latency.wait()
+        rows = self.store.tables.setdefault(self.table_name, [])
+
+        if self.action in ("insert", "upsert"):
+            written = []
+            keys = [key for key in self.on_conflict.split(",") if key]
+            for item in self.payload if isinstance(self.payload, list) else [self.payload]:
+                existing = next((row for row in rows if keys and all(row.get(key) == item.get(key) for key in keys)), None)
+                if self.action == "upsert" and existing is not None:
+                    if not self.ignore_duplicates:
+                        existing.update(item)
+                        written.append(dict(existing))
+                    continue
+                row = {"id": self.store.next_id(), "created_at": self.store.now(), **item}
+                rows.append(row)
+                written.append(dict(row))
+            return StubResponse(written)
+
+        matched = [row for row in rows if all(check(row) for check in self.filters)]
+
+        if self.action == "update":
+            for row in matched:
+                row.update(self.payload)
+            return StubResponse([dict(row) for row in matched])
+
+        if self.action == "delete":
+            self.store.tables[self.table_name] = [row for row in rows if row not in matched]
+            return StubResponse([dict(row) for row in matched])
+
+        for column, desc in reversed(self.orders):
+            matched.sort(key=lambda row: str(row.get(column)), reverse=desc)
+        if self.row_limit is not None:
+            matched = matched[:self.row_limit]
+        return StubResponse([self._project(row) for row in matched])
+
+# In-Memory Supabase Client Stand-In
+class InMemorySupabase:
+
+    def __init__(self, latency: str = None):
+        self.latency = LatencyModel(latency or os.getenv("STUB_DB_LATENCY", "uniform:0.002,0.01"))
+        self.tables = {}
+        self.ids = itertools.count(1)
+
+    # UUID-Shaped Ids Like Supabase's, Sorting in Insert Order
+    def next_id(self) -> str:
+        return f"00000000-0000-4000-8000-{next(self.ids):012d}"
+
+    # Microsecond Timestamps Keep Insert Order Sortable
+    def now(self) -> str:
+        return datetime.now(timezone.utc).isoformat(timespec="microseconds")
+
+    def table(self, name: str) -> StubQuery:
+        return StubQuery(self, name)
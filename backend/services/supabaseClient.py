@@ -1,32 +1,93 @@
 # Imports
 import os
-from supabase import create_client, Client
-from dotenv import load_dotenv
+import asyncio
+from typing import TYPE_CHECKING
+from services.stubProviders import STUB_MODE, InMemorySupabase
+from services.telemetry import span
 
-# Load Environment Variables
-load_dotenv()
+if TYPE_CHECKING:
+    from supabase import AsyncClient
 
-# Supabase Client Singleton
+# Query Builder Proxy Timing execute() per Table and Action
+class InstrumentedQuery:
+
+    def __init__(self, builder, table: str, action: str = "select"):
+        self.builder = builder
+        self.table = table
+        self.action = action
+
+    # Wrap Chained Builder Methods so the Final execute() is Timed
+    def __getattr__(self, name: str):
+        attribute = getattr(self.builder, name)
+        if not callable(attribute):
+            return attribute
+        action = name if name in ("select", "insert", "upsert", "update", "delete") else self.action
+
+        def chained(*args, **kwargs):
+            return InstrumentedQuery(attribute(*args, **kwargs), self.table, action)
+        return chained
+
+    async def execute(self):
+        with span("supabase", f"{self.table}.{self.action}"):
+            return await self.builder.execute()
+
+# Client Proxy Returning Instrumented Queries
+class InstrumentedClient:
+
+    def __init__(self, client):
+        self.client = client
+
+    def table(self, name: str) -> InstrumentedQuery:
+        return InstrumentedQuery(self.client.table(name), name)
+
+    def __getattr__(self, name: str):
+        return getattr(self.client, name)
+
+# Supabase Async Client Singleton
 class SupabaseClient:
 
-    _instance: Client = None
+    _instance: "AsyncClient" = None
+    _lock: asyncio.Lock = None
     
     @classmethod
-    def get_client(cls) -> Client:
+    async def get_client(cls) -> "AsyncClient":
 
         if cls._instance is None:
 
-            supabase_url = os.getenv("SUPABASE_URL")
-            supabase_key = os.getenv("SUPABASE_SERVICE_KEY")
-            
-            if not supabase_url or not supabase_key:
-                raise ValueError("Missing Supabase credentials in environment variables")
-            
-            cls._instance = create_client(supabase_url, supabase_key)
+            if cls._lock is None:
+                cls._lock = asyncio.Lock()
+
+            # Create Client Once Under Lock
+            async with cls._lock:
+                if cls._instance is None:
+
+                    # In-Memory Stand-In for Load Testing
+                    if STUB_MODE:
+                        cls._instance = InstrumentedClient(InMemorySupabase())
+                        return cls._instance
+
+                    # Imported on First Use (serve.py Preloads it Before Forking Workers)
+                    from supabase import acreate_client
+
+                    supabase_url = os.getenv("SUPABASE_URL")
+                    supabase_key = os.getenv("SUPABASE_SERVICE_KEY")
+                    
+                    if not supabase_url or not supabase_key:
+                        raise ValueError("Missing Supabase credentials in environment variables")
+                    
+                    cls._instance = InstrumentedClient(await acreate_client(supabase_url, supabase_key))
         
         return cls._instance
 
+    # Close the Worker's HTTP Session
+    @classmethod
+    async def close(cls):
+        if cls._instance is not None and not STUB_MODE:
+            await cls._instance.postgrest.aclose()
+        cls._instance = None
+        cls._lock = None
+
 # Export Function to Get Supabase Client
-def get_supabase() -> Client:
+async def get_supabase() -> "AsyncClient":
     
-    return SupabaseClient.get_client()
+    return await SupabaseClient.get_client()
@@ -0,0 +1,153 @@
+# Imports
+import os
+import time
+import bisect
+from contextlib import contextmanager, nullcontext
+from typing import Callable, Dict, Tuple
+
+# Tracer Set by setup_tracing() (None Leaves Spans as Timing Only)
+tracer = None
+
+# Optional OpenTelemetry Export (Enabled When the SDK is Installed and an Endpoint is Set)
+# Called per Worker Process, so the SDK is Only Imported When Used and its Exporter Thread
+# is Started After Forking
+def setup_tracing():
+    global tracer
+    if tracer is not None or not os.getenv("OTEL_EXPORTER_OTLP_ENDPOINT"):
+        return
+    try:
+        from opentelemetry import trace
+        from opentelemetry.sdk.trace import TracerProvider
+        from opentelemetry.sdk.trace.export import BatchSpanProcessor
+        from opentelemetry.exporter.otlp.proto.http.trace_exporter import OTLPSpanExporter
+    except ImportError:
+        return
+
+    provider = TracerProvider()
+    provider.add_span_processor(BatchSpanProcessor(OTLPSpanExporter()))
+    trace.set_tracer_provider(provider)
+    tracer = trace.get_tracer("flavourfinder")
+
+# Latency Buckets (Seconds) from Cache Hits to Slow LLM Calls
+LATENCY_BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30)
+
+# Registry of Metrics and Collectors Rendered by /metrics
+registry = []
+collectors: Dict[str, Tuple[Callable[[], dict], str]] = {}
+
+# Format Label Set for Exposition
+def _labels(names: Tuple[str, ...], values: Tuple, extra: str = "") -> str:
+    pairs = [f'{name}="{str(value)}"' for name, value in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+# Monotonic Counter with Labels
+class Counter:
+
+    # Constructor
+    def __init__(self, name: str, description: str, labels: Tuple[str, ...] = ()):
+        self.name = name
+        self.description = description
+        self.label_names = labels
+        self.values = {}
+        registry.append(self)
+
+    def inc(self, amount: float = 1, **labels):
+        key = tuple(labels.get(name, "") for name in self.label_names)
+        self.values[key] = self.values.get(key, 0) + amount
+
+    def render(self) -> list:
+        lines = [f"# HELP {self.name} {self.description}", f"# TYPE {self.name} counter"]
+        for key, value in sorted(self.values.items()):
+            lines.append(f"{self.name}{_labels(self.label_names, key)} {value}")
+        return lines
+
+# Fixed-Bucket Histogram with Labels
+class Histogram:
+
+    # Constructor
+    def __init__(self, name: str, description: str, labels: Tuple[str, ...] = (), buckets: Tuple[float, ...] = LATENCY_BUCKETS):
+        self.name = name
+        self.description = description
+        self.label_names = labels
+        self.buckets = buckets
+        self.series = {}
+        registry.append(self)
+
+    # Record a Value (Bucket Counts are Made Cumulative at Render Time)
+    def observe(self, value: float, **labels):
+        key = tuple(labels.get(name, "") for name in self.label_names)
+        series = self.series.get(key)
+        if series is None:
+            series = self.series[key] = [[0] * (len(self.buckets) + 1), 0.0, 0]
+        series[0][bisect.bisect_left(self.buckets, value)] += 1
+        series[1] += value
+        series[2] += 1
+
+    def render(self) -> list:
+        lines = [f"# HELP {self.name} {self.description}", f"# TYPE {self.name} histogram"]
+        for key, (counts, total, count) in sorted(self.series.items()):
+            cumulative = 0
+            for bound, bucket_count in zip(self.buckets + (float("inf"),), counts):
+                cumulative += bucket_count
+                le = 'le="+Inf"' if bound == float("inf") else f'le="{float(bound)}"'
+                lines.append(f"{self.name}_bucket{_labels(self.label_names, key, le)} {cumulative}")
+            lines.append(f"{self.name}_sum{_labels(self.label_names, key)} {total}")
+            lines.append(f"{self.name}_count{_labels(self.label_names, key)} {count}")
+        return lines
+
+# Request, Upstream and Token Metrics
+REQUEST_SECONDS = Histogram("flavourfinder_request_duration_seconds", "HTTP request latency by route.", ("method", "route", "status"))
+UPSTREAM_SECONDS = Histogram("flavourfinder_upstream_duration_seconds", "Upstream call latency.", ("upstream", "operation"))
+UPSTREAM_ERRORS = Counter("flavourfinder_upstream_errors_total", "Failed upstream calls.", ("upstream", "operation", "error"))
+LLM_TOKENS = Counter("flavourfinder_llm_tokens_total", "LLM tokens used.", ("model", "kind"))
+
+# Time an Upstream Call (and Trace it When OpenTelemetry is Enabled)
+@contextmanager
+def span(upstream: str, operation: str, **attributes):
+
+    start = time.perf_counter()
+    context = tracer.start_as_current_span(f"{upstream}.{operation}", attributes=attributes) if tracer else nullcontext()
+    with context:
+        try:
+            yield
+        except BaseException as e:
+            UPSTREAM_ERRORS.inc(upstream=upstream, operation=operation, error=type(e).__name__)
+            raise
+        finally:
+            UPSTREAM_SECONDS.observe(time.perf_counter() - start, upstream=upstream, operation=operation)
+
+# Record LLM Token Usage
+def record_tokens(model: str, prompt_tokens: int, completion_tokens: int):
+    LLM_TOKENS.inc(prompt_tokens, model=model, kind="prompt")
+    LLM_TOKENS.inc(completion_tokens, model=model, kind="completion")
+
+# Register a Callable Whose Numeric Values are Exported as Gauges
+# (With a Label, Top-Level Keys Such as Model Names Become Label Values)
+def register_collector(name: str, collect: Callable[[], dict], label: str = None):
+    collectors[name] = (collect, label)
+
+# Flatten Nested Numeric Values into Gauge Lines
+def _gauges(prefix: str, values: dict, lines: list, labels: str = ""):
+    for key, value in values.items():
+        name = f"{prefix}_{key}"
+        if isinstance(value, dict):
+            _gauges(name, value, lines, labels)
+        elif isinstance(value, (int, float)) and not isinstance(value, bool):
+            lines.append(f"{name}{labels} {value}")
+
+# Prometheus Text Exposition
+def render() -> str:
+
+    lines = []
+    for metric in registry:
+        lines.extend(metric.render())
+    for name, (collect, label) in collectors.items():
+        values = collect()
+        if label is None:
+            _gauges(f"flavourfinder_{name}", values, lines)
+            continue
+        for key, group in values.items():
+            _gauges(f"flavourfinder_{name}", group, lines, _labels((label,), (key,)))
+    return "\n".join(lines) + "\n"
@@ -0,0 +1,224 @@
+# Imports
+import os
+import time
+import random
+import asyncio
+import httpx
+from email.utils import parsedate_to_datetime
+from typing import Awaitable, Callable, Optional, Tuple, Type
+from services.stubProviders import STUB_MODE
+
+# Registry of Governors for Metrics
+governors = {}
+
+# Worker Processes Splitting Each Provider Quota (serve.py Sets it; Uvicorn's --workers Reads WEB_CONCURRENCY)
+def worker_share() -> int:
+    return max(int(os.getenv("UPSTREAM_WORKERS", os.getenv("WEB_CONCURRENCY", "1"))), 1)
+
+# Raised Instead of Calling an Upstream that is Failing or Over Quota
+class UpstreamUnavailable(Exception):
+    pass
+
+# Token Bucket (rate <= 0 Means Unlimited)
+class TokenBucket:
+
+    # Constructor
+    def __init__(self, rate: float, burst: float):
+        self.rate = rate
+        self.burst = max(burst, 1)
+        self.tokens = self.burst
+        self.updated = time.monotonic()
+        self.paused_until = 0.0
+
+    # Seconds Until a Token is Available (0 Takes One Now)
+    def _reserve(self) -> float:
+
+        if self.rate <= 0:
+            return max(0.0, self.paused_until - time.monotonic())
+
+        now = time.monotonic()
+        self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+        if now < self.paused_until:
+            return self.paused_until - now
+        if self.tokens >= 1:
+            self.tokens -= 1
+            return 0.0
+        return (1 - self.tokens) / self.rate
+
+    # Wait Up to max_wait Seconds for a Token
+    async def acquire(self, max_wait: float) -> bool:
+        deadline = time.monotonic() + max_wait
+        while True:
+            delay = self._reserve()
+            if delay == 0:
+                return True
+            if time.monotonic() + delay > deadline:
+                return False
+            await asyncio.sleep(delay)
+
+    # Stop Issuing Tokens After the Provider Reports a Rate Limit
+    def pause(self, seconds: float):
+        self.paused_until = max(self.paused_until, time.monotonic() + seconds)
+        self.tokens = 0
+
+# Circuit Breaker (Closed -> Open After Consecutive Failures -> Half-Open Probe)
+class CircuitBreaker:
+
+    # Constructor
+    def __init__(self, failure_threshold: int, reset_timeout: float):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.failures = 0
+        self.opened_at = None
+        self.probing = False
+
+    @property
+    def state(self) -> str:
+        if self.opened_at is None:
+            return "closed"
+        if time.monotonic() - self.opened_at < self.reset_timeout:
+            return "open"
+        return "half_open"
+
+    # Whether a Call May Go Out (Only One Probe While Half-Open)
+    def allow(self) -> bool:
+        state = self.state
+        if state == "closed":
+            return True
+        if state == "half_open" and not self.probing:
+            self.probing = True
+            return True
+        return False
+
+    def record_success(self):
+        self.failures = 0
+        self.opened_at = None
+        self.probing = False
+
+    def record_failure(self):
+        self.failures += 1
+        self.probing = False
+        if self.opened_at is not None or self.failures >= self.failure_threshold:
+            self.opened_at = time.monotonic()
+
+# Retry-After Header in Seconds (Delta or HTTP Date)
+def retry_after(response: Optional[httpx.Response]) -> Optional[float]:
+
+    value = response.headers.get("retry-after") if response is not None else None
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+# Rate Limiting, Circuit Breaking and Retries for One Upstream
+class UpstreamGovernor:
+
+    # Constructor (Settings Overridable by UPSTREAM_<ENV_NAME>_* Environment Variables)
+    # (Rate and Burst are Totals for the Host, Divided Evenly Between Worker Processes)
+    def __init__(self, name: str, rate: float, burst: float, retries: int = 1, max_wait: float = 0,
+                 transient_errors: Tuple[Type[BaseException], ...] = (httpx.TransportError,), env_name: str = None):
+        prefix = f"UPSTREAM_{(env_name or name).upper()}_"
+        self.name = name
+
+        # Stand-Ins Have No Quota
+        default_rate = 0 if STUB_MODE else rate
+        self.bucket = TokenBucket(
+            float(os.getenv(prefix + "RATE", default_rate)) / worker_share(),
+            float(os.getenv(prefix + "BURST", burst)) / worker_share()
+        )
+        self.breaker = CircuitBreaker(
+            int(os.getenv(prefix + "FAILURES", "5")),
+            float(os.getenv(prefix + "RESET_TIMEOUT", "30"))
+        )
+        self.retries = int(os.getenv(prefix + "RETRIES", retries))
+        self.max_wait = float(os.getenv(prefix + "MAX_WAIT", max_wait))
+        self.max_retry_after = float(os.getenv(prefix + "MAX_RETRY_AFTER", "2"))
+        self.base_delay = float(os.getenv(prefix + "BACKOFF", "0.25"))
+        self.transient_errors = transient_errors
+        self.stats = {"calls": 0, "successes": 0, "failures": 0, "retries": 0, "rejected_open": 0, "rejected_rate": 0}
+        governors[name] = self
+
+    # (Counts Against Breaker, Worth Retrying, Retry-After) for an Exception
+    def _classify(self, error: BaseException) -> Tuple[bool, bool, Optional[float]]:
+
+        response = getattr(error, "response", None)
+        if isinstance(response, httpx.Response):
+            status = response.status_code
+            if status == 429 or status >= 500:
+                return True, True, retry_after(response)
+            if status in (401, 403):
+                return True, False, None
+            return False, False, None
+
+        if isinstance(error, self.transient_errors):
+            return True, True, None
+        return False, False, None
+
+    # Call func Under the Governor's Limits
+    async def call(self, func: Callable[[], Awaitable]):
+
+        self.stats["calls"] += 1
+        for attempt in range(self.retries + 1):
+
+            # Fail Fast While the Upstream is Known to be Down
+            if not self.breaker.allow():
+                self.stats["rejected_open"] += 1
+                raise UpstreamUnavailable(f"{self.name} circuit open")
+
+            # Respect the Provider Quota
+            if not await self.bucket.acquire(self.max_wait):
+                self.stats["rejected_rate"] += 1
+                self.breaker.probing = False
+                raise UpstreamUnavailable(f"{self.name} rate limit reached")
+
+            try:
+                result = await func()
+            except Exception as e:
+                counts, retryable, wait = self._classify(e)
+                if not counts:
+                    self.breaker.record_success()
+                    raise
+                self.stats["failures"] += 1
+                self.breaker.record_failure()
+
+                # Provider Rate Limit Pauses the Bucket for Everyone
+                response = getattr(e, "response", None)
+                if isinstance(response, httpx.Response) and response.status_code == 429:
+                    self.bucket.pause(wait if wait is not None else self.base_delay * 4)
+
+                # Jittered Exponential Backoff Unless the Provider Says When
+                delay = wait if wait is not None else random.uniform(0, self.base_delay * 2 ** attempt)
+                if not retryable or attempt == self.retries or delay > self.max_retry_after:
+                    raise
+                self.stats["retries"] += 1
+                await asyncio.sleep(delay)
+                continue
+            except asyncio.CancelledError:
+                self.breaker.probing = False
+                raise
+
+            self.breaker.record_success()
+            self.stats["successes"] += 1
+            return result
+
+    # Current Metrics
+    def metrics(self) -> dict:
+        return {
+            **self.stats,
+            "state": self.breaker.state,
+            "open": int(self.breaker.state == "open"),
+            "rate": self.bucket.rate,
+            "burst": self.bucket.burst,
+        }
+
+# Metrics for All Governors
+def metrics() -> dict:
+    return {name: governor.metrics() for name, governor in governors.items()}
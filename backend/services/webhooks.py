@@ -0,0 +1,105 @@
+# Imports
+import os
+import hmac
+import time
+import socket
+import asyncio
+import hashlib
+import ipaddress
+import httpx
+from urllib.parse import urlsplit, SplitResult
+
+# Server Secret Signing Every Delivery (Callbacks are Refused Without One)
+WEBHOOK_SECRET = os.getenv("WEBHOOK_SECRET")
+
+# Optional Host Allowlist ("hooks.example.com", or ".example.com" for Any Subdomain)
+WEBHOOK_ALLOWED_HOSTS = {host.strip().lower() for host in os.getenv("WEBHOOK_ALLOWED_HOSTS", "").split(",") if host.strip()}
+
+# Signature Headers (Receivers Recompute HMAC-SHA256 over "<timestamp>.<body>")
+TIMESTAMP_HEADER = "X-FlavourFinder-Timestamp"
+SIGNATURE_HEADER = "X-FlavourFinder-Signature"
+
+# Raised for a Callback URL the Server Must Not Call
+class UnsafeCallback(ValueError):
+    pass
+
+# Whether an Address is Reachable on the Public Internet (Loopback, Link-Local, Private and Reserved are Not)
+def _public(address: str) -> bool:
+    ip = ipaddress.ip_address(address.split("%", 1)[0])
+    if ip.version == 6 and ip.ipv4_mapped:
+        ip = ip.ipv4_mapped
+    return ip.is_global
+
+# Whether a Host Matches the Allowlist (Everything Matches When None is Configured)
+def _allowed(host: str) -> bool:
+    if not WEBHOOK_ALLOWED_HOSTS:
+        return True
+    return any(host == entry or (entry.startswith(".") and host.endswith(entry)) for entry in WEBHOOK_ALLOWED_HOSTS)
+
+# Validate a Callback URL Without Network Access (Called When the Job is Submitted)
+def check_url(url: str) -> SplitResult:
+
+    if not WEBHOOK_SECRET:
+        raise UnsafeCallback("Job callbacks are disabled on this server")
+
+    parts = urlsplit(url)
+    if parts.scheme not in ("http", "https") or not parts.hostname or parts.username or parts.password:
+        raise UnsafeCallback("Callback URL must be an http(s) URL without credentials")
+    try:
+        parts.port
+    except ValueError:
+        raise UnsafeCallback("Callback URL has an invalid port")
+
+    host = parts.hostname.lower().rstrip(".")
+    if not _allowed(host):
+        raise UnsafeCallback("Callback host is not allowed")
+    try:
+        literal = not _public(host)
+    except ValueError:
+        literal = host == "localhost" or host.endswith(".localhost")
+    if literal:
+        raise UnsafeCallback("Callback host must be a public address")
+    return parts
+
+# Resolve a Callback Host, Refusing it Unless Every Address is Public
+async def resolve(parts: SplitResult) -> str:
+
+    port = parts.port or (443 if parts.scheme == "https" else 80)
+    try:
+        infos = await asyncio.get_running_loop().getaddrinfo(parts.hostname, port, type=socket.SOCK_STREAM)
+    except socket.gaierror as e:
+        raise UnsafeCallback(f"Callback host did not resolve: {e}")
+
+    addresses = [info[4][0] for info in infos]
+    if not addresses or not all(_public(address) for address in addresses):
+        raise UnsafeCallback("Callback host resolves to a non-public address")
+    return addresses[0]
+
+# Signature Header Value for a Body Sent at a Timestamp
+def sign(body: bytes, timestamp: int) -> str:
+    digest = hmac.new(WEBHOOK_SECRET.encode(), f"{timestamp}.".encode() + body, hashlib.sha256).hexdigest()
+    return f"sha256={digest}"
+
+# POST a Signed JSON Body to a Callback URL
+# (Connects to the Address that Passed the Check, so a Second DNS Answer Cannot Redirect the Request)
+async def post(client: httpx.AsyncClient, url: str, body: bytes) -> httpx.Response:
+
+    parts = check_url(url)
+    address = await resolve(parts)
+    pinned = f"[{address}]" if ":" in address else address
+    if parts.port:
+        pinned += f":{parts.port}"
+
+    timestamp = int(time.time())
+    return await client.post(
+        parts._replace(netloc=pinned).geturl(),
+        content=body,
+        headers={
+            "Host": parts.netloc,
+            "Content-Type": "application/json",
+            TIMESTAMP_HEADER: str(timestamp),
+            SIGNATURE_HEADER: sign(body, timestamp),
+        },
+        extensions={"sni_hostname": parts.hostname} if parts.scheme == "https" else {},
+        follow_redirects=False
+    )